@@ -1,11 +1,18 @@
 from collections import deque, defaultdict
 from typing import List, Dict, Tuple, Any
 
+from utils.cache import BoundedCache
+
+# Perkiraan byte per node (objek Node + dict children + list output), buat batas ukuran cache
+_NODE_BYTES = 400
+
     ## @brief Representasi sebuah node dalam automaton Aho-Corasick.
 class AhoCorasick:
-    def __init__(self):
+    # @param cache_limit: Jumlah maksimum automaton yang disimpan.
+    # @param cache_bytes: Perkiraan ukuran maksimum cache automaton dalam byte.
+    def __init__(self, cache_limit: int = 64, cache_bytes: int = 32 * 1024 * 1024):
         self.name = "Aho-Corasick"
-        self._automaton_cache: Dict[frozenset, Any] = {}
+        self._automaton_cache = BoundedCache(cache_limit, cache_bytes, name="ac_automaton")
         
     class Node:
         __slots__ = ['children', 'failure', 'output']
@@ -23,26 +30,26 @@ class AhoCorasick:
         
         # cache key
         patterns_key = frozenset(p.lower() for p in patterns)
-        if patterns_key in self._automaton_cache:
-            return self._automaton_cache[patterns_key]
-
-        # konversi pola ke tuple untuk menghindari masalah mutable types
-        lower_to_original = {}
-        for pattern in set(patterns):
-            lower = pattern.lower()
-            if lower not in lower_to_original:
-                lower_to_original[lower] = pattern  
-        
+        cached = self._automaton_cache.get(patterns_key)
+        if cached is not None:
+            return cached
+
+        # Output automaton pakai pola lowercase, jadi automaton di cache bisa dipakai
+        # ulang untuk query yang case-nya beda (key hasil dipetakan balik pas search)
         root = self.Node()
+        node_count = 1
         
         # Membangun trie
-        for i, (lower, original) in enumerate(lower_to_original.items()):
+        for i, lower in enumerate(sorted(patterns_key)):
+            if not lower:
+                continue
             node = root
             for char in lower:
                 if char not in node.children:
                     node.children[char] = self.Node()
+                    node_count += 1
                 node = node.children[char]
-            node.output.append((i, original))
+            node.output.append((i, lower))
 
         # Membangun failure links menggunakan BFS
         queue = deque()
@@ -69,9 +76,60 @@ class AhoCorasick:
                 child.output = list(dict.fromkeys(child.output + child.failure.output))
         
         # Simpan ke cache
-        self._automaton_cache[patterns_key] = root
+        self._automaton_cache.put(patterns_key, root, size=node_count * _NODE_BYTES)
         return root
     
+    # @brief Mengubah automaton jadi tabel datar biar bisa diserialisasi tanpa rekursi dalam.
+    # @param root: Root node automaton.
+    # @return: List entri (children {char: index}, index failure, output) dengan root di index 0.
+    def export_automaton(self, root: Node) -> List[Tuple[Dict[str, int], int, list]]:
+        index = {id(root): 0}
+        nodes = [root]
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            for child in node.children.values():
+                index[id(child)] = len(nodes)
+                nodes.append(child)
+                queue.append(child)
+
+        return [
+            (
+                {char: index[id(child)] for char, child in node.children.items()},
+                index[id(node.failure)] if node.failure is not None else -1,
+                list(node.output)
+            )
+            for node in nodes
+        ]
+
+    # @brief Membangun ulang automaton dari tabel hasil export_automaton.
+    # @param table: Tabel datar automaton.
+    # @return: Root node automaton.
+    def import_automaton(self, table: List[Tuple[Dict[str, int], int, list]]) -> Node:
+        nodes = [self.Node() for _ in table]
+        for node, (children, failure, output) in zip(nodes, table):
+            node.children = {char: nodes[i] for char, i in children.items()}
+            node.failure = nodes[failure] if failure >= 0 else None
+            node.output = list(output)
+        return nodes[0]
+
+    # @brief Mengekspor semua automaton di cache dalam bentuk tabel datar.
+    # @return: Dictionary <frozenset pola, tabel automaton>.
+    def export_cache(self) -> Dict[frozenset, list]:
+        return {key: self.export_automaton(root) for key, root in self._automaton_cache.items()}
+
+    # @brief Mengisi cache automaton dari hasil export_cache.
+    # @param tables: Dictionary <frozenset pola, tabel automaton>.
+    # @return: None
+    def import_cache(self, tables: Dict[frozenset, list]) -> None:
+        for key, table in tables.items():
+            self._automaton_cache.put(key, self.import_automaton(table), size=len(table) * _NODE_BYTES)
+
+    # @brief Membersihkan cache automaton.
+    # @return: None
+    def clear_cache(self):
+        self._automaton_cache.clear()
+
     # @brief Mencari satu pola dalam teks (untuk kompatibilitas dengan algoritma lain).
     # @param text: Teks yang akan dicari.
     # @param pattern: Pola tunggal yang akan dicocokkan.
@@ -87,6 +145,16 @@ class AhoCorasick:
     # @param patterns: List pola yang akan dicocokkan.
     # @return: Dictionary yang isinya <pola, <'positions', 'count'>>. Kalau kosong ya kosong.
     def search_multiple(self, text: str, patterns: List[str], root=None) -> Dict[str, Dict[str, Any]]:
+        if not text or not patterns:
+            return {}
+        return self.search_multiple_normalized(text.lower(), patterns, root)
+
+    # @brief Versi search_multiple untuk teks yang sudah lowercase (misal dari CorpusStore).
+    # @param text: Teks yang sudah lowercase, gak disalin sama sekali.
+    # @param patterns: List pola yang akan dicocokkan.
+    # @param root: Automaton yang sudah dibangun (opsional).
+    # @return: Dictionary yang isinya <pola, <'positions', 'count'>>. Kalau kosong ya kosong.
+    def search_multiple_normalized(self, text: str, patterns: List[str], root=None) -> Dict[str, Dict[str, Any]]:
         if not text or not patterns:
             return {}        
         
@@ -95,12 +163,24 @@ class AhoCorasick:
         if root is None:
             return {}
         
+        positions = self._scan_positions(text, root)
+        results = {}
+        for pattern in patterns:
+            found = positions.get(pattern.lower())
+            if found:
+                results[pattern] = {'positions': list(found), 'count': len(found)}
+        return results
+
+    # @brief Scan automaton dan kumpulkan posisi tiap pola (lowercase).
+    # @param text: Teks yang sudah lowercase.
+    # @param root: Root automaton.
+    # @return: Dictionary <pola lowercase, list posisi>.
+    def _scan_positions(self, text: str, root: Node) -> Dict[str, List[int]]:
         # Search in text
-        results = defaultdict(lambda: {'positions': [], 'count': 0})
-        text_lower = text.lower()
+        results = defaultdict(list)
         current = root
         
-        for i, char in enumerate(text_lower):
+        for i, char in enumerate(text):
             # Follow failure links until we find a match or reach root
             while current and char not in current.children:
                 current = current.failure
@@ -112,19 +192,89 @@ class AhoCorasick:
             
             # Check all patterns that end at current position
             for _, pattern in current.output:
-                start_pos = i - len(pattern) + 1
-                results[pattern]['positions'].append(start_pos)
-                results[pattern]['count'] += 1
+                results[pattern].append(i - len(pattern) + 1)
         
-        # Convert defaultdict to regular dict and filter empty results
-        return {k: v for k, v in results.items() if v['positions']}
+        return results
     
     # @brief Menghitung jumlah kemunculan sebuah pola dalam teks.
     # @param text: Teks yang akan dicari.
     # @param pattern: Pola yang akan dihitung.
     # @return: Jumlah kemunculan pola (integer).
     def count_occurrences(self, text: str, pattern: str) -> int:
-        return len(self.search(text, pattern))
+        return self.count_multiple(text, [pattern]).get(pattern, 0)
+
+    # @brief Versi count-only dari search_multiple, gak bikin list posisi.
+    # @param text: Teks yang akan dicari.
+    # @param patterns: List pola yang akan dihitung.
+    # @param root: Automaton yang sudah dibangun (opsional).
+    # @return: Dictionary <pola, jumlah>. Pola yang gak ketemu gak dimasukkan.
+    def count_multiple(self, text: str, patterns: List[str], root=None) -> Dict[str, int]:
+        if not text or not patterns:
+            return {}
+        return self.count_multiple_normalized(text.lower(), patterns, root)
+
+    # @brief Versi count-only untuk teks yang sudah lowercase.
+    # @param text: Teks yang sudah lowercase.
+    # @param patterns: List pola yang akan dihitung.
+    # @param root: Automaton yang sudah dibangun (opsional).
+    # @return: Dictionary <pola, jumlah>. Pola yang gak ketemu gak dimasukkan.
+    def count_multiple_normalized(self, text: str, patterns: List[str], root=None) -> Dict[str, int]:
+        if not text or not patterns:
+            return {}
+
+        if root is None:
+            root = self.build_automaton(patterns)
+        if root is None:
+            return {}
+
+        counts = self._scan_counts(text, root)
+        return {pattern: counts[pattern.lower()] for pattern in patterns if pattern.lower() in counts}
+
+    # @brief Scan automaton dan hitung kemunculan tiap pola (lowercase).
+    # @param text: Teks yang sudah lowercase.
+    # @param root: Root automaton.
+    # @return: Dictionary <pola lowercase, jumlah>.
+    def _scan_counts(self, text: str, root: Node) -> Dict[str, int]:
+        counts = defaultdict(int)
+        current = root
+
+        for char in text:
+            while current and char not in current.children:
+                current = current.failure
+
+            if current:
+                current = current.children[char]
+            else:
+                current = root
+
+            for _, pattern in current.output:
+                counts[pattern] += 1
+
+        return counts
+
+    # @brief Menghitung kemunculan keyword CompiledQuery pakai automaton yang sudah dibangun.
+    # @param text: Teks yang sudah lowercase.
+    # @param query: CompiledQuery hasil compile_query(keywords, "AC").
+    # @param entries: Diabaikan, automaton selalu memuat semua keyword query.
+    # @return: Dictionary <keyword, jumlah>. Keyword yang gak ketemu gak dimasukkan.
+    def count_query(self, text: str, query, entries=None) -> Dict[str, int]:
+        if not text or query.automaton is None:
+            return {}
+        counts = self._scan_counts(text, query.automaton)
+        return {keyword: counts[pattern] for keyword, pattern, _ in query.entries if pattern in counts}
+
+    # @brief Mencari posisi keyword CompiledQuery.
+    # @param text: Teks yang sudah lowercase.
+    # @param query: CompiledQuery hasil compile_query(keywords, "AC").
+    # @return: Dictionary yang isinya <keyword, <'positions', 'count'>>.
+    def search_query(self, text: str, query) -> Dict[str, Dict[str, Any]]:
+        if not text or query.automaton is None:
+            return {}
+        positions = self._scan_positions(text, query.automaton)
+        return {
+            keyword: {'positions': list(positions[pattern]), 'count': len(positions[pattern])}
+            for keyword, pattern, _ in query.entries if pattern in positions
+        }
     
     # @brief Alias untuk search_multiple untuk menekankan keunggulan Aho-Corasick.
     # @param text: Teks yang akan dicari.
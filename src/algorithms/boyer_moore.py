@@ -5,25 +5,79 @@
 ##########################################################################
 ##########################################################################
 
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
+
+from utils.cache import BoundedCache
+
+VARIANTS = ('auto', 'bm', 'horspool', 'sunday')
 
 class BoyerMoore:
-    def __init__(self):
+    # @param variant: 'bm' (bad char + good suffix), 'horspool', 'sunday', atau 'auto'
+    # @param short_variant: Varian yang dipakai 'auto' untuk pola pendek ('horspool' atau 'sunday')
+    # @param short_pattern_length: Batas panjang pola yang dianggap pendek oleh 'auto'
+    # @param cache_limit: Jumlah maksimum pola yang tabelnya disimpan (per jenis tabel)
+    # @param cache_bytes: Perkiraan ukuran maksimum tiap cache tabel dalam byte
+    def __init__(self, variant: str = 'auto', short_variant: str = 'sunday', short_pattern_length: int = 8,
+                 cache_limit: int = 1000, cache_bytes: int = 8 * 1024 * 1024):
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown Boyer-Moore variant '{variant}', choose one of: {', '.join(VARIANTS)}")
+        if short_variant not in ('horspool', 'sunday'):
+            raise ValueError("short_variant must be 'horspool' or 'sunday'")
         self.name = "Boyer-Moore"
-        self._pattern_cache = {} # biar gak recompute yg udh ada
+        self.variant = variant
+        self.short_variant = short_variant
+        self.short_pattern_length = short_pattern_length
+        self._pattern_cache = BoundedCache(cache_limit, cache_bytes, name="bm_tables") # biar gak recompute yg udh ada
+        self._shift_cache = BoundedCache(cache_limit, cache_bytes, name="bm_shift")    # tabel Horspool/Sunday, key-nya (pola, varian)
     
 
-    # @brief Menghitung tabel 'bad character' untuk pergeseranAdd commentMore actions
+    # @brief Menghitung tabel 'bad character' untuk pergeseran
+    # @details Pakai dict yang isinya cuma karakter di pola, jadi karakter non-ASCII
+    #          (smart quote, bullet, teks Indonesia/CJK) tetap dapet pergeseran penuh.
     # @param pattern: Pola string yang akan dianalisis
-    # @return: Tabel (list) yang memetakan setiap karakter ke posisi terakhirnya dalam pola
-    def _bad_char_heuristic(self, pattern: str) -> list[int]:
-        bad_char = [-1] * 256  # ascii table
+    # @return: Dict yang memetakan setiap karakter pola ke posisi terakhirnya dalam pola
+    def _bad_char_heuristic(self, pattern: str) -> Dict[str, int]:
+        bad_char = {}
         for i in range(len(pattern)):
-            bad_char[ord(pattern[i])] = i
+            bad_char[pattern[i]] = i
             
         return bad_char
+
+    # @brief Tabel geser Horspool: jarak karakter ke ujung pola (karakter terakhir pola gak dihitung)
+    # @param pattern: Pola string
+    # @return: Dict karakter -> besar geser; karakter lain geser sejauh len(pattern)
+    def _horspool_table(self, pattern: str) -> Dict[str, int]:
+        m = len(pattern)
+        return {pattern[i]: m - 1 - i for i in range(m - 1)}
+
+    # @brief Tabel geser Sunday (quick search): dilihat dari karakter tepat setelah window
+    # @param pattern: Pola string
+    # @return: Dict karakter -> besar geser; karakter lain geser sejauh len(pattern) + 1
+    def _sunday_table(self, pattern: str) -> Dict[str, int]:
+        m = len(pattern)
+        return {pattern[i]: m - i for i in range(m)}
+
+    # @brief Menentukan varian yang dipakai untuk sebuah pola
+    # @param pattern: Pola string
+    # @return: 'bm', 'horspool', atau 'sunday'
+    def _resolve_variant(self, pattern: str) -> str:
+        if self.variant != 'auto':
+            return self.variant
+        return self.short_variant if len(pattern) <= self.short_pattern_length else 'bm'
+
+    # @brief Ambil tabel geser Horspool/Sunday dari cache atau hitung baru
+    # @param pattern: Pola string
+    # @param variant: 'horspool' atau 'sunday'
+    # @return: Tabel geser
+    def _shift_table(self, pattern: str, variant: str) -> Dict[str, int]:
+        key = (pattern, variant)
+        table = self._shift_cache.get(key)
+        if table is None:
+            table = self._horspool_table(pattern) if variant == 'horspool' else self._sunday_table(pattern)
+            self._shift_cache.put(key, table)
+        return table
     
-    # @brief Menghitung tabel 'good suffix' untuk pergeseran yang lebih optimalAdd commentMore actions
+    # @brief Menghitung tabel 'good suffix' untuk pergeseran yang lebih optimal
     # @param pattern: Pola string yang akan diproses
     # @return: Tabel (list) yang berisi jarak pergeseran berdasarkan sufiks yang cocok
     def _good_suffix_heuristic(self, pattern: str) -> list[int]:
@@ -65,104 +119,181 @@ class BoyerMoore:
             
         return good_suffix
     
-    # @brief Melakukan pra-pemrosesan pola dengan menghitung tabel bad char & good suffixAdd commentMore actions
+    # @brief Melakukan pra-pemrosesan pola dengan menghitung tabel bad char & good suffix
     # @details Mengecek cache dulu, kalau polanya sudah pernah diproses, langsung kembalikan hasilnya biar gak recompute.
     # @param pattern: Pola yang akan diproses
     # @return: Tuple yang isinya tabel bad character dan tabel good suffix
-    def preprocess_pattern(self, pattern: str) -> tuple[list[int], list[int]]:
+    def preprocess_pattern(self, pattern: str) -> tuple[Dict[str, int], list[int]]:
         pattern_key = (pattern, len(pattern))
         
-        if pattern_key in self._pattern_cache:
-            return self._pattern_cache[pattern_key]
+        cached = self._pattern_cache.get(pattern_key)
+        if cached is not None:
+            return cached
         
         bad_char = self._bad_char_heuristic(pattern)
         good_suffix = self._good_suffix_heuristic(pattern)
         
-        self._pattern_cache[pattern_key] = (bad_char, good_suffix)
+        self._pattern_cache.put(pattern_key, (bad_char, good_suffix))
         return bad_char, good_suffix
 
 
     # @brief fungsi utama untuk algoritma Boyer-Moore
-    # @param text: Teks yang akan dicariAdd commentMore actions
+    # @param text: Teks yang akan dicari
     # @param pattern: Pola yang akan dicocokkan
     # @return: List berisi semua posisi awal ditemukannya pola, kalau gaada ya kosong
     def search(self, text: str, pattern: str) -> list[int]:
         if not text or not pattern or len(pattern) > len(text):
             return []
-        text_l = text.lower()
-        pat_l  = pattern.lower()
-        bad, good = self.preprocess_pattern(pat_l)
+        return self.search_normalized(text.lower(), pattern.lower())
 
-        n, m = len(text_l), len(pat_l)
+    # @brief Boyer-Moore untuk teks dan pola yang sudah lowercase, tanpa menyalin teks
+    # @param text: Teks yang sudah lowercase
+    # @param pattern: Pola yang sudah lowercase
+    # @param compiled: Tabel dari compile_pattern (misal dari CompiledQuery), None = ambil dari cache
+    # @return: List berisi semua posisi awal ditemukannya pola, kalau gaada ya kosong
+    def search_normalized(self, text: str, pattern: str, compiled: Optional[tuple] = None) -> list[int]:
+        if not text or not pattern or len(pattern) > len(text):
+            return []
         res = []
+        self._scan(text, pattern, res, compiled=compiled)
+        return res
+
+    # @brief Tabel pola untuk CompiledQuery (varian + tabel gesernya)
+    # @param pattern: Pola yang sudah lowercase
+    # @return: Tuple (varian, tabel); tabel 'bm' = (bad char, good suffix), lainnya = tabel geser
+    def compile_pattern(self, pattern: str) -> tuple:
+        variant = self._resolve_variant(pattern)
+        if variant == 'bm':
+            return variant, self.preprocess_pattern(pattern)
+        return variant, self._shift_table(pattern, variant)
+
+    # @brief Scan utama, dipakai bareng oleh search, count, dan search_first
+    # @param text: Teks yang sudah lowercase
+    # @param pattern: Pola yang sudah lowercase (len(pattern) <= len(text))
+    # @param positions: List untuk menampung posisi, None kalau cuma mau ngitung
+    # @param limit: Berhenti setelah ketemu sebanyak ini (0 = cari semua)
+    # @param compiled: Hasil compile_pattern, None = dihitung/diambil dari cache
+    # @return: Jumlah kemunculan yang ketemu
+    def _scan(self, text: str, pattern: str, positions: Optional[list] = None, limit: int = 0, compiled: Optional[tuple] = None) -> int:
+        variant, tables = compiled if compiled is not None else self.compile_pattern(pattern)
+        if variant == 'horspool':
+            return self._scan_horspool(text, pattern, positions, limit, tables)
+        if variant == 'sunday':
+            return self._scan_sunday(text, pattern, positions, limit, tables)
+        return self._scan_bm(text, pattern, positions, limit, tables)
+
+    # @brief Boyer-Moore penuh (bad character + good suffix)
+    def _scan_bm(self, text: str, pattern: str, positions: Optional[list], limit: int, tables: tuple) -> int:
+        bad, good = tables
+        bad_get = bad.get
+
+        n, m = len(text), len(pattern)
+        count = 0
         s = 0
-        bad_local = bad
-        good_local = good
-        txt = text_l
-        pat = pat_l
 
         while s <= n - m:
             j = m - 1
-            # skip re‑matching a known good suffix? (Galil rule) …
-            while j >= 0 and pat[j] == txt[s + j]:
+            while j >= 0 and pattern[j] == text[s + j]:
                 j -= 1
             if j < 0:
-                res.append(s)
-                s += good_local[0]  # or incorporate Galil
+                count += 1
+                if positions is not None:
+                    positions.append(s)
+                if count == limit:
+                    break
+                s += good[0]
             else:
-                bc = bad_local[ord(txt[s+j])] if ord(txt[s+j]) < len(bad_local) else -1
+                bc = bad_get(text[s + j], -1)
                 shift1 = j - bc if bc >= 0 else j + 1
-                shift2 = good_local[j]
+                shift2 = good[j]
                 s += shift1 if shift1 > shift2 else shift2
-        return res
+        return count
+
+    # @brief Horspool: geser berdasarkan karakter terakhir window, verifikasi pakai startswith
+    def _scan_horspool(self, text: str, pattern: str, positions: Optional[list], limit: int, table: Dict[str, int]) -> int:
+        shift_get = table.get
+        n, m = len(text), len(pattern)
+        last = pattern[-1]
+        count = 0
+        s = 0
+
+        while s <= n - m:
+            c = text[s + m - 1]
+            if c == last and text.startswith(pattern, s):
+                count += 1
+                if positions is not None:
+                    positions.append(s)
+                if count == limit:
+                    break
+            s += shift_get(c, m)
+        return count
+
+    # @brief Sunday (quick search): geser berdasarkan karakter tepat setelah window
+    def _scan_sunday(self, text: str, pattern: str, positions: Optional[list], limit: int, table: Dict[str, int]) -> int:
+        shift_get = table.get
+        n, m = len(text), len(pattern)
+        count = 0
+        s = 0
+
+        while s <= n - m:
+            if text.startswith(pattern, s):
+                count += 1
+                if positions is not None:
+                    positions.append(s)
+                if count == limit:
+                    break
+            if s + m >= n:
+                break
+            s += shift_get(text[s + m], m + 1)
+        return count
 
     # @brief Mencari kemunculan pertama dari pola dalam teks
-    # @param text: Teks yang akan dicariAdd commentMore actions
+    # @param text: Teks yang akan dicari
     # @param pattern: Pola yang akan dicocokkan
     # @return: Posisi awal kemunculan pertama pola, atau -1 kalau gaada
     def search_first(self, text: str, pattern: str) -> int:
-        n: int = len(text)
-        m: int = len(pattern)
-        if m > n:
+        if not text or not pattern or len(pattern) > len(text):
             return -1
         
-        bad_char, good_suffix = self._preprocess_pattern(pattern)
+        found = []
+        self._scan(text.lower(), pattern.lower(), found, limit=1)
+        return found[0] if found else -1
 
-        s: int = 0
-        while s <= n - m:
-            j: int = m - 1
-            
-            while j >= 0 and pattern[j] == text[s + j]:
-                j -= 1
-                
-            if j < 0:
-                return s  # kemunculan pertama
-                
-            char_code = ord(text[s + j])
-            shift = bad_char[char_code] if char_code < len(bad_char) else -1
-            bad_char_shift = max(1, j - shift)
-            good_suffix_shift = good_suffix[j]
-            s += max(bad_char_shift, good_suffix_shift)
-            return -1
-
-    # @brief Menghitung jumlah kemunculan pola dalam teksAdd commentMore actions
+    # @brief Menghitung jumlah kemunculan pola dalam teks
     # @param text: Teks yang akan dicari
     # @param pattern: Pola yang akan dicocokkan
     # @return: Jumlah total kemunculan pola
     def count_occurrences(self, text: str, pattern: str) -> int:
-        return len(self.search(text, pattern))
+        if not text or not pattern or len(pattern) > len(text):
+            return 0
+        return self.count_normalized(text.lower(), pattern.lower())
+
+    # @brief Boyer-Moore yang cuma ngitung, tanpa bikin list posisi (teks dan pola sudah lowercase)
+    # @param text: Teks yang sudah lowercase
+    # @param pattern: Pola yang sudah lowercase
+    # @param compiled: Tabel dari compile_pattern (misal dari CompiledQuery), None = ambil dari cache
+    # @return: Jumlah kemunculan pola (overlap ikut dihitung)
+    def count_normalized(self, text: str, pattern: str, compiled: Optional[tuple] = None) -> int:
+        if not text or not pattern or len(pattern) > len(text):
+            return 0
+        return self._scan(text, pattern, compiled=compiled)
     
     # @brief Mencari beberapa pola sekaligus dalam satu teks
-    # @param text: Teks yang akan dicariAdd commentMore actions
+    # @param text: Teks yang akan dicari
     # @param patterns: List berisi pola-pola yang mau dicari
     # @return: Dictionary yang isinya hasil pencarian, bentuknya pola -> {posisi, jumlah}
     def search_multiple(self, text: str, patterns: List[str]) -> Dict[str, Dict[str, Any]]:
+        return self.search_multiple_normalized(text.lower(), patterns)
+
+    # @brief Mencari beberapa pola dalam teks yang sudah lowercase (misal dari CorpusStore)
+    # @param text: Teks yang sudah lowercase, gak disalin sama sekali
+    # @param patterns: List berisi pola-pola yang mau dicari
+    # @return: Dictionary yang isinya hasil pencarian, bentuknya pola -> {posisi, jumlah}
+    def search_multiple_normalized(self, text: str, patterns: List[str]) -> Dict[str, Dict[str, Any]]:
         results = {}
         
-        text = text.lower()
-        
         for pattern in patterns:
-            positions = self.search(text, pattern)
+            positions = self.search_normalized(text, pattern.lower())
             if positions:
                 results[pattern] = {
                     'positions': positions,
@@ -170,5 +301,51 @@ class BoyerMoore:
                 }
         return results
     
+    # @brief Versi count-only dari search_multiple
+    # @param text: Teks yang akan dicari
+    # @param patterns: List berisi pola-pola yang mau dihitung
+    # @return: Dictionary pola -> jumlah, pola yang gak ketemu gak dimasukkan
+    def count_multiple(self, text: str, patterns: List[str]) -> Dict[str, int]:
+        return self.count_multiple_normalized(text.lower(), patterns)
+
+    # @brief Versi count-only untuk teks yang sudah lowercase
+    # @param text: Teks yang sudah lowercase
+    # @param patterns: List berisi pola-pola yang mau dihitung
+    # @return: Dictionary pola -> jumlah, pola yang gak ketemu gak dimasukkan
+    def count_multiple_normalized(self, text: str, patterns: List[str]) -> Dict[str, int]:
+        counts = {}
+
+        for pattern in patterns:
+            count = self.count_normalized(text, pattern.lower())
+            if count:
+                counts[pattern] = count
+        return counts
+    
+    # @brief Menghitung kemunculan keyword CompiledQuery, per CV tinggal scan aja
+    # @param text: Teks yang sudah lowercase
+    # @param query: CompiledQuery hasil compile_query(keywords, "BM")
+    # @param entries: Subset query.entries yang mau dicari (misal hasil prefilter), None = semua
+    # @return: Dictionary keyword -> jumlah, keyword yang gak ketemu gak dimasukkan
+    def count_query(self, text: str, query, entries=None) -> Dict[str, int]:
+        counts = {}
+        for keyword, pattern, compiled in (query.entries if entries is None else entries):
+            count = self.count_normalized(text, pattern, compiled)
+            if count:
+                counts[keyword] = count
+        return counts
+
+    # @brief Mencari posisi keyword CompiledQuery
+    # @param text: Teks yang sudah lowercase
+    # @param query: CompiledQuery hasil compile_query(keywords, "BM")
+    # @return: Dictionary yang isinya hasil pencarian, bentuknya keyword -> {posisi, jumlah}
+    def search_query(self, text: str, query) -> Dict[str, Dict[str, Any]]:
+        results = {}
+        for keyword, pattern, compiled in query.entries:
+            positions = self.search_normalized(text, pattern, compiled)
+            if positions:
+                results[keyword] = {'positions': positions, 'count': len(positions)}
+        return results
+
     def clear_cache(self):
-        self._pattern_cache.clear()
\ No newline at end of file
+        self._pattern_cache.clear()
+        self._shift_cache.clear()
\ No newline at end of file
@@ -5,28 +5,24 @@
 ##########################################################################
 ##########################################################################
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence
+
+from utils.cache import BoundedCache
 
 class KMP:
-    def __init__(self, cache_limit: int = 1000):
+    # @param cache_limit: Jumlah maksimum LPS array yang disimpan
+    # @param cache_bytes: Perkiraan ukuran maksimum cache LPS dalam byte
+    def __init__(self, cache_limit: int = 1000, cache_bytes: int = 4 * 1024 * 1024):
         self.name = "KMP"
-        self._lps_cache: Dict[str, List[int]] = {}
-        self._cache_limit = cache_limit
-        self._cache_access_count = {}
-
-    def _evict_cache(self) -> None:
-        if len(self._lps_cache) >= self._cache_limit:
-            lru_pattern = min(self._cache_access_count.items(), key=lambda x: x[1])[0]
-            del self._lps_cache[lru_pattern]
-            del self._cache_access_count[lru_pattern]
+        self._lps_cache = BoundedCache(cache_limit, cache_bytes, name="kmp_lps")
 
     # @brief Menghitung Longest Prefix Suffix array dari pola
     # @param pattern: Pola yang dipakai untuk pattern matching
     # @return: LPS array yang berisi panjang prefix yang juga suffix untuk setiap indeks
     def _compute_lps(self, pattern: str) -> List[int]:
-        if pattern in self._lps_cache:
-            self._cache_access_count[pattern] += 1
-            return self._lps_cache[pattern]
+        cached = self._lps_cache.get(pattern)
+        if cached is not None:
+            return cached
 
         m: int = len(pattern)
         if m == 0:
@@ -48,16 +44,26 @@ class KMP:
                     else:
                         lps[i] = 0
                         i += 1
-        self._evict_cache()
-        self._lps_cache[pattern] = lps
-        self._cache_access_count[pattern] = 1
+        self._lps_cache.put(pattern, lps)
         return lps
     
     # @brief fungsi utama untuk algoritma KMP
     # @param text: Teks yang akan dicari
     # @param pattern: Pola yang akan dicocokkan
+    # @param is_lowercase: True kalau teks sudah lowercase (gak di-lower lagi)
     # @return: List posisi di mana pola ditemukan dalam teks, kalau gaada ya kosong
     def search(self, text: str, pattern: str, is_lowercase: bool = False) -> List[int]:
+        if not text or not pattern:
+            return []
+        text = text if is_lowercase else text.lower()
+        return self.search_normalized(text, pattern.lower())
+
+    # @brief KMP untuk teks dan pola yang sudah dinormalisasi (lowercase), tanpa menyalin teks
+    # @param text: Teks yang sudah lowercase
+    # @param pattern: Pola yang sudah lowercase
+    # @param lps: LPS array yang sudah dihitung (misal dari CompiledQuery), None = ambil dari cache
+    # @return: List posisi di mana pola ditemukan dalam teks, kalau gaada ya kosong
+    def search_normalized(self, text: str, pattern: str, lps: Optional[Sequence[int]] = None) -> List[int]:
         if not text or not pattern:
             return []
             
@@ -67,13 +73,11 @@ class KMP:
         if m > n:
             return []
         
-        # prep
-        text: str = text.lower() if is_lowercase else text
-        pattern: str = pattern.lower()
         positions: list[int] = []
 
         # ambil dari cache atau hitung baru
-        lps: List[int] = self._compute_lps(pattern)
+        if lps is None:
+            lps = self._compute_lps(pattern)
 
         i: int = 0  # index untuk teks
         j: int = 0  # index untuk pola
@@ -98,13 +102,21 @@ class KMP:
     # @param patterns: List pola yang akan dicocokkan
     # @return: Dictionary yang bentuknya kayak <pola, <posisi, count>>
     def search_multiple(self, text: str, patterns: list[str]) -> dict[str, dict[str, int]]:
+        if not text or not patterns:
+            return {}
+        return self.search_multiple_normalized(text.lower(), patterns)
+
+    # @brief Mencari beberapa pola dalam teks yang sudah lowercase (misal dari CorpusStore)
+    # @param text: Teks yang sudah lowercase, gak disalin sama sekali
+    # @param patterns: List pola (key hasil tetap pola aslinya)
+    # @return: Dictionary yang bentuknya kayak <pola, <posisi, count>>
+    def search_multiple_normalized(self, text: str, patterns: list[str]) -> dict[str, dict[str, int]]:
         if not text or not patterns:
             return {}
         
         results: dict[str, dict[str, int]] = {}
-        text = text.lower()
         for pattern in patterns:
-            positions = self.search(text, pattern, is_lowercase=True)
+            positions = self.search_normalized(text, pattern.lower())
             if positions:
                 results[pattern] = {
                     'positions': positions,
@@ -112,6 +124,106 @@ class KMP:
                 }
         return results
 
+    # @brief Menghitung kemunculan pola tanpa menyimpan posisinya (teks dan pola sudah lowercase)
+    # @param text: Teks yang sudah lowercase
+    # @param pattern: Pola yang sudah lowercase
+    # @param lps: LPS array yang sudah dihitung (misal dari CompiledQuery), None = ambil dari cache
+    # @return: Jumlah kemunculan pola (overlap ikut dihitung)
+    def count_normalized(self, text: str, pattern: str, lps: Optional[Sequence[int]] = None) -> int:
+        if not text or not pattern:
+            return 0
+
+        n: int = len(text)
+        m: int = len(pattern)
+
+        if m > n:
+            return 0
+
+        if lps is None:
+            lps = self._compute_lps(pattern)
+        count: int = 0
+        i: int = 0
+        j: int = 0
+
+        while i < n:
+            if text[i] == pattern[j]:
+                i += 1
+                j += 1
+
+                if j == m:
+                    count += 1
+                    j = lps[j - 1]
+            else:
+                if j != 0:
+                    j = lps[j - 1]
+                else:
+                    i += 1
+        return count
+
+    # @brief Menghitung jumlah kemunculan sebuah pola dalam teks
+    # @param text: Teks yang akan dicari
+    # @param pattern: Pola yang akan dihitung
+    # @return: Jumlah kemunculan pola
+    def count_occurrences(self, text: str, pattern: str) -> int:
+        if not text or not pattern:
+            return 0
+        return self.count_normalized(text.lower(), pattern.lower())
+
+    # @brief Versi count-only dari search_multiple, gak bikin list posisi sama sekali
+    # @param text: Teks yang akan dicari
+    # @param patterns: List pola yang akan dihitung
+    # @return: Dictionary <pola, jumlah>, pola yang gak ketemu gak dimasukkan
+    def count_multiple(self, text: str, patterns: list[str]) -> dict[str, int]:
+        if not text or not patterns:
+            return {}
+        return self.count_multiple_normalized(text.lower(), patterns)
+
+    # @brief Versi count-only untuk teks yang sudah lowercase
+    # @param text: Teks yang sudah lowercase
+    # @param patterns: List pola (key hasil tetap pola aslinya)
+    # @return: Dictionary <pola, jumlah>, pola yang gak ketemu gak dimasukkan
+    def count_multiple_normalized(self, text: str, patterns: list[str]) -> dict[str, int]:
+        if not text or not patterns:
+            return {}
+
+        counts: dict[str, int] = {}
+        for pattern in patterns:
+            count = self.count_normalized(text, pattern.lower())
+            if count:
+                counts[pattern] = count
+        return counts
+
+    # @brief Tabel pola untuk CompiledQuery
+    # @param pattern: Pola yang sudah lowercase
+    # @return: LPS array dalam bentuk tuple (immutable)
+    def compile_pattern(self, pattern: str) -> tuple:
+        return tuple(self._compute_lps(pattern))
+
+    # @brief Menghitung kemunculan keyword CompiledQuery, per CV tinggal scan aja
+    # @param text: Teks yang sudah lowercase
+    # @param query: CompiledQuery hasil compile_query(keywords, "KMP")
+    # @param entries: Subset query.entries yang mau dicari (misal hasil prefilter), None = semua
+    # @return: Dictionary <keyword, jumlah>, keyword yang gak ketemu gak dimasukkan
+    def count_query(self, text: str, query, entries=None) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for keyword, pattern, lps in (query.entries if entries is None else entries):
+            count = self.count_normalized(text, pattern, lps)
+            if count:
+                counts[keyword] = count
+        return counts
+
+    # @brief Mencari posisi keyword CompiledQuery
+    # @param text: Teks yang sudah lowercase
+    # @param query: CompiledQuery hasil compile_query(keywords, "KMP")
+    # @return: Dictionary yang bentuknya kayak <keyword, <posisi, count>>
+    def search_query(self, text: str, query) -> dict[str, dict[str, int]]:
+        results: dict[str, dict[str, int]] = {}
+        for keyword, pattern, lps in query.entries:
+            positions = self.search_normalized(text, pattern, lps)
+            if positions:
+                results[keyword] = {'positions': positions, 'count': len(positions)}
+        return results
+
     # @brief membersihkan cache LPS
     # @return: None
     def clear_cache(self):
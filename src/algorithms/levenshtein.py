@@ -3,30 +3,38 @@
 ## @file levenshtein.py
 ## Ini isinya implementasi algoritma Levenshtein Distance untuk
 ## pencarian fuzzy (fuzzy string matching).
+## Kalau NumPy ada, satu keyword bisa di-skor ke ribuan kandidat sekaligus
+## (distances / similarities): kandidat diurutkan per panjang, di-pad jadi
+## satu matriks code point, lalu satu baris DP = beberapa operasi vektor.
 ##########################################################################
 ##########################################################################
 
 import re
+from array import array
 from collections import defaultdict
-from typing import List, Dict, Tuple, Any, Optional
+from typing import List, Dict, Tuple, Any, Optional, Iterator
+
+from utils.cache import BoundedCache
+
+try:
+    import numpy as np
+except ImportError:  # numpy gak wajib, fallback ke DP per pasangan
+    np = None
 
 class LevenshteinDistance:
     def __init__(self, threshold: int =0.65, cache_limit: int = 1000):
         self.threshold = threshold  # Similarity threshold (0.7 = 70% similar)
-        self._distance_cache = {}  # Cache untuk menghindari perhitungan berulang
-        self.cache_limit = 1000
+        self.cache_limit = cache_limit
+        self._distance_cache = BoundedCache(cache_limit, name="levenshtein")  # Cache untuk menghindari perhitungan berulang
         self._word_cleaner =  re.compile(r'[^\w\s]', re.UNICODE)
         self._whitespace = re.compile(r'\s+')
-        self._access_counter = 0 
-        
-    def _evict_cache(self):
-        if len(self._distance_cache) >= self.cache_limit:
-            lru_key = min(self._distance_cache.keys(), key=lambda k: self._distance_cache[k][1])
-            del self._distance_cache[lru_key]
 
     # @brief Menghitung jarak Levenshtein antara dua string.
+    # @details Kalau max_distance diisi, cuma diagonal band selebar 2k+1 yang dihitung
+    #          (Ukkonen), dan pasangan yang selisih panjangnya > k langsung ditolak O(1).
     # @param s1: String pertama.
     # @param s2: String kedua.
+    # @param max_distance: Batas jarak (k). Kalau jaraknya > k, yang dikembalikan k + 1.
     # @return: Jarak Levenshtein (integer) antara s1 dan s2.
     def calculate_distance(self, s1, s2, max_distance: Optional[int] = None):
         if not s1:
@@ -39,63 +47,88 @@ class LevenshteinDistance:
         # Convert to lowercase for case-insensitive comparison
         s1 = s1.lower()
         s2 = s2.lower()
+
+        # biar efisien, kalau panjang s1 < s2, tukar aja (max_distance ikut dibawa)
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
         m, n = len(s1), len(s2)
+
+        # selisih panjang = batas bawah jarak, jadi pasangan yang mustahil gak perlu DP sama sekali
+        if max_distance is not None and m - n > max_distance:
+            return max_distance + 1
         
         # cek cache
         cache_key = (s1, s2, max_distance)
-        if cache_key in self._distance_cache:
-            self._access_counter += 1
-            value, _ = self._distance_cache[cache_key]
-            self._distance_cache[cache_key] = (value, self._access_counter)
-            return value
-
-        # biar efisien, kalau panjang s1 < s2, tukar aja
-        if m < n:
-            return self.calculate_distance(s2, s1) 
-
-        # skrg amanh m >= n
-        prev_row = list(range(n + 1))
-        curr_row = [0] * (n + 1)
+        cached = self._distance_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # skrg aman m >= n, dan cuma sel |i - j| <= k yang dihitung
+        k = m if max_distance is None else min(max_distance, m)
+        big = k + 1
+        prev_row = array('i', [big]) * (n + 1)
+        curr_row = array('i', [big]) * (n + 1)
+        for j in range(min(n, k) + 1):
+            prev_row[j] = j
         
         for i in range(1, m + 1):
-            curr_row[0] = i
-            diagonal_min = float('inf')
+            lo = max(1, i - k)
+            hi = min(n, i + k)
+            curr_row[lo - 1] = i if lo == 1 else big
+            row_min = curr_row[lo - 1]
+            c1 = s1[i - 1]
             
-            for j in range(1, n + 1):
-                if s1[i-1] == s2[j-1]:
-                    curr_row[j] = prev_row[j-1]
-                else:
-                    curr_row[j] = 1 + min(
-                        prev_row[j],     # deletion
-                        curr_row[j-1],   # insertion
-                        prev_row[j-1]    # substitution
-                    )
-                
-                diagonal_min = min(diagonal_min, curr_row[j])
+            for j in range(lo, hi + 1):
+                value = prev_row[j - 1]
+                if c1 != s2[j - 1]:
+                    if prev_row[j] < value:      # deletion
+                        value = prev_row[j]
+                    if curr_row[j - 1] < value:  # insertion
+                        value = curr_row[j - 1]
+                    value += 1                   # substitution / deletion / insertion
+                    if value > big:
+                        value = big
+                curr_row[j] = value
+                if value < row_min:
+                    row_min = value
+            
+            # sel tepat di kanan band dibaca baris berikutnya, jadi harus "tak hingga"
+            if hi < n:
+                curr_row[hi + 1] = big
             
-            if max_distance is not None and diagonal_min > max_distance:
+            if max_distance is not None and row_min > max_distance:
                 return max_distance + 1
             
             # Swap rows
             prev_row, curr_row = curr_row, prev_row
         
+        distance = prev_row[n]
+        if max_distance is not None and distance > max_distance:
+            distance = max_distance + 1
+
         # Simpan hasil ke cache
-        self._evict_cache()
-        self._access_counter += 1
-        self._distance_cache[cache_key] = (prev_row[n], self._access_counter)
-        return prev_row[n]
+        self._distance_cache.put(cache_key, distance)
+        return distance
     
     # @brief Menghitung persentase kemiripan antara dua string.
     # @param s1: String pertama.
     # @param s2: String kedua.
-    # @return: Skor kemiripan (float) antara 0.0 dan 1.0.
-    def calculate_similarity(self, s1, s2):
+    # @param min_similarity: Ambang batas yang dipakai untuk batas jarak (default self.threshold).
+    # @return: Skor kemiripan (float) antara 0.0 dan 1.0. Pasangan di bawah ambang batas bisa
+    #          dapat skor yang lebih rendah dari aslinya (jaraknya dipotong di k + 1).
+    def calculate_similarity(self, s1, s2, min_similarity: float = None):
         if not s1 and not s2:
             return 1.0
+        if min_similarity is None:
+            min_similarity = self.threshold
         
         max_len = max(len(s1), len(s2))
-        max_distance = int(max_len * (1 - self.threshold)) + 1
-        distance = self.calculate_distance(s1, s2, max_distance)
+        max_distance = int(max_len * (1 - min_similarity)) + 1
+        if abs(len(s1) - len(s2)) > max_distance:
+            # pasangan yang mustahil (kebanyakan window di fuzzy_search) ditolak tanpa lower/cache/DP
+            distance = max_distance + 1
+        else:
+            distance = self.calculate_distance(s1, s2, max_distance)
         
         if max_len == 0:
             return 1.0
@@ -103,6 +136,148 @@ class LevenshteinDistance:
         similarity = 1 - (distance / max_len)
         return similarity
     
+    # @brief DP Levenshtein satu keyword ke banyak kandidat sekaligus (NumPy)
+    # @details Kandidat diurutkan per panjang lalu di-pad jadi satu matriks code point. Satu
+    #          iterasi = satu karakter kandidat untuk semua kandidat yang masih aktif; insertion
+    #          (curr[j-1] + 1) di-resolve pakai minimum.accumulate di atas (nilai - j). Karena
+    #          urut panjang, kandidat yang sudah habis tinggal dipotong dari depan.
+    # @param keyword: Keyword yang sudah lowercase (gak kosong)
+    # @param words: List kandidat yang sudah lowercase (gak kosong)
+    # @param bounds: Batas jarak per kandidat, hasil di atasnya jadi batas + 1
+    # @return: ndarray jarak per kandidat, urutannya sama dengan words
+    def _batch_distances(self, keyword: str, words: List[str], bounds):
+        keyword_codes = np.frombuffer(keyword.encode('utf-32-le'), dtype=np.uint32)
+        n = len(keyword_codes)
+
+        lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
+        order = np.argsort(lengths, kind='stable')
+        lengths = lengths[order]
+        bounds = np.asarray(bounds, dtype=np.int32)[order]
+        width = int(lengths[-1])
+        matrix = np.frombuffer(
+            ''.join(words[i].ljust(width, '\x00') for i in order).encode('utf-32-le'), dtype=np.uint32
+        ).reshape(len(words), width)
+
+        steps = np.arange(n + 1, dtype=np.int32)
+        prev = np.broadcast_to(steps, (len(words), n + 1)).copy()
+        curr = np.empty_like(prev)
+        distances = np.empty(len(words), dtype=np.int32)
+        active = 0  # kandidat [active:] belum habis
+
+        for i in range(width):
+            p, c = prev[active:], curr[active:]
+            np.add(p[:, :-1], matrix[active:, i:i + 1] != keyword_codes, out=c[:, 1:])  # substitution
+            np.minimum(c[:, 1:], p[:, 1:] + 1, out=c[:, 1:])                             # deletion
+            c[:, 0] = i + 1
+            c -= steps
+            np.minimum.accumulate(c, axis=1, out=c)                                      # insertion
+            c += steps
+
+            done = int(np.searchsorted(lengths, i + 1, side='right'))
+            distances[active:done] = c[:done - active, n]
+            if done < len(words) and (c[done - active:].min(axis=1) > bounds[done:]).all():
+                distances[done:] = bounds[done:] + 1
+                done = len(words)
+            active = done
+            if active == len(words):
+                break
+            prev, curr = curr, prev
+
+        np.minimum(distances, bounds + 1, out=distances)
+        result = np.empty_like(distances)
+        result[order] = distances
+        return result
+
+    # @brief Menghitung jarak satu keyword ke banyak kandidat sekaligus (batch NumPy)
+    # @param keyword: Keyword yang dicari
+    # @param candidates: List string kandidat
+    # @param max_distance: Batas jarak (sama seperti calculate_distance)
+    # @return: ndarray jarak per kandidat (list kalau NumPy gak ada), urutannya sama dengan candidates
+    def distances(self, keyword: str, candidates: List[str], max_distance: Optional[int] = None):
+        if np is None:
+            return [self.calculate_distance(keyword, candidate, max_distance) for candidate in candidates]
+
+        lowered = keyword.lower()
+        result = np.empty(len(candidates), dtype=np.int32)
+        todo, words = [], []
+        for i, candidate in enumerate(candidates):
+            word = candidate.lower()
+            if not keyword or not candidate:
+                # sama kayak calculate_distance: kalau salah satu kosong, jaraknya panjang yang lain
+                result[i] = len(keyword) or len(candidate)
+            elif max_distance is not None and abs(len(word) - len(lowered)) > max_distance:
+                result[i] = max_distance + 1
+            else:
+                todo.append(i)
+                words.append(word)
+
+        if todo:
+            bound = max(len(lowered), max(len(word) for word in words)) if max_distance is None else max_distance
+            result[todo] = self._batch_distances(lowered, words, np.full(len(words), bound))
+        return result
+
+    # @brief Versi batch dari calculate_similarity (skor identik, termasuk batas jaraknya)
+    # @param keyword: Keyword yang dicari
+    # @param candidates: List string kandidat (misal window token CV, atau kosakata seluruh korpus)
+    # @param min_similarity: Ambang batas kemiripan (default self.threshold)
+    # @return: ndarray skor kemiripan per kandidat (list kalau NumPy gak ada)
+    def similarities(self, keyword: str, candidates: List[str], min_similarity: float = None):
+        if min_similarity is None:
+            min_similarity = self.threshold
+        if np is None:
+            return [self.calculate_similarity(candidate, keyword, min_similarity) for candidate in candidates]
+
+        n = len(keyword)
+        lowered = keyword.lower()
+        distances = np.empty(len(candidates), dtype=np.int32)
+        max_lens = np.empty(len(candidates), dtype=np.int64)
+        todo, words, bounds = [], [], []
+        for i, candidate in enumerate(candidates):
+            max_len = max(len(candidate), n)
+            max_lens[i] = max_len
+            k = int(max_len * (1 - min_similarity)) + 1
+            if abs(len(candidate) - n) > k:
+                distances[i] = k + 1
+            elif not keyword or not candidate:
+                distances[i] = max_len
+            else:
+                word = candidate.lower()
+                if abs(len(word) - len(lowered)) > k:
+                    distances[i] = k + 1
+                else:
+                    todo.append(i)
+                    words.append(word)
+                    bounds.append(k)
+
+        if todo:
+            distances[todo] = self._batch_distances(lowered, words, bounds)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(max_lens == 0, 1.0, 1 - distances / np.maximum(max_lens, 1))
+
+    # @brief Span window token (index token awal, jumlah kata) tanpa bikin list
+    # @param token_count: Jumlah token di teks
+    # @param sizes: Ukuran window yang mau dienumerasi, urut dari kecil
+    # @return: Generator tuple (ukuran, index token awal)
+    @staticmethod
+    def _window_spans(token_count: int, sizes) -> Iterator[Tuple[int, int]]:
+        for size in sizes:
+            for start in range(token_count - size + 1):
+                yield size, start
+
+    # @brief Ukuran window terbesar yang masih mungkin lolos ambang batas untuk satu keyword
+    # @details Frasa s kata panjangnya minimal 2s - 1 karakter, dan frasa yang lebih panjang
+    #          dari keyword cuma bisa lolos kalau panjangnya <= len(keyword) / min_similarity.
+    # @param keyword: Keyword yang sudah lowercase
+    # @param min_similarity: Ambang batas kemiripan
+    # @param max_kw_len: Batas atas (jumlah kata keyword terpanjang)
+    # @return: Ukuran window maksimum
+    @staticmethod
+    def _max_window_size(keyword: str, min_similarity: float, max_kw_len: int) -> int:
+        if min_similarity <= 0:
+            return max_kw_len
+        # +1 buat jaga-jaga pembulatan float
+        return max(1, min(max_kw_len, int((len(keyword) / min_similarity + 1) / 2) + 1))
+
     # @brief Melakukan pencarian fuzzy untuk beberapa kata kunci sekaligus.
     # @param text: Teks sumber untuk pencarian.
     # @param keywords: List kata kunci yang akan dicari.
@@ -122,36 +297,41 @@ class LevenshteinDistance:
         words = [m.group(0) for m in word_matches]
         positions = [m.start() for m in word_matches]
 
-        # Buat token windows untuk setiap kata kunci
+        if not processed_keywords:
+            return results
+
+        # Ukuran window maksimum (jumlah kata) tetap mengikuti keyword terpanjang
         max_kw_len = max(length for _, length in processed_keywords)
-        
-        token_windows = []
-        for window_size in range(1, max_kw_len + 1):
-            for i in range(len(words) - window_size + 1):
-                phrase = ' '.join(words[i:i + window_size])
-                token_windows.append({
-                    'word': phrase,
-                    'position': positions[i]
-                })
 
-        # cache untuk menghindari perhitungan berulang
-        similarity_cache = {}
+        # Window di-skor per string unik: {ukuran: {frasa: [index token awal, ...]}}, dibangun
+        # seperlunya saja (keyword pendek gak butuh window panjang)
+        phrases_by_size: Dict[int, Dict[str, List[int]]] = {}
 
         for keyword, kw_len in processed_keywords:
-            for token in token_windows:
-                key_pair = (token['word'], keyword)
-                if key_pair in similarity_cache:
-                    similarity = similarity_cache[key_pair]
-                else:
-                    similarity = self.calculate_similarity(token['word'], keyword)
-                    similarity_cache[key_pair] = similarity
+            sizes = range(1, self._max_window_size(keyword, min_similarity, max_kw_len) + 1)
+            missing_sizes = [size for size in sizes if size not in phrases_by_size]
+            for size in missing_sizes:
+                phrases_by_size[size] = defaultdict(list)
+            for size, start in self._window_spans(len(words), missing_sizes):
+                phrases_by_size[size][' '.join(words[start:start + size])].append(start)
 
+            candidates = [(size, phrase) for size in sizes for phrase in phrases_by_size[size]]
+            scores = self.similarities(keyword, [phrase for _, phrase in candidates], min_similarity)
+
+            # urutan hasil sama kayak dulu: per ukuran window, lalu per posisi token
+            found = []
+            for (size, phrase), similarity in zip(candidates, scores):
+                similarity = float(similarity)
                 if similarity >= min_similarity:
-                    results[keyword].append({
-                        'word': token['word'],
-                        'similarity': similarity,
-                        'position': token['position']
-                    })
+                    found.extend((size, start, phrase, similarity) for start in phrases_by_size[size][phrase])
+            found.sort()
+
+            for _, start, phrase, similarity in found:
+                results[keyword].append({
+                    'word': phrase,
+                    'similarity': similarity,
+                    'position': positions[start]
+                })
 
         return results
     
@@ -0,0 +1,234 @@
+##########################################################################
+##########################################################################
+## @file native.py
+## Ini isinya engine exact match yang scan-nya diserahkan ke primitive C
+## milik Python (str.find dan modul re), bukan loop karakter per karakter.
+## Semantiknya sama persis dengan KMP/BM: case-insensitive via lower(),
+## dan kemunculan yang overlap tetap dihitung ("aa" di "aaaa" = 3).
+##
+## Ada dua mode untuk banyak pola:
+##   'find'  -> loop str.find per pola (default, paling cepat di korpus CV)
+##   'regex' -> satu alternation (?=(p1|p2|...)) yang sudah di-compile
+##########################################################################
+##########################################################################
+
+import re
+from typing import List, Dict, Tuple, Any
+
+from utils.cache import BoundedCache
+
+class NativeSearch:
+    # @param multi_mode: 'find' atau 'regex', cara mencari banyak pola sekaligus
+    # @param cache_limit: Jumlah maksimum alternation yang disimpan
+    def __init__(self, multi_mode: str = 'find', cache_limit: int = 64):
+        if multi_mode not in ('find', 'regex'):
+            raise ValueError("multi_mode must be 'find' or 'regex'")
+        self.name = "Native"
+        self.multi_mode = multi_mode
+        self._regex_cache = BoundedCache(cache_limit, name="native_regex") # biar gak compile ulang
+
+    # @brief Mencari semua posisi pola dalam teks yang sudah lowercase pakai str.find
+    # @param text: Teks yang sudah lowercase
+    # @param pattern: Pola yang sudah lowercase
+    # @return: List posisi awal (overlap ikut)
+    def search_normalized(self, text: str, pattern: str) -> List[int]:
+        if not text or not pattern:
+            return []
+        find = text.find
+        positions = []
+        i = find(pattern)
+        while i != -1:
+            positions.append(i)
+            i = find(pattern, i + 1)
+        return positions
+
+    # @brief Menghitung kemunculan pola dalam teks yang sudah lowercase pakai str.find
+    # @details Sengaja gak pakai str.count karena str.count gak ngitung yang overlap.
+    # @param text: Teks yang sudah lowercase
+    # @param pattern: Pola yang sudah lowercase
+    # @return: Jumlah kemunculan pola (overlap ikut dihitung)
+    def count_normalized(self, text: str, pattern: str) -> int:
+        if not text or not pattern:
+            return 0
+        find = text.find
+        count = 0
+        i = find(pattern)
+        while i != -1:
+            count += 1
+            i = find(pattern, i + 1)
+        return count
+
+    # @brief Fungsi utama untuk mencari satu pola
+    # @param text: Teks yang akan dicari
+    # @param pattern: Pola yang akan dicocokkan
+    # @return: List berisi semua posisi awal ditemukannya pola, kalau gaada ya kosong
+    def search(self, text: str, pattern: str) -> List[int]:
+        if not text or not pattern:
+            return []
+        return self.search_normalized(text.lower(), pattern.lower())
+
+    # @brief Menghitung jumlah kemunculan pola dalam teks
+    # @param text: Teks yang akan dicari
+    # @param pattern: Pola yang akan dihitung
+    # @return: Jumlah kemunculan pola
+    def count_occurrences(self, text: str, pattern: str) -> int:
+        if not text or not pattern:
+            return 0
+        return self.count_normalized(text.lower(), pattern.lower())
+
+    # @brief Compile alternation untuk sekumpulan pola
+    # @details Pola diurutkan dari yang terpanjang, jadi di tiap posisi lookahead menangkap
+    #          pola terpanjang yang cocok. Pola lain yang mulai di posisi yang sama pasti
+    #          prefix dari pola itu, jadi daftarnya disiapkan di 'prefixes'.
+    # @param patterns: List pola (case asli)
+    # @return: Tuple (regex, prefixes <pola lowercase, list pola lowercase yang cocok juga>,
+    #          map lowercase -> list pola asli), atau None kalau gaada pola yang valid
+    def compile_patterns(self, patterns: List[str]) -> Tuple:
+        patterns_key = frozenset(patterns)
+        cached = self._regex_cache.get(patterns_key)
+        if cached is not None:
+            return cached
+
+        lower_to_originals: Dict[str, List[str]] = {}
+        for pattern in dict.fromkeys(patterns):
+            if pattern:
+                lower_to_originals.setdefault(pattern.lower(), []).append(pattern)
+        if not lower_to_originals:
+            return None
+
+        ordered = sorted(lower_to_originals, key=len, reverse=True)
+        regex = re.compile('(?=(' + '|'.join(re.escape(p) for p in ordered) + '))')
+        prefixes = {
+            longer: [p for p in ordered if p != longer and longer.startswith(p)]
+            for longer in ordered
+        }
+
+        compiled = (regex, prefixes, lower_to_originals)
+        self._regex_cache.put(patterns_key, compiled)
+        return compiled
+
+    # @brief Mencari posisi tiap pola (lowercase) dengan satu alternation
+    # @param text: Teks yang sudah lowercase
+    # @param compiled: Hasil compile_patterns
+    # @return: Dictionary <pola lowercase, list posisi>
+    def _regex_positions(self, text: str, compiled: Tuple) -> Dict[str, List[int]]:
+        regex, prefixes, _ = compiled
+        positions: Dict[str, List[int]] = {}
+        for match in regex.finditer(text):
+            start = match.start()
+            longest = match.group(1)
+            positions.setdefault(longest, []).append(start)
+            for shorter in prefixes[longest]:
+                positions.setdefault(shorter, []).append(start)
+        for found in positions.values():
+            found.sort()
+        return positions
+
+    # @brief Mencari beberapa pola sekaligus dalam satu teks
+    # @param text: Teks yang akan dicari
+    # @param patterns: List pola yang akan dicocokkan
+    # @return: Dictionary yang isinya <pola, <'positions', 'count'>>. Kalau kosong ya kosong.
+    def search_multiple(self, text: str, patterns: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not text or not patterns:
+            return {}
+        return self.search_multiple_normalized(text.lower(), patterns)
+
+    # @brief Mencari beberapa pola dalam teks yang sudah lowercase (misal dari CorpusStore)
+    # @param text: Teks yang sudah lowercase
+    # @param patterns: List pola yang akan dicocokkan
+    # @return: Dictionary yang isinya <pola, <'positions', 'count'>>. Kalau kosong ya kosong.
+    def search_multiple_normalized(self, text: str, patterns: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not text or not patterns:
+            return {}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        if self.multi_mode == 'regex':
+            compiled = self.compile_patterns(patterns)
+            if compiled is None:
+                return {}
+            positions = self._regex_positions(text, compiled)
+            for lower, originals in compiled[2].items():
+                if lower in positions:
+                    for pattern in originals:
+                        results[pattern] = {'positions': list(positions[lower]), 'count': len(positions[lower])}
+            return results
+
+        for pattern in patterns:
+            positions = self.search_normalized(text, pattern.lower())
+            if positions:
+                results[pattern] = {'positions': positions, 'count': len(positions)}
+        return results
+
+    # @brief Versi count-only dari search_multiple
+    # @param text: Teks yang akan dicari
+    # @param patterns: List pola yang akan dihitung
+    # @return: Dictionary <pola, jumlah>. Pola yang gak ketemu gak dimasukkan.
+    def count_multiple(self, text: str, patterns: List[str]) -> Dict[str, int]:
+        if not text or not patterns:
+            return {}
+        return self.count_multiple_normalized(text.lower(), patterns)
+
+    # @brief Versi count-only untuk teks yang sudah lowercase
+    # @param text: Teks yang sudah lowercase
+    # @param patterns: List pola yang akan dihitung
+    # @return: Dictionary <pola, jumlah>. Pola yang gak ketemu gak dimasukkan.
+    def count_multiple_normalized(self, text: str, patterns: List[str]) -> Dict[str, int]:
+        if not text or not patterns:
+            return {}
+
+        counts: Dict[str, int] = {}
+        if self.multi_mode == 'regex':
+            compiled = self.compile_patterns(patterns)
+            if compiled is None:
+                return {}
+            positions = self._regex_positions(text, compiled)
+            for lower, originals in compiled[2].items():
+                if lower in positions:
+                    for pattern in originals:
+                        counts[pattern] = len(positions[lower])
+            return counts
+
+        for pattern in patterns:
+            count = self.count_normalized(text, pattern.lower())
+            if count:
+                counts[pattern] = count
+        return counts
+
+    # @brief Menghitung kemunculan keyword CompiledQuery
+    # @param text: Teks yang sudah lowercase
+    # @param query: CompiledQuery hasil compile_query(keywords, "NATIVE")
+    # @param entries: Subset query.entries yang mau dicari (misal hasil prefilter), None = semua
+    # @return: Dictionary <keyword, jumlah>. Keyword yang gak ketemu gak dimasukkan.
+    def count_query(self, text: str, query, entries=None) -> Dict[str, int]:
+        if query.automaton is not None:  # mode 'regex', alternation sudah di-compile
+            positions = self._regex_positions(text, query.automaton)
+            return {keyword: len(positions[pattern]) for keyword, pattern, _ in query.entries if pattern in positions}
+        counts: Dict[str, int] = {}
+        for keyword, pattern, _ in (query.entries if entries is None else entries):
+            count = self.count_normalized(text, pattern)
+            if count:
+                counts[keyword] = count
+        return counts
+
+    # @brief Mencari posisi keyword CompiledQuery
+    # @param text: Teks yang sudah lowercase
+    # @param query: CompiledQuery hasil compile_query(keywords, "NATIVE")
+    # @return: Dictionary yang isinya <keyword, <'positions', 'count'>>
+    def search_query(self, text: str, query) -> Dict[str, Dict[str, Any]]:
+        if query.automaton is not None:
+            positions = self._regex_positions(text, query.automaton)
+            return {
+                keyword: {'positions': list(positions[pattern]), 'count': len(positions[pattern])}
+                for keyword, pattern, _ in query.entries if pattern in positions
+            }
+        results: Dict[str, Dict[str, Any]] = {}
+        for keyword, pattern, _ in query.entries:
+            positions = self.search_normalized(text, pattern)
+            if positions:
+                results[keyword] = {'positions': positions, 'count': len(positions)}
+        return results
+
+    # @brief Membersihkan cache regex
+    # @return: None
+    def clear_cache(self):
+        self._regex_cache.clear()
@@ -0,0 +1,100 @@
+##########################################################################
+##########################################################################
+## @file query.py
+## Ini isinya CompiledQuery: hasil preprocessing keyword yang dikerjakan
+## sekali per query (lowercase, LPS KMP, tabel BM, automaton AC, tabel
+## Wu-Manber), lalu dipakai ulang untuk semua CV. Engine nerima objek ini
+## lewat count_query / search_query, jadi kerja per CV tinggal scan.
+## Objeknya immutable dan bisa di-pickle, jadi aman dibagi antar thread
+## maupun dikirim ke proses lain. Dengan encoding, polanya jadi bytes
+## supaya bisa scan teks di mmap (lihat corpus/mmap_corpus.py).
+##########################################################################
+##########################################################################
+
+from typing import List, Tuple, Any, Optional
+
+from algorithms.kmp import KMP
+from algorithms.boyer_moore import BoyerMoore
+from algorithms.aho_corasick import AhoCorasick
+from algorithms.wu_manber import WuManber
+from algorithms.native import NativeSearch
+
+ENGINES = {
+    'KMP': KMP,
+    'BM': BoyerMoore,
+    'AC': AhoCorasick,
+    'WM': WuManber,
+    'NATIVE': NativeSearch,
+}
+
+class CompiledQuery:
+    __slots__ = ['algorithm', 'entries', 'automaton', 'keywords']
+
+    # @param algorithm: Kode algoritma yang dipakai waktu compile
+    # @param entries: Tuple (keyword asli, pola lowercase, tabel per pola atau None)
+    # @param automaton: Struktur bersama untuk semua pola (automaton AC, tabel WM, regex native), atau None
+    def __init__(self, algorithm: str, entries: Tuple[Tuple[str, str, Any], ...], automaton: Any = None):
+        object.__setattr__(self, 'algorithm', algorithm)
+        object.__setattr__(self, 'entries', tuple(entries))
+        object.__setattr__(self, 'automaton', automaton)
+        object.__setattr__(self, 'keywords', tuple(entry[0] for entry in self.entries))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledQuery is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("CompiledQuery is immutable")
+
+    def __reduce__(self):
+        # trie AC di-pickle sebagai tabel datar: pickle Node langsung rekursif per karakter
+        # dan kena RecursionError untuk keyword panjang
+        if isinstance(self.automaton, AhoCorasick.Node):
+            return (_restore_ac_query, (self.algorithm, self.entries, AhoCorasick().export_automaton(self.automaton)))
+        return (CompiledQuery, (self.algorithm, self.entries, self.automaton))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"CompiledQuery({self.algorithm!r}, {list(self.keywords)!r})"
+
+# @brief Membangun ulang CompiledQuery AC hasil unpickle dari tabel automaton datar
+# @param algorithm: Kode algoritma
+# @param entries: Entry query
+# @param table: Hasil AhoCorasick.export_automaton
+# @return: CompiledQuery
+def _restore_ac_query(algorithm: str, entries, table) -> CompiledQuery:
+    return CompiledQuery(algorithm, entries, AhoCorasick().import_automaton(table))
+
+# @brief Preprocess keyword sekali untuk algoritma tertentu
+# @param keywords: List keyword (case asli; duplikat & string kosong dibuang)
+# @param algorithm: "KMP", "BM", "AC", "WM", atau "NATIVE" (lainnya diperlakukan kayak "NATIVE")
+# @param engine: Instance engine yang cache tabelnya mau dipakai ulang (opsional)
+# @param encoding: Kalau diisi, pola di-encode jadi bytes (mode bytes, buat teks di mmap/memoryview).
+#                  Cuma KMP, AC, dan NATIVE mode 'find' yang bisa scan bytes.
+# @return: CompiledQuery
+def compile_query(keywords: List[str], algorithm: str, engine: Optional[Any] = None, encoding: Optional[str] = None) -> CompiledQuery:
+    if engine is None:
+        engine = ENGINES.get(algorithm, NativeSearch)()
+
+    unique = [keyword for keyword in dict.fromkeys(keywords) if keyword]
+    patterns = [keyword.lower() for keyword in unique]
+    if encoding is not None:
+        if isinstance(engine, (BoyerMoore, WuManber)) or (isinstance(engine, NativeSearch) and engine.multi_mode == 'regex'):
+            raise ValueError("bytes mode only supports KMP, AC and NATIVE ('find')")
+        patterns = [pattern.encode(encoding) for pattern in patterns]
+
+    automaton = None
+    if isinstance(engine, AhoCorasick):
+        automaton = engine.build_automaton(patterns) if patterns else None
+    elif isinstance(engine, WuManber):
+        automaton = engine.build_tables(unique) if unique else None
+    elif isinstance(engine, NativeSearch) and engine.multi_mode == 'regex':
+        automaton = engine.compile_patterns(unique) if unique else None
+
+    if hasattr(engine, 'compile_pattern'):
+        tables = [engine.compile_pattern(pattern) for pattern in patterns]
+    else:
+        tables = [None] * len(patterns)
+
+    return CompiledQuery(algorithm, zip(unique, patterns, tables), automaton)
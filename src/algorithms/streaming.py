@@ -0,0 +1,192 @@
+##########################################################################
+##########################################################################
+## @file streaming.py
+## Ini isinya matcher streaming: teks gak perlu utuh jadi satu str, tapi
+## bisa disuapin per potongan (per halaman PDF, per blok file besar)
+## lewat feed(chunk), lalu finish() buat ambil hasil akhirnya.
+## State dibawa antar potongan, jadi match yang kepotong di batas chunk
+## tetap ketemu:
+##   KMP          -> nilai j (panjang prefix yang sudah cocok) per pola
+##   Aho-Corasick -> node automaton saat ini
+##   Boyer-Moore  -> buffer m-1 karakter terakhir dari chunk sebelumnya
+## Semua posisi yang dilaporkan adalah offset absolut di teks gabungan
+## (yang sudah lowercase), sama persis dengan hasil search_multiple.
+## Offset itu relatif ke teks yang disuapin: untuk PDF (PDFExtractor.
+## stream_search_pdf / extract_text_from_pdf(matcher=...)) artinya teks
+## mentah per halaman, SEBELUM clean_text, jadi gak sejajar dengan
+## cv['text'] / CVSearcher.match_positions.
+##########################################################################
+##########################################################################
+
+from typing import List, Dict, Any, Iterable
+
+from algorithms.kmp import KMP
+from algorithms.boyer_moore import BoyerMoore
+from algorithms.aho_corasick import AhoCorasick
+
+class StreamingMatcher:
+    # @param patterns: List pola (case asli; duplikat & string kosong dibuang)
+    def __init__(self, patterns: List[str]):
+        self.patterns = [pattern for pattern in dict.fromkeys(patterns) if pattern]
+        self._lower_to_originals: Dict[str, List[str]] = {}
+        for pattern in self.patterns:
+            self._lower_to_originals.setdefault(pattern.lower(), []).append(pattern)
+        self.reset()
+
+    # @brief Mengembalikan matcher ke kondisi awal (offset 0, tanpa hasil)
+    # @return: None
+    def reset(self) -> None:
+        self.offset = 0
+        self._positions: Dict[str, List[int]] = {lower: [] for lower in self._lower_to_originals}
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        pass
+
+    # @brief Scan satu chunk yang sudah lowercase, offset chunk = self.offset
+    # @param text: Chunk yang sudah lowercase
+    # @return: Dictionary <pola lowercase, list posisi absolut baru>
+    def _feed_normalized(self, text: str) -> Dict[str, List[int]]:
+        raise NotImplementedError
+
+    # @brief Menyuapkan potongan teks berikutnya
+    # @param chunk: Potongan teks (case asli)
+    # @return: Dictionary <pola, list posisi absolut yang baru ketemu di chunk ini>
+    def feed(self, chunk: str) -> Dict[str, List[int]]:
+        if not chunk or not self._lower_to_originals:
+            return {}
+        text = chunk.lower()
+        new_positions = self._feed_normalized(text)
+        self.offset += len(text)
+
+        found = {}
+        for lower, positions in new_positions.items():
+            if positions:
+                self._positions[lower].extend(positions)
+                for pattern in self._lower_to_originals[lower]:
+                    found[pattern] = positions
+        return found
+
+    # @brief Menandai akhir teks dan mengambil hasil akhir
+    # @return: Dictionary <pola, <'positions', 'count'>>, format sama dengan search_multiple
+    def finish(self) -> Dict[str, Dict[str, Any]]:
+        results = {}
+        for pattern in self.patterns:
+            positions = self._positions[pattern.lower()]
+            if positions:
+                results[pattern] = {'positions': list(positions), 'count': len(positions)}
+        return results
+
+class StreamingKMP(StreamingMatcher):
+    # @param patterns: List pola
+    # @param kmp: Instance KMP yang cache LPS-nya mau dipakai ulang (opsional)
+    def __init__(self, patterns: List[str], kmp: KMP = None):
+        self._kmp = kmp or KMP()
+        super().__init__(patterns)
+        self._lps = {lower: self._kmp._compute_lps(lower) for lower in self._lower_to_originals}
+
+    def _reset_state(self) -> None:
+        self._j = {lower: 0 for lower in self._lower_to_originals}
+
+    def _feed_normalized(self, text: str) -> Dict[str, List[int]]:
+        new_positions = {}
+        for pattern, lps in self._lps.items():
+            m = len(pattern)
+            j = self._j[pattern]
+            positions = []
+            for i, char in enumerate(text):
+                while j > 0 and char != pattern[j]:
+                    j = lps[j - 1]
+                if char == pattern[j]:
+                    j += 1
+                    if j == m:
+                        positions.append(self.offset + i - m + 1)
+                        j = lps[j - 1]
+            self._j[pattern] = j
+            new_positions[pattern] = positions
+        return new_positions
+
+class StreamingAhoCorasick(StreamingMatcher):
+    # @param patterns: List pola
+    # @param aho_corasick: Instance AhoCorasick yang cache automaton-nya mau dipakai ulang (opsional)
+    def __init__(self, patterns: List[str], aho_corasick: AhoCorasick = None):
+        self._aho_corasick = aho_corasick or AhoCorasick()
+        super().__init__(patterns)
+        self._root = self._aho_corasick.build_automaton(list(self._lower_to_originals)) if self._lower_to_originals else None
+        self._current = self._root
+
+    def _reset_state(self) -> None:
+        self._current = getattr(self, '_root', None)
+
+    def _feed_normalized(self, text: str) -> Dict[str, List[int]]:
+        new_positions = {lower: [] for lower in self._lower_to_originals}
+        root = self._root
+        current = self._current
+        offset = self.offset
+
+        for i, char in enumerate(text):
+            while current and char not in current.children:
+                current = current.failure
+            current = current.children[char] if current else root
+
+            for _, pattern in current.output:
+                new_positions[pattern].append(offset + i - len(pattern) + 1)
+
+        self._current = current
+        return new_positions
+
+class StreamingBoyerMoore(StreamingMatcher):
+    # @param patterns: List pola
+    # @param boyer_moore: Instance BoyerMoore yang cache tabelnya mau dipakai ulang (opsional)
+    def __init__(self, patterns: List[str], boyer_moore: BoyerMoore = None):
+        self._boyer_moore = boyer_moore or BoyerMoore()
+        super().__init__(patterns)
+        self._compiled = {lower: self._boyer_moore.compile_pattern(lower) for lower in self._lower_to_originals}
+        self._overlap = max((len(lower) for lower in self._lower_to_originals), default=1) - 1
+
+    def _reset_state(self) -> None:
+        self._tail = ""
+
+    def _feed_normalized(self, text: str) -> Dict[str, List[int]]:
+        # window = sisa chunk sebelumnya + chunk ini; match yang berakhir di dalam tail
+        # sudah dilaporkan di feed sebelumnya, jadi cuma yang berakhir di chunk ini yang diambil
+        window = self._tail + text
+        tail_len = len(self._tail)
+        base = self.offset - tail_len
+
+        new_positions = {}
+        for pattern, compiled in self._compiled.items():
+            m = len(pattern)
+            new_positions[pattern] = [
+                base + pos
+                for pos in self._boyer_moore.search_normalized(window, pattern, compiled)
+                if pos + m > tail_len
+            ]
+
+        self._tail = window[-self._overlap:] if self._overlap else ""
+        return new_positions
+
+STREAMING_MATCHERS = {
+    'KMP': StreamingKMP,
+    'BM': StreamingBoyerMoore,
+    'AC': StreamingAhoCorasick,
+}
+
+# @brief Menjalankan matcher di atas potongan-potongan teks
+# @param chunks: Iterable potongan teks (misal halaman PDF)
+# @param matcher: Instance StreamingMatcher (baru atau sudah di-reset)
+# @return: Hasil matcher.finish()
+def stream_search(chunks: Iterable[str], matcher: StreamingMatcher) -> Dict[str, Dict[str, Any]]:
+    for chunk in chunks:
+        matcher.feed(chunk)
+    return matcher.finish()
+
+# @brief Mencari di file teks yang terlalu besar untuk dibaca sekaligus
+# @param path: Path file teks
+# @param matcher: Instance StreamingMatcher
+# @param chunk_size: Banyak karakter per potongan
+# @param encoding: Encoding file
+# @return: Hasil matcher.finish()
+def stream_search_file(path: str, matcher: StreamingMatcher, chunk_size: int = 1 << 20, encoding: str = 'utf-8') -> Dict[str, Dict[str, Any]]:
+    with open(path, 'r', encoding=encoding, errors='ignore') as f:
+        return stream_search(iter(lambda: f.read(chunk_size), ''), matcher)
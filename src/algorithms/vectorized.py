@@ -0,0 +1,147 @@
+##########################################################################
+##########################################################################
+## @file vectorized.py
+## Ini isinya engine exact match berbasis NumPy (opsional). Semua teks CV
+## yang sudah lowercase digabung jadi satu buffer kontigu (uint8 kalau
+## korpusnya muat di latin-1, selain itu uint32 per code point), dipisah
+## separator, plus array offsets awal tiap CV.
+##
+## Per keyword: kandidat diambil dari karakter paling jarang di keyword
+## (rare anchor), disaring pakai mask karakter pertama/terakhir, lalu
+## diverifikasi per karakter secara vektor. Hit dipetakan balik ke index
+## CV pakai searchsorted, jadi satu query = satu pass di seluruh korpus.
+##########################################################################
+##########################################################################
+
+from typing import List, Dict, Any, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy gak wajib, engine ini cuma gak bisa dipakai
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+class VectorizedSearch:
+    def __init__(self):
+        if np is None:
+            raise ImportError("VectorizedSearch needs numpy (pip install numpy)")
+        self.name = "NumPy"
+        self._buffer = None
+        self._offsets = None
+        self._separator = 0
+        self._frequency: Dict[int, int] = {}
+        self._cv_count = 0
+
+    # @brief Menggabungkan semua teks CV (sudah lowercase) ke satu buffer
+    # @param texts: Teks ternormalisasi sesuai urutan cv_data (misal CorpusStore.texts)
+    # @return: None
+    def build(self, texts: List[str]) -> None:
+        texts = list(texts)
+        self._cv_count = len(texts)
+
+        lengths = np.fromiter((len(text) + 1 for text in texts), dtype=np.int64, count=len(texts))
+        self._offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self._offsets[1:])
+
+        joined = '\x00'.join(texts)
+        self._buffer = None
+        if joined.count('\x00') == max(len(texts) - 1, 0):  # NUL cuma ada di separator
+            try:
+                self._buffer = np.frombuffer(joined.encode('latin-1'), dtype=np.uint8)
+                self._separator = 0
+            except UnicodeEncodeError:
+                pass
+
+        if self._buffer is None:
+            # U+FFFFFFFF bukan code point yang valid, jadi aman jadi separator
+            self._buffer = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32).copy()
+            self._separator = 0xFFFFFFFF
+            self._buffer[self._offsets[1:-1] - 1] = self._separator
+
+        values, counts = np.unique(self._buffer, return_counts=True)
+        self._frequency = dict(zip(values.tolist(), counts.tolist()))
+
+    # @brief Mengubah pola (sudah lowercase) jadi array code point sesuai dtype buffer
+    # @param pattern: Pola yang sudah lowercase
+    # @return: Array code point, atau None kalau pola pasti gak ada di korpus
+    def _encode_pattern(self, pattern: str) -> Optional["np.ndarray"]:
+        codes = [ord(c) for c in pattern]
+        if self._separator in codes:
+            return None
+        if self._buffer.dtype == np.uint8 and max(codes) > 0xFF:
+            return None
+        return np.array(codes, dtype=self._buffer.dtype)
+
+    # @brief Mencari semua posisi global pola di buffer secara vektor
+    # @param pattern: Pola yang sudah lowercase
+    # @return: Array posisi awal di buffer (urut, overlap ikut)
+    def _global_positions(self, pattern: str) -> "np.ndarray":
+        empty = np.zeros(0, dtype=np.int64)
+        if not pattern or self._buffer is None or len(self._buffer) == 0:
+            return empty
+        codes = self._encode_pattern(pattern)
+        if codes is None:
+            return empty
+
+        buf = self._buffer
+        m = len(codes)
+        frequency = self._frequency
+        if any(int(c) not in frequency for c in codes):
+            return empty
+
+        # Anchor = karakter paling jarang di pola, kandidat awal = posisinya dikurangi offset anchor
+        anchor = min(range(m), key=lambda j: frequency[int(codes[j])])
+        starts = np.flatnonzero(buf == codes[anchor]) - anchor
+        starts = starts[(starts >= 0) & (starts <= len(buf) - m)]
+
+        # Saring pakai karakter pertama & terakhir dulu, baru sisanya (urut dari yang paling jarang)
+        order = sorted(set(range(m)) - {anchor}, key=lambda j: (j not in (0, m - 1), frequency[int(codes[j])]))
+        for j in order:
+            if len(starts) == 0:
+                break
+            starts = starts[buf[starts + j] == codes[j]]
+        return starts
+
+    # @brief Menghitung kemunculan tiap keyword di seluruh korpus dalam satu pass per keyword
+    # @param patterns: List keyword (case asli)
+    # @return: Dictionary <index CV, <keyword, jumlah>>, format sama dengan CVSearcher.exact_match
+    def count_corpus(self, patterns: List[str]) -> Dict[int, Dict[str, int]]:
+        results: Dict[int, Dict[str, int]] = {}
+        if not patterns or self._buffer is None:
+            return results
+
+        per_pattern = []
+        for pattern in patterns:
+            starts = self._global_positions(pattern.lower())
+            if len(starts) == 0:
+                continue
+            cv_ids = np.searchsorted(self._offsets, starts, side='right') - 1
+            counts = np.bincount(cv_ids, minlength=self._cv_count)
+            per_pattern.append((pattern, counts))
+
+        if not per_pattern:
+            return results
+
+        # Susun per CV dengan urutan keyword yang sama kayak count_multiple_normalized
+        matrix = np.vstack([counts for _, counts in per_pattern])
+        for i in np.flatnonzero(matrix.any(axis=0)).tolist():
+            column = matrix[:, i].tolist()
+            results[i] = {pattern: n for (pattern, _), n in zip(per_pattern, column) if n}
+        return results
+
+    # @brief Mencari posisi keyword di satu CV yang ada di buffer
+    # @param index: Index CV
+    # @param patterns: List keyword (case asli)
+    # @return: Dictionary yang isinya <pola, <'positions', 'count'>>
+    def search_cv(self, index: int, patterns: List[str]) -> Dict[str, Dict[str, Any]]:
+        results: Dict[str, Dict[str, Any]] = {}
+        if self._buffer is None:
+            return results
+        begin, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        for pattern in patterns:
+            starts = self._global_positions(pattern.lower())
+            local = starts[(starts >= begin) & (starts < end)] - begin
+            if len(local):
+                results[pattern] = {'positions': local.tolist(), 'count': len(local)}
+        return results
@@ -0,0 +1,200 @@
+##########################################################################
+##########################################################################
+## @file wu_manber.py
+## Ini isinya algoritma Wu-Manber buat nyari banyak pola sekaligus.
+## Beda sama KMP/BM yang scan ulang teks per keyword, dan Aho-Corasick
+## yang ngunjungin tiap karakter, Wu-Manber geser window per blok
+## karakter (default 2) sejauh mungkin, jadi untuk query 5-30 keyword
+## yang panjangnya >= 4 karakter kebanyakan posisi teks dilompati.
+##########################################################################
+##########################################################################
+
+from typing import List, Dict, Tuple, Any
+
+from utils.cache import BoundedCache
+
+class WuManber:
+    # @param block_size: Panjang blok karakter yang dipakai buat tabel SHIFT (dipotong ke panjang pola terpendek)
+    # @param cache_limit: Jumlah maksimum set tabel yang disimpan
+    # @param cache_bytes: Perkiraan ukuran maksimum cache tabel dalam byte
+    def __init__(self, block_size: int = 2, cache_limit: int = 64, cache_bytes: int = 16 * 1024 * 1024):
+        self.name = "Wu-Manber"
+        self.block_size = block_size
+        self._table_cache = BoundedCache(cache_limit, cache_bytes, name="wm_tables") # biar gak recompute yg udh ada
+
+    # @brief Membangun tabel SHIFT dan HASH dari sekumpulan pola
+    # @details Semua pola dipotong ke panjang pola terpendek (m). Blok di ujung window
+    #          yang shift-nya 0 dicek ke HASH, lalu kandidatnya diverifikasi pakai startswith.
+    # @param patterns: List pola (case asli, nanti di-lowercase)
+    # @return: Tuple (m, block, tabel shift, shift default, tabel hash, map lowercase -> list pola asli),
+    #          atau None kalau gaada pola yang valid
+    def build_tables(self, patterns: List[str]) -> Tuple:
+        patterns_key = frozenset(patterns)
+        cached = self._table_cache.get(patterns_key)
+        if cached is not None:
+            return cached
+
+        lower_to_originals: Dict[str, List[str]] = {}
+        for pattern in dict.fromkeys(patterns):
+            if not pattern:
+                continue
+            lower_to_originals.setdefault(pattern.lower(), []).append(pattern)
+        if not lower_to_originals:
+            return None
+
+        m = min(len(lower) for lower in lower_to_originals)
+        block = max(1, min(self.block_size, m))
+        default_shift = m - block + 1
+
+        shift: Dict[str, int] = {}
+        hash_table: Dict[str, List[str]] = {}
+        for lower in lower_to_originals:
+            for q in range(block, m + 1):
+                key = lower[q - block:q]
+                distance = m - q
+                if distance < shift.get(key, default_shift):
+                    shift[key] = distance
+            hash_table.setdefault(lower[m - block:m], []).append(lower)
+
+        tables = (m, block, shift, default_shift, hash_table, lower_to_originals)
+        self._table_cache.put(patterns_key, tables)
+        return tables
+
+    # @brief Scan utama Wu-Manber, dipakai bareng oleh versi search dan count
+    # @param text: Teks yang sudah lowercase
+    # @param tables: Hasil build_tables
+    # @param positions: Dict lowercase -> list posisi (diisi kalau bukan None)
+    # @return: Dictionary <pola lowercase, jumlah kemunculan>
+    def _scan(self, text: str, tables: Tuple, positions: Dict[str, List[int]] = None) -> Dict[str, int]:
+        m, block, shift, default_shift, hash_table, _ = tables
+        shift_get = shift.get
+        n = len(text)
+        counts: Dict[str, int] = {}
+
+        pos = m - 1
+        while pos < n:
+            key = text[pos - block + 1:pos + 1]
+            distance = shift_get(key, default_shift)
+            if distance:
+                pos += distance
+                continue
+
+            start = pos - m + 1
+            for lower in hash_table[key]:
+                if text.startswith(lower, start):
+                    counts[lower] = counts.get(lower, 0) + 1
+                    if positions is not None:
+                        positions.setdefault(lower, []).append(start)
+            pos += 1
+
+        return counts
+
+    # @brief Mencari satu pola dalam teks (untuk kompatibilitas dengan algoritma lain)
+    # @param text: Teks yang akan dicari
+    # @param pattern: Pola yang akan dicocokkan
+    # @return: List berisi semua posisi awal ditemukannya pola, kalau gaada ya kosong
+    def search(self, text: str, pattern: str) -> List[int]:
+        results = self.search_multiple(text, [pattern])
+        if pattern in results:
+            return results[pattern]['positions']
+        return []
+
+    # @brief Mencari beberapa pola sekaligus dalam satu kali scan
+    # @param text: Teks yang akan dicari
+    # @param patterns: List pola yang akan dicocokkan
+    # @return: Dictionary yang isinya <pola, <'positions', 'count'>>. Kalau kosong ya kosong.
+    def search_multiple(self, text: str, patterns: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not text or not patterns:
+            return {}
+        return self.search_multiple_normalized(text.lower(), patterns)
+
+    # @brief Versi search_multiple untuk teks yang sudah lowercase (misal dari CorpusStore)
+    # @param text: Teks yang sudah lowercase
+    # @param patterns: List pola yang akan dicocokkan
+    # @return: Dictionary yang isinya <pola, <'positions', 'count'>>. Kalau kosong ya kosong.
+    def search_multiple_normalized(self, text: str, patterns: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not text or not patterns:
+            return {}
+
+        tables = self.build_tables(patterns)
+        if tables is None:
+            return {}
+
+        positions: Dict[str, List[int]] = {}
+        self._scan(text, tables, positions)
+
+        results = {}
+        for lower, originals in tables[5].items():
+            if lower in positions:
+                for pattern in originals:
+                    results[pattern] = {
+                        'positions': list(positions[lower]),
+                        'count': len(positions[lower])
+                    }
+        return results
+
+    # @brief Menghitung jumlah kemunculan pola dalam teks
+    # @param text: Teks yang akan dicari
+    # @param pattern: Pola yang akan dihitung
+    # @return: Jumlah kemunculan pola
+    def count_occurrences(self, text: str, pattern: str) -> int:
+        return self.count_multiple(text, [pattern]).get(pattern, 0)
+
+    # @brief Versi count-only dari search_multiple, gak bikin list posisi
+    # @param text: Teks yang akan dicari
+    # @param patterns: List pola yang akan dihitung
+    # @return: Dictionary <pola, jumlah>. Pola yang gak ketemu gak dimasukkan.
+    def count_multiple(self, text: str, patterns: List[str]) -> Dict[str, int]:
+        if not text or not patterns:
+            return {}
+        return self.count_multiple_normalized(text.lower(), patterns)
+
+    # @brief Versi count-only untuk teks yang sudah lowercase
+    # @param text: Teks yang sudah lowercase
+    # @param patterns: List pola yang akan dihitung
+    # @return: Dictionary <pola, jumlah>. Pola yang gak ketemu gak dimasukkan.
+    def count_multiple_normalized(self, text: str, patterns: List[str]) -> Dict[str, int]:
+        if not text or not patterns:
+            return {}
+
+        tables = self.build_tables(patterns)
+        if tables is None:
+            return {}
+
+        lower_counts = self._scan(text, tables)
+        counts = {}
+        for lower, originals in tables[5].items():
+            if lower in lower_counts:
+                for pattern in originals:
+                    counts[pattern] = lower_counts[lower]
+        return counts
+
+    # @brief Menghitung kemunculan keyword CompiledQuery pakai tabel yang sudah dibangun
+    # @param text: Teks yang sudah lowercase
+    # @param query: CompiledQuery hasil compile_query(keywords, "WM")
+    # @param entries: Diabaikan, tabel selalu memuat semua keyword query
+    # @return: Dictionary <keyword, jumlah>. Keyword yang gak ketemu gak dimasukkan.
+    def count_query(self, text: str, query, entries=None) -> Dict[str, int]:
+        if not text or query.automaton is None:
+            return {}
+        counts = self._scan(text, query.automaton)
+        return {keyword: counts[pattern] for keyword, pattern, _ in query.entries if pattern in counts}
+
+    # @brief Mencari posisi keyword CompiledQuery
+    # @param text: Teks yang sudah lowercase
+    # @param query: CompiledQuery hasil compile_query(keywords, "WM")
+    # @return: Dictionary yang isinya <keyword, <'positions', 'count'>>
+    def search_query(self, text: str, query) -> Dict[str, Dict[str, Any]]:
+        if not text or query.automaton is None:
+            return {}
+        positions: Dict[str, List[int]] = {}
+        self._scan(text, query.automaton, positions)
+        return {
+            keyword: {'positions': list(positions[pattern]), 'count': len(positions[pattern])}
+            for keyword, pattern, _ in query.entries if pattern in positions
+        }
+
+    # @brief Membersihkan cache tabel
+    # @return: None
+    def clear_cache(self):
+        self._table_cache.clear()
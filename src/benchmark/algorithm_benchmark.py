@@ -0,0 +1,133 @@
+##########################################################################
+##########################################################################
+## @file algorithm_benchmark.py
+## Ini isinya benchmark matrix untuk tahap exact match saja:
+## algoritma (KMP, BM, AC, WM, NATIVE, NUMPY) x banyak keyword per query, di atas
+## teks CV sintetis yang langsung dibuat di memori (tanpa PDF dan database).
+## Tiap sel = rata-rata waktu CVSearcher.exact_match untuk satu query.
+##
+## Contoh:
+##   python src/benchmark/algorithm_benchmark.py --cvs 500 --keywords 1 5 15 30
+##########################################################################
+##########################################################################
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import List, Dict, Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.corpus_generator import CATEGORIES, SKILLS, FILLER, generate_cv_text
+from search.cv_searcher import CVSearcher
+
+DEFAULT_ALGORITHMS = ['KMP', 'BM', 'AC', 'WM', 'NATIVE', 'NUMPY']
+DEFAULT_KEYWORD_COUNTS = [1, 5, 15, 30]
+
+# @brief Membuat kumpulan keyword kandidat (skill + kata dari filler, minimal 4 karakter)
+# @return: List keyword unik
+def keyword_pool() -> List[str]:
+    words = list(SKILLS)
+    for sentence in FILLER:
+        words.extend(word.strip('.,') for word in sentence.split())
+    return [word for word in dict.fromkeys(words) if len(word) >= 4]
+
+# @brief Membuat query acak dengan banyak keyword tertentu
+# @param rng: Instance random.Random biar hasilnya deterministik
+# @param pool: Kumpulan keyword kandidat
+# @param count: Banyak keyword per query
+# @param queries: Banyak query
+# @return: List query (list keyword)
+def make_queries(rng: random.Random, pool: List[str], count: int, queries: int) -> List[List[str]]:
+    return [rng.sample(pool, min(count, len(pool))) for _ in range(queries)]
+
+# @brief Menjalankan matrix algoritma x banyak keyword
+# @param cvs: Banyak CV sintetis
+# @param algorithms: List kode algoritma ("KMP", "BM", "AC", "WM", "NATIVE", "NUMPY")
+# @param keyword_counts: List banyak keyword per query
+# @param queries: Banyak query per sel
+# @param seed: Seed random
+# @param paragraphs: Banyak blok pengalaman per CV
+# @return: Report berisi meta dan matrix <algoritma, <banyak keyword, detik per query>>
+def run_matrix(cvs: int, algorithms: List[str], keyword_counts: List[int], queries: int = 5, seed: int = 2025, paragraphs: int = 6, workers: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    cv_data = []
+    for i in range(cvs):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        cv_data.append({
+            'path': f"{category}/{10000000 + i}.pdf",
+            'filename': f"{10000000 + i}.pdf",
+            'category': category,
+            'text': generate_cv_text(rng, category, paragraphs)
+        })
+
+    searcher = CVSearcher()
+    searcher.set_cv_data(cv_data)
+    if workers > 1:
+        searcher.enable_parallel(workers, min_cvs=0)
+
+    pool = keyword_pool()
+    query_sets = {count: make_queries(rng, pool, count, queries) for count in keyword_counts}
+
+    report = {
+        'meta': {
+            'cvs': cvs,
+            'corpus_chars': sum(len(cv['text']) for cv in cv_data),
+            'queries_per_cell': queries,
+            'seed': seed,
+            'workers': workers
+        },
+        'matrix': {}
+    }
+
+    for algorithm in algorithms:
+        searcher.set_algorithm(algorithm)
+        row = {}
+        for count, query_set in query_sets.items():
+            start = time.perf_counter()
+            for keywords in query_set:
+                searcher.exact_match(keywords)
+            row[str(count)] = (time.perf_counter() - start) / len(query_set)
+        report['matrix'][algorithm] = row
+
+    searcher.close()
+    return report
+
+# @brief Mencetak matrix dalam bentuk tabel (ms per query)
+# @param report: Report hasil run_matrix
+# @return: None
+def print_matrix(report: Dict[str, Any]) -> None:
+    meta = report['meta']
+    columns = next(iter(report['matrix'].values()), {}).keys()
+    print(f"\n=== Algorithm Benchmark: {meta['cvs']} CVs, {meta['corpus_chars']} chars (ms/query) ===")
+    print(f"{'algorithm':<12}" + ''.join(f"{f'{c} kw':>12}" for c in columns))
+    for algorithm, row in report['matrix'].items():
+        print(f"{algorithm:<12}" + ''.join(f"{row[c] * 1000:>12.2f}" for c in columns))
+    print("========================\n")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Exact-match algorithm benchmark matrix")
+    parser.add_argument('--cvs', type=int, default=300, help="Banyak CV sintetis yang dibuat")
+    parser.add_argument('--paragraphs', type=int, default=6, help="Banyak blok pengalaman per CV")
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--algorithms', nargs='+', default=DEFAULT_ALGORITHMS)
+    parser.add_argument('--keywords', type=int, nargs='+', default=DEFAULT_KEYWORD_COUNTS, help="Banyak keyword per query")
+    parser.add_argument('--queries', type=int, default=5, help="Banyak query per sel")
+    parser.add_argument('--workers', type=int, default=0, help="Jumlah proses worker exact match (0/1 = sekuensial)")
+    parser.add_argument('--output', help="Simpan report sebagai JSON")
+    args = parser.parse_args(argv)
+
+    report = run_matrix(args.cvs, args.algorithms, args.keywords, args.queries, args.seed, args.paragraphs, args.workers)
+    print_matrix(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
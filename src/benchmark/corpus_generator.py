@@ -0,0 +1,143 @@
+##########################################################################
+##########################################################################
+## @file corpus_generator.py
+## Ini isinya generator korpus CV sintetis (teks + PDF) buat benchmark.
+## PDF-nya ditulis manual (tanpa library tambahan) pakai font Helvetica
+## bawaan, jadi bisa dibaca PyPDF2 persis kayak CV beneran.
+##########################################################################
+##########################################################################
+
+import os
+import random
+from typing import List, Dict
+
+CATEGORIES = ['ACCOUNTANT', 'ENGINEERING', 'HR', 'INFORMATION-TECHNOLOGY', 'DESIGNER', 'SALES']
+
+FIRST_NAMES = ['JOHN', 'JANE', 'MICHAEL', 'SARAH', 'DAVID', 'EMMA', 'ROBERT', 'LISA', 'JAMES', 'MARY']
+LAST_NAMES = ['SMITH', 'JOHNSON', 'WILLIAMS', 'BROWN', 'JONES', 'GARCIA', 'MILLER', 'DAVIS', 'MARTINEZ', 'ANDERSON']
+
+SKILLS = [
+    'Python', 'Java', 'JavaScript', 'React', 'Express', 'HTML', 'CSS', 'SQL', 'MySQL', 'Excel',
+    'Accounting', 'Auditing', 'Payroll', 'Recruitment', 'Project Management', 'Leadership',
+    'Communication', 'Negotiation', 'Photoshop', 'Illustrator', 'Figma', 'AutoCAD', 'Docker',
+    'Kubernetes', 'Machine Learning', 'Data Analysis', 'Customer Service', 'Marketing', 'Budgeting'
+]
+
+FILLER = [
+    'Responsible for coordinating cross-functional teams and delivering quarterly results.',
+    'Improved reporting accuracy and reduced processing time through automation.',
+    'Managed client relationships and prepared detailed financial statements.',
+    'Collaborated with stakeholders to define requirements and track deliverables.',
+    'Designed and maintained internal tools used by the management team.',
+    'Trained new staff members and documented standard operating procedures.',
+    'Analyzed monthly performance data and presented findings to senior management.',
+]
+
+DEGREES = ['Bachelor of Science', 'Master of Business Administration', 'Bachelor of Arts', 'Diploma']
+COMPANIES = ['Company Name', 'Acme Corp', 'Globex', 'Initech', 'Umbrella Inc', 'Stark Industries']
+
+# @brief Membuat teks CV sintetis
+# @param rng: Instance random.Random biar hasilnya deterministik
+# @param category: Kategori/role CV
+# @param paragraphs: Banyak blok pengalaman kerja
+# @return: Teks CV (ASCII) dengan format mirip CV di dataset
+def generate_cv_text(rng: random.Random, category: str, paragraphs: int = 6) -> str:
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        category.replace('-', ' '),
+        f"{name.lower().replace(' ', '.')}@example.com",
+        f"{rng.randint(200, 999)}-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        '',
+        'Summary',
+        f"{category.title()} with {rng.randint(1, 20)} years of experience. " + rng.choice(FILLER),
+        '',
+        'Skills',
+        ', '.join(rng.sample(SKILLS, rng.randint(5, 12))),
+        '',
+        'Experience',
+    ]
+    for _ in range(paragraphs):
+        start_year = rng.randint(1995, 2020)
+        lines.append(f"{rng.choice(['Jan', 'Mar', 'Jun', 'Sep'])} {start_year} to {rng.choice(['Current', str(start_year + rng.randint(1, 4))])}")
+        lines.append(f"{category.title()} {rng.choice(COMPANIES)}")
+        for _ in range(rng.randint(2, 5)):
+            sentence = rng.choice(FILLER)
+            if rng.random() < 0.5:
+                sentence += f" Used {rng.choice(SKILLS)} and {rng.choice(SKILLS)} daily."
+            lines.append(sentence)
+        lines.append('')
+    lines.extend([
+        'Education',
+        f"{rng.choice(DEGREES)} {rng.randint(1990, 2020)} State University",
+    ])
+    return '\n'.join(lines)
+
+# @brief Escape karakter spesial untuk literal string PDF
+# @param line: Satu baris teks
+# @return: Baris yang aman dimasukkan ke dalam (...) di content stream
+def _escape_pdf_string(line: str) -> str:
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+# @brief Menulis teks ke file PDF minimal (Helvetica, beberapa halaman)
+# @param path: Path file PDF tujuan
+# @param text: Teks yang mau ditulis, dipisah per baris
+# @param lines_per_page: Banyak baris per halaman
+# @return: None
+def write_text_pdf(path: str, text: str, lines_per_page: int = 50) -> None:
+    lines = text.split('\n')
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    # objek 1 = catalog, 2 = pages, 3 = font, lalu pasangan (page, content) per halaman
+    objects: List[bytes] = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = ' '.join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode('latin-1'))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for page_id, page_lines in zip(page_ids, pages):
+        ops = ["BT", "/F1 10 Tf", "12 TL", "50 760 Td"]
+        for line in page_lines:
+            ops.append(f"({_escape_pdf_string(line)}) Tj T*")
+        ops.append("ET")
+        stream = '\n'.join(ops).encode('latin-1', errors='replace')
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>".encode('latin-1')
+        )
+        objects.append(b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_offset = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n".encode()
+    out += b"0000000000 65535 f \n"
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+
+    with open(path, 'wb') as f:
+        f.write(out)
+
+# @brief Membuat korpus PDF sintetis dengan struktur <directory>/<KATEGORI>/<id>.pdf
+# @param directory: Folder tujuan (setara data/data di aplikasi)
+# @param count: Total CV yang dibuat
+# @param seed: Seed random biar korpusnya selalu sama
+# @param paragraphs: Banyak blok pengalaman per CV (ngatur panjang teks)
+# @return: List dict {'path', 'category', 'filename'} untuk setiap PDF
+def generate_pdf_corpus(directory: str, count: int, seed: int = 2025, paragraphs: int = 6) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    generated = []
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        category_dir = os.path.join(directory, category)
+        os.makedirs(category_dir, exist_ok=True)
+        filename = f"{10000000 + i}.pdf"
+        path = os.path.join(category_dir, filename)
+        write_text_pdf(path, generate_cv_text(rng, category, paragraphs))
+        generated.append({'path': path, 'category': category, 'filename': filename})
+    return generated
@@ -0,0 +1,279 @@
+##########################################################################
+##########################################################################
+## @file pipeline_benchmark.py
+## Ini isinya benchmark end-to-end tanpa GUI untuk pipeline aplikasi:
+## extract_text_from_pdf -> clean_text -> RegexExtractor.extract_all ->
+## load_database_info -> search_cvs, di atas korpus PDF sintetis, plus
+## pencarian streaming per halaman PDF (stream_search_pdf) sebagai pembanding.
+## Database pakai backend SQLite di file sementara biar gak butuh MySQL.
+##
+## Contoh:
+##   python src/benchmark/pipeline_benchmark.py --cvs 200 --update-baseline
+##   python src/benchmark/pipeline_benchmark.py --cvs 200 --baseline bench_baseline.json
+##########################################################################
+##########################################################################
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import List, Dict, Any, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.streaming import STREAMING_MATCHERS
+from benchmark.corpus_generator import generate_pdf_corpus
+from database.backends import SQLiteBackend
+from database.models import ApplicantModel, ApplicationModel
+from extractors.pdf_extractor import PDFExtractor
+from extractors.regex_extractor import RegexExtractor
+from search.cv_searcher import CVSearcher
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_QUERIES = [
+    ['Python', 'React', 'HTML'],
+    ['Accounting', 'Payroll'],
+    ['Project Management', 'Leadership', 'Excel'],
+    ['management'],
+    ['Pyhton', 'Kubernetes'],  # typo biar tahap fuzzy ikut kepakai
+]
+DEFAULT_ALGORITHMS = ['KMP', 'BM', 'AC', 'WM', 'NATIVE', 'NUMPY']
+DEFAULT_TOLERANCE = 0.25
+
+# @brief Mengisi database SQLite sementara dengan profil terenkripsi untuk sebagian CV
+# @details Sebagian CV sengaja gak dimasukkan biar jalur fallback Seeder ikut terukur.
+# @param backend: SQLiteBackend yang dipakai benchmark
+# @param cv_entries: List dict CV (butuh 'category' dan 'filename')
+# @param coverage: Proporsi CV yang punya profil di database
+# @param seed: Seed random
+# @return: None
+def seed_benchmark_database(backend, cv_entries: List[Dict[str, Any]], coverage: float = 0.8, seed: int = 2025) -> None:
+    rng = random.Random(seed)
+    applicant_model = ApplicantModel(backend)
+    application_model = ApplicationModel(backend)
+    try:
+        for i, entry in enumerate(cv_entries):
+            if rng.random() >= coverage:
+                continue
+            applicant_id = applicant_model.create_applicant(
+                first_name=f"First{i}",
+                last_name=f"Last{i}",
+                date_of_birth='2000-01-01',
+                address=f"Jl. Benchmark No. {i}, Bandung",
+                phone_number=f"0812{i:08d}"
+            )
+            application_model.create_application(
+                applicant_id=applicant_id,
+                application_role=entry['category'],
+                cv_path=f"data/{entry['category']}/{entry['filename']}"
+            )
+    finally:
+        applicant_model.close()
+        application_model.close()
+
+# @brief Peak RSS proses sejauh ini (dalam MB)
+# @return: Peak RSS, atau None kalau platform gak support modul resource
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux ngasih KB, macOS ngasih byte
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+# @brief Menyimpan hasil ukur satu tahap ke report
+# @param report: Dict report yang sedang diisi
+# @param name: Nama tahap
+# @param wall_time: Durasi tahap (detik)
+# @param items: Banyak item yang diproses
+# @param unit: Satuan item (file, cv, query)
+# @return: None
+def _record_stage(report: Dict[str, Any], name: str, wall_time: float, items: int, unit: str) -> None:
+    report['stages'][name] = {
+        'wall_time': wall_time,
+        'items': items,
+        'unit': unit,
+        'throughput': items / wall_time if wall_time > 0 else float('inf'),
+        'peak_rss_mb': _peak_rss_mb()
+    }
+
+# @brief Menjalankan pipeline lengkap di atas folder korpus
+# @param data_dir: Folder berstruktur <KATEGORI>/<file>.pdf
+# @param queries: List query, tiap query berupa list keyword
+# @param algorithms: Algoritma exact match yang diukur di tahap search
+# @param top_n: Banyak hasil teratas per query
+# @return: Dict report berisi ukuran per tahap
+def run_pipeline(data_dir: str, queries: List[List[str]], algorithms: List[str], top_n: int = 5) -> Dict[str, Any]:
+    report: Dict[str, Any] = {'stages': {}, 'meta': {}}
+
+    pdf_extractor = PDFExtractor()
+    regex_extractor = RegexExtractor()
+
+    entries = []
+    for root, dirs, files in os.walk(data_dir):
+        category = os.path.basename(root)
+        for file in sorted(f for f in files if f.endswith('.pdf')):
+            entries.append({'path': os.path.join(root, file), 'filename': file, 'category': category})
+    entries.sort(key=lambda e: e['path'])
+    report['meta']['cvs'] = len(entries)
+
+    # Tahap 1: PyPDF2 -> teks mentah
+    start = time.perf_counter()
+    raw_texts = [pdf_extractor.extract_raw_text_from_pdf(entry['path']) for entry in entries]
+    _record_stage(report, 'pdf_extraction', time.perf_counter() - start, len(entries), 'file')
+
+    # Tahap 2: clean_text
+    start = time.perf_counter()
+    cv_data = []
+    for entry, raw_text in zip(entries, raw_texts):
+        text = pdf_extractor.clean_text(raw_text, entry['filename'].replace('.pdf', ''))
+        if text:
+            cv_data.append({**entry, 'text': text})
+    del raw_texts
+    _record_stage(report, 'clean_text', time.perf_counter() - start, len(entries), 'file')
+    report['meta']['corpus_chars'] = sum(len(cv['text']) for cv in cv_data)
+
+    # Tahap 3: regex extraction (sama kayak LoaderThread.run di MainWindow)
+    start = time.perf_counter()
+    for cv in cv_data:
+        cv['extracted_info'] = regex_extractor.extract_all(cv['text'])
+        personal_info = cv['extracted_info'].get('personal_info', {})
+        cv['name'] = personal_info.get('name', cv['filename'].replace('.pdf', ''))
+    _record_stage(report, 'regex_extraction', time.perf_counter() - start, len(cv_data), 'cv')
+
+    # Tahap 4: load_database_info
+    searcher = CVSearcher()
+    searcher.set_cv_data(cv_data)
+    db_dir = tempfile.mkdtemp(prefix="cv_bench_db_")
+    try:
+        backend = SQLiteBackend(os.path.join(db_dir, 'bench.sqlite3'))
+        seed_benchmark_database(backend, cv_data)
+        start = time.perf_counter()
+        app_model = ApplicationModel(backend)
+        try:
+            searcher.attach_database_info(app_model.get_all_applications_with_applicants())
+            # dicatat sebelum cleanup, biar waktu nutup koneksi & hapus folder DB gak ikut kehitung
+            _record_stage(report, 'db_load', time.perf_counter() - start, len(cv_data), 'cv')
+        finally:
+            app_model.close()
+    finally:
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+    # Tahap 5: search_cvs, satu sub-tahap per algoritma
+    for algorithm in algorithms:
+        searcher.set_algorithm(algorithm)
+        start = time.perf_counter()
+        for keywords in queries:
+            searcher.search(keywords, top_n)
+        _record_stage(report, f"search_{algorithm}", time.perf_counter() - start, len(queries), 'query')
+
+    # Tahap 6: cari query pertama langsung per halaman PDF (stream_search_pdf), tanpa nyimpen teks
+    if queries:
+        for algorithm in algorithms:
+            if algorithm not in STREAMING_MATCHERS:
+                continue
+            matcher = STREAMING_MATCHERS[algorithm](queries[0])
+            start = time.perf_counter()
+            for entry in entries:
+                matcher.reset()
+                pdf_extractor.stream_search_pdf(entry['path'], matcher)
+            _record_stage(report, f"stream_search_{algorithm}", time.perf_counter() - start, len(entries), 'file')
+
+    return report
+
+# @brief Membandingkan report dengan baseline yang tersimpan
+# @param report: Report hasil run_pipeline
+# @param baseline: Report baseline (format sama)
+# @param tolerance: Toleransi kenaikan wall time (0.25 = boleh 25% lebih lambat)
+# @return: List pesan regresi, kosong kalau aman
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    regressions = []
+    for name, stage in report['stages'].items():
+        base_stage = baseline.get('stages', {}).get(name)
+        if not base_stage:
+            continue
+        limit = base_stage['wall_time'] * (1 + tolerance)
+        if stage['wall_time'] > limit:
+            regressions.append(
+                f"{name}: {stage['wall_time']:.3f}s > {limit:.3f}s "
+                f"(baseline {base_stage['wall_time']:.3f}s + {tolerance:.0%})"
+            )
+    return regressions
+
+# @brief Mencetak report dalam bentuk tabel
+# @param report: Report hasil run_pipeline
+# @return: None
+def print_report(report: Dict[str, Any]) -> None:
+    meta = report['meta']
+    print(f"\n=== Pipeline Benchmark: {meta['cvs']} CVs, {meta.get('corpus_chars', 0)} chars ===")
+    print(f"{'stage':<20}{'wall (s)':>10}{'throughput':>20}{'peak RSS (MB)':>16}")
+    for name, stage in report['stages'].items():
+        rss = stage['peak_rss_mb']
+        rss_text = f"{rss:.1f}" if rss is not None else "n/a"
+        throughput = f"{stage['throughput']:.1f} {stage['unit']}/s"
+        print(f"{name:<20}{stage['wall_time']:>10.3f}{throughput:>20}{rss_text:>16}")
+    print("========================\n")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end benchmark for the CV pipeline")
+    parser.add_argument('--cvs', type=int, default=100, help="Banyak CV sintetis yang dibuat")
+    parser.add_argument('--paragraphs', type=int, default=6, help="Banyak blok pengalaman per CV")
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--data-dir', help="Pakai folder PDF yang sudah ada (misal data/data) daripada generate")
+    parser.add_argument('--algorithms', nargs='+', default=DEFAULT_ALGORITHMS)
+    parser.add_argument('--top-n', type=int, default=5)
+    parser.add_argument('--baseline', help="File JSON baseline untuk cek regresi")
+    parser.add_argument('--update-baseline', action='store_true', help="Tulis hasil run ini ke file baseline")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--output', help="Simpan report lengkap sebagai JSON")
+    args = parser.parse_args(argv)
+
+    temp_dir = None
+    data_dir = args.data_dir
+    if data_dir is None:
+        temp_dir = tempfile.mkdtemp(prefix="cv_bench_")
+        data_dir = temp_dir
+        print(f"Generating {args.cvs} synthetic CV PDFs in {data_dir}...")
+        generate_pdf_corpus(data_dir, args.cvs, seed=args.seed, paragraphs=args.paragraphs)
+
+    try:
+        report = run_pipeline(data_dir, DEFAULT_QUERIES, args.algorithms, args.top_n)
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    baseline_path = args.baseline or 'bench_baseline.json'
+    if args.update_baseline:
+        with open(baseline_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print("REGRESSION:")
+            for message in regressions:
+                print(f"  - {message}")
+            return 1
+        print(f"No stage regressed more than {args.tolerance:.0%} against {args.baseline}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
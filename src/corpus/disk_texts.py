@@ -0,0 +1,98 @@
+##########################################################################
+##########################################################################
+## @file disk_texts.py
+## Ini isinya DiskTextStore: tempat nyimpen teks CV di file (append-only,
+## UTF-8) dan dibaca lagi lewat mmap, dipakai kalau perkiraan memori
+## korpus lewat dari budget (lihat corpus/loading.py). Di memori cuma ada
+## tabel offset dan panjang karakter int64 per teks; CVRecord.text dan CorpusStore cukup
+## nyimpen id teksnya. Teks yang di-update ditulis ulang di akhir file
+## (versi lamanya jadi sampah sampai load penuh berikutnya).
+## Objeknya bisa di-pickle (cuma path + offset + panjang), jadi snapshot gak ikut
+## nyimpen teksnya.
+##########################################################################
+##########################################################################
+
+import mmap
+import os
+from array import array
+from typing import Dict, Any
+
+class DiskTextStore:
+    # @param path: Path file teks
+    # @param truncate: True = mulai file baru, False = buka file yang sudah ada (offset diisi lewat unpickle)
+    def __init__(self, path: str, truncate: bool = True):
+        self.path = path
+        self._offsets = array('q', [0])
+        self._lengths = array('q')
+        self._file = open(path, 'w+b' if truncate else 'r+b')
+        self._mm = None
+        self._mapped = 0
+
+    # @brief Menulis satu teks di akhir file
+    # @param text: Teks
+    # @return: Id teks
+    def add(self, text: str) -> int:
+        data = text.encode('utf-8')
+        self._file.seek(self._offsets[-1])
+        self._file.write(data)
+        self._offsets.append(self._offsets[-1] + len(data))
+        self._lengths.append(len(text))
+        return len(self._offsets) - 2
+
+    # @brief Membaca satu teks (di-decode dari mmap)
+    # @param id: Id teks hasil add
+    # @return: Teks
+    def get(self, id: int) -> str:
+        start, end = self._offsets[id], self._offsets[id + 1]
+        if start == end:
+            return ''
+        if end > self._mapped:
+            self._remap()
+        return self._mm[start:end].decode('utf-8')
+
+    # @brief Panjang satu teks dalam karakter (sama dengan len(get(id))) tanpa membacanya
+    # @param id: Id teks
+    # @return: Jumlah karakter
+    def length_of(self, id: int) -> int:
+        return self._lengths[id]
+
+    # @brief Map ulang file setelah ada teks baru yang ditulis
+    # @return: None
+    def _remap(self) -> None:
+        self._file.flush()
+        if self._mm is not None:
+            self._mm.close()
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped = len(self._mm)
+
+    # @brief Total byte teks di file (termasuk versi lama yang sudah diganti)
+    # @return: Jumlah byte
+    @property
+    def size(self) -> int:
+        return self._offsets[-1]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self._file.flush()
+        return {'path': self.path, 'offsets': self._offsets.tobytes(), 'lengths': self._lengths.tobytes()}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state['path'], truncate=False)
+        self._offsets = array('q')
+        self._offsets.frombytes(state['offsets'])
+        self._lengths = array('q')
+        self._lengths.frombytes(state['lengths'])
+        if os.path.getsize(self.path) < self._offsets[-1]:
+            self.close()
+            raise ValueError(f"{self.path} is shorter than the snapshot expects")
+
+    # @brief Menutup mmap dan file
+    # @return: None
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+            self._mapped = 0
+        self._file.close()
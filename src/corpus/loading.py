@@ -0,0 +1,110 @@
+##########################################################################
+##########################################################################
+## @file loading.py
+## Ini isinya kebijakan load korpus: PDF mana yang di-load (semua, N per
+## kategori, atau sampel acak N file) dan budget memori. Sebelum ekstraksi,
+## perkiraan memori korpus dihitung dari ukuran PDF (rasio teks per byte
+## diukur dari beberapa PDF sampel); kalau lewat budget, teks CV disimpan
+## di DiskTextStore (mmap) alih-alih di memori.
+##
+## Bisa diatur lewat environment variable:
+##   LOAD_POLICY      = all | per_category:N | sample:N   (default all)
+##   LOAD_SEED        = seed sampel acak                   (default 0)
+##   MEMORY_BUDGET_MB = budget memori teks korpus, 0 = tanpa batas (default 2048)
+##########################################################################
+##########################################################################
+
+import os
+from typing import List, Dict, Any, Optional
+
+from corpus.signature import SIGNATURE_BITS
+
+MODES = ('all', 'per_category', 'sample')
+# perkiraan memori per CV di luar teks (CVRecord, extracted_info, profil DB, signature)
+CV_OVERHEAD_BYTES = 2048 + SIGNATURE_BITS // 8
+STR_OVERHEAD_BYTES = 49
+DEFAULT_TEXT_RATIO = 0.1 # karakter teks per byte PDF kalau sampel gagal diekstrak
+
+class LoadPolicy:
+    # @param mode: 'all', 'per_category', atau 'sample'
+    # @param limit: N per kategori (per_category) atau total N file (sample)
+    # @param seed: Seed sampel acak
+    # @param memory_budget: Batas perkiraan byte teks korpus di memori (None = tanpa batas)
+    def __init__(self, mode: str = 'all', limit: Optional[int] = None, seed: int = 0, memory_budget: Optional[int] = None):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}")
+        if mode != 'all' and (limit is None or limit <= 0):
+            raise ValueError(f"mode '{mode}' needs a positive limit")
+        self.mode = mode
+        self.limit = limit if mode != 'all' else None
+        self.seed = seed
+        self.memory_budget = memory_budget
+
+    # @brief Membuat policy dari string 'all', 'per_category:N', atau 'sample:N'
+    # @param spec: String policy
+    # @param seed: Seed sampel acak
+    # @param memory_budget: Budget memori dalam byte (None = tanpa batas)
+    # @return: LoadPolicy
+    @classmethod
+    def parse(cls, spec: str, seed: int = 0, memory_budget: Optional[int] = None) -> "LoadPolicy":
+        mode, _, limit = spec.strip().partition(':')
+        return cls(mode, int(limit) if limit else None, seed, memory_budget)
+
+    # @brief Membuat policy dari LOAD_POLICY, LOAD_SEED, dan MEMORY_BUDGET_MB
+    # @return: LoadPolicy
+    @classmethod
+    def from_env(cls) -> "LoadPolicy":
+        budget_mb = float(os.getenv('MEMORY_BUDGET_MB', '2048'))
+        return cls.parse(os.getenv('LOAD_POLICY', 'all'), int(os.getenv('LOAD_SEED', '0')),
+                         int(budget_mb * 1024 * 1024) if budget_mb > 0 else None)
+
+    # @brief Identitas policy (buat dicocokkan dengan snapshot; budget gak ikut karena gak ngubah isi korpus)
+    # @return: 'all', 'per_category:N', atau 'sample:N:seed'
+    @property
+    def spec(self) -> str:
+        if self.mode == 'all':
+            return 'all'
+        if self.mode == 'per_category':
+            return f"per_category:{self.limit}"
+        return f"sample:{self.limit}:{self.seed}"
+
+    # @brief Apakah teks korpus perlu disimpan di disk
+    # @param estimate: Hasil estimate_corpus_memory
+    # @return: True kalau perkiraan memori lewat budget
+    def use_disk(self, estimate: Dict[str, Any]) -> bool:
+        return self.memory_budget is not None and estimate['memory_bytes'] > self.memory_budget
+
+# @brief Memperkirakan memori korpus sebelum ekstraksi
+# @details Rasio karakter teks per byte PDF diukur dari beberapa PDF (tersebar rata di daftar),
+#          lalu dikali ukuran semua PDF. Teks dihitung dua kali (teks asli + lowercase).
+# @param pdf_extractor: PDFExtractor
+# @param paths: Path PDF yang bakal di-load
+# @param sample_size: Banyak PDF sampel yang diekstrak
+# @return: Dict berisi pdfs, pdf_bytes, text_chars (perkiraan), memory_bytes (perkiraan di memori),
+#          dan disk_memory_bytes (perkiraan di memori kalau teksnya di disk)
+def estimate_corpus_memory(pdf_extractor, paths: List[str], sample_size: int = 3) -> Dict[str, Any]:
+    sizes = []
+    for path in paths:
+        try:
+            sizes.append(os.path.getsize(path))
+        except OSError:
+            sizes.append(0)
+    pdf_bytes = sum(sizes)
+
+    sample_chars = 0
+    sample_bytes = 0
+    if paths and sample_size > 0:
+        step = max(1, len(paths) // sample_size)
+        for i in range(0, len(paths), step)[:sample_size]:
+            sample_chars += len(pdf_extractor.extract_text_from_pdf(paths[i]))
+            sample_bytes += sizes[i]
+    ratio = sample_chars / sample_bytes if sample_chars and sample_bytes else DEFAULT_TEXT_RATIO
+
+    text_chars = int(pdf_bytes * ratio)
+    return {
+        'pdfs': len(paths),
+        'pdf_bytes': pdf_bytes,
+        'text_chars': text_chars,
+        'memory_bytes': 2 * (text_chars + STR_OVERHEAD_BYTES * len(paths)) + CV_OVERHEAD_BYTES * len(paths),
+        'disk_memory_bytes': (CV_OVERHEAD_BYTES + 16) * len(paths)
+    }
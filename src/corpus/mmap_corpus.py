@@ -0,0 +1,235 @@
+##########################################################################
+##########################################################################
+## @file mmap_corpus.py
+## Ini isinya format file korpus yang dibuka pakai mmap: semua teks CV
+## yang sudah lowercase disimpan jadi satu blob (UTF-8 atau UTF-32-LE),
+## plus tabel offset ber-lebar-tetap per CV. Banyak proses (GUI, CLI,
+## service) yang buka file yang sama cukup berbagi satu salinan di page
+## cache, gak perlu masing-masing nyimpen str per CV di heap.
+##
+## Layout file:
+##   MAGIC (8 byte) | versi (uint16) | encoding (uint8) | jumlah CV (uint32)
+##   | panjang metadata (uint32) | metadata JSON (kategori, path, filename, name)
+##   | tabel record: per CV (offset byte, panjang byte, panjang karakter, id kategori)
+##   | blob teks, antar CV dipisah separator NUL
+##
+## Pencarian jalan langsung di atas mmap (zero-copy): mode 'find' pakai
+## mmap.find sekali lewat per pola untuk seluruh korpus, sedangkan KMP dan
+## Aho-Corasick bisa scan memoryview per CV dengan query mode bytes
+## (compile_query(..., encoding=...)).
+##########################################################################
+##########################################################################
+
+import bisect
+import json
+import mmap
+import os
+import struct
+from typing import List, Dict, Any, Optional, Iterator
+
+from algorithms.query import CompiledQuery, ENGINES
+
+MAGIC = b'CVCORP\x00\x01'
+FORMAT_VERSION = 1
+ENCODINGS = ('utf-8', 'utf-32-le')
+_PREFIX = struct.Struct('<8sHBII')
+_RECORD = struct.Struct('<QIIH')
+
+# @brief Menulis file korpus secara atomik (tulis ke file sementara lalu rename)
+# @param path: Path file korpus
+# @param texts: Teks CV yang sudah dinormalisasi (misal CorpusStore.texts, boleh StoredTexts)
+# @param cv_data: List dict CV untuk metadata (path, filename, name, category), opsional
+# @param encoding: 'utf-8' (ringkas) atau 'utf-32-le' (posisi = offset byte / 4)
+# @return: None
+def write_corpus(path: str, texts: List[str], cv_data: Optional[List[Dict[str, Any]]] = None, encoding: str = 'utf-8') -> None:
+    if encoding not in ENCODINGS:
+        raise ValueError(f"encoding must be one of {ENCODINGS}")
+    if not hasattr(texts, '__len__'):
+        texts = list(texts) # list / StoredTexts dipakai langsung tanpa disalin (cukup len + sekali iterasi)
+    cv_data = cv_data or [{} for _ in texts]
+
+    categories = sorted({cv.get('category', '') for cv in cv_data})
+    category_ids = {category: i for i, category in enumerate(categories)}
+    metadata = json.dumps({
+        'categories': categories,
+        'records': [[cv.get('path', ''), cv.get('filename', ''), cv.get('name', '')] for cv in cv_data]
+    }).encode('utf-8')
+
+    separator = '\x00'.encode(encoding)
+    records = bytearray()
+    offset = 0
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, ENCODINGS.index(encoding), len(texts), len(metadata)))
+        f.write(metadata)
+        # tabel record dicadangkan dulu, diisi setelah blob ditulis (tiap teks cukup di-encode sekali)
+        table_start = f.tell()
+        f.seek(len(texts) * _RECORD.size, os.SEEK_CUR)
+        for text, cv in zip(texts, cv_data):
+            encoded = text.encode(encoding)
+            records += _RECORD.pack(offset, len(encoded), len(text), category_ids[cv.get('category', '')])
+            f.write(encoded)
+            f.write(separator)
+            offset += len(encoded) + len(separator)
+        f.seek(table_start)
+        f.write(records)
+    os.replace(tmp_path, path)
+
+class MmapCorpus:
+    # @param path: Path file hasil write_corpus
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, encoding, count, metadata_len = _PREFIX.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{path} is not a supported corpus file")
+        except Exception:
+            self._file.close()
+            raise
+
+        self.encoding = ENCODINGS[encoding]
+        self.unit = 4 if self.encoding == 'utf-32-le' else 1  # lebar satu karakter kalau tetap
+        self._count = count
+
+        metadata_start = _PREFIX.size
+        metadata = json.loads(self._mm[metadata_start:metadata_start + metadata_len].decode('utf-8'))
+        self.categories: List[str] = metadata['categories']
+        self._records_meta: List[List[str]] = metadata['records']
+
+        self._table = metadata_start + metadata_len
+        self._blob = self._table + count * _RECORD.size
+        # offset awal tiap CV (absolut di file), dipakai bisect untuk memetakan hit ke CV
+        self._starts = [self._blob + self._record(i)[0] for i in range(count)]
+        self._view = memoryview(self._mm)
+
+    # @brief Record mentah satu CV
+    # @param index: Index CV
+    # @return: Tuple (offset byte relatif blob, panjang byte, panjang karakter, id kategori)
+    def _record(self, index: int):
+        return _RECORD.unpack_from(self._mm, self._table + index * _RECORD.size)
+
+    # @brief Rentang byte absolut teks satu CV di file
+    # @param index: Index CV
+    # @return: Tuple (awal, akhir)
+    def span(self, index: int):
+        offset, size, _, _ = self._record(index)
+        start = self._blob + offset
+        return start, start + size
+
+    # @brief Teks satu CV tanpa menyalin (bytes sesuai self.encoding)
+    # @param index: Index CV
+    # @return: memoryview ke mmap
+    def view(self, index: int) -> memoryview:
+        start, end = self.span(index)
+        return self._view[start:end]
+
+    # @brief Teks satu CV sebagai str (di-decode, jadi ini menyalin)
+    # @param index: Index CV
+    # @return: Teks lowercase
+    def text(self, index: int) -> str:
+        start, end = self.span(index)
+        return self._mm[start:end].decode(self.encoding)
+
+    # @brief Semua teks sebagai str, satu per satu
+    # @return: Iterator teks lowercase
+    def texts(self) -> Iterator[str]:
+        return (self.text(i) for i in range(self._count))
+
+    # @brief Metadata satu CV
+    # @param index: Index CV
+    # @return: Dict berisi path, filename, name, category, dan length (jumlah karakter)
+    def meta(self, index: int) -> Dict[str, Any]:
+        _, _, length, category_id = self._record(index)
+        path, filename, name = self._records_meta[index]
+        return {'path': path, 'filename': filename, 'name': name,
+                'category': self.categories[category_id], 'length': length}
+
+    # @brief Encode pola sesuai encoding file
+    # @param pattern: Pola lowercase (str atau bytes yang sudah di-encode)
+    # @return: bytes
+    def _encode(self, pattern) -> bytes:
+        return pattern if isinstance(pattern, (bytes, bytearray)) else pattern.encode(self.encoding)
+
+    # @brief Menghitung kemunculan satu pola di seluruh korpus dengan satu pass mmap.find
+    # @param pattern: Pola lowercase
+    # @return: Dictionary <index CV, jumlah> (overlap ikut dihitung), CV tanpa match gak dimasukkan
+    def count(self, pattern) -> Dict[int, int]:
+        needle = self._encode(pattern)
+        counts: Dict[int, int] = {}
+        if not needle or not self._count:
+            return counts
+
+        find = self._mm.find
+        starts = self._starts
+        unit = self.unit
+        end_of_blob = len(self._mm)
+        hit = find(needle, self._blob)
+        while hit != -1:
+            index = bisect.bisect_right(starts, hit) - 1
+            start, end = self.span(index)
+            if hit + len(needle) <= end and (hit - start) % unit == 0:
+                counts[index] = counts.get(index, 0) + 1
+            hit = find(needle, hit + unit, end_of_blob)
+        return counts
+
+    # @brief Posisi (indeks karakter) pola di satu CV
+    # @param index: Index CV
+    # @param pattern: Pola lowercase
+    # @return: List posisi awal (overlap ikut)
+    def positions(self, index: int, pattern) -> List[int]:
+        needle = self._encode(pattern)
+        if not needle:
+            return []
+        start, end = self.span(index)
+        found = []
+        hit = self._mm.find(needle, start, end)
+        while hit != -1:
+            if (hit - start) % self.unit == 0:
+                if self.unit == 1:
+                    found.append(len(self._mm[start:hit].decode('utf-8')))
+                else:
+                    found.append((hit - start) // self.unit)
+            hit = self._mm.find(needle, hit + self.unit, end)
+        return found
+
+    # @brief Exact match seluruh korpus, format sama dengan CVSearcher.exact_match
+    # @details Query KMP/AC yang di-compile dengan encoding file ini di-scan per CV langsung
+    #          di memoryview. Algoritma lain (BM/WM butuh str.startswith) pakai mmap.find.
+    # @param query: CompiledQuery
+    # @return: Dictionary <index CV, <keyword, jumlah>>, urut index, CV tanpa match gak dimasukkan
+    def exact_match(self, query: CompiledQuery) -> Dict[int, Dict[str, int]]:
+        bytes_mode = all(isinstance(pattern, bytes) for _, pattern, _ in query.entries)
+        if bytes_mode and self.unit == 1 and query.algorithm in ('KMP', 'AC'):
+            engine = ENGINES[query.algorithm]()
+            exact_counts: Dict[int, Dict[str, int]] = {}
+            for i in range(self._count):
+                counts = engine.count_query(self.view(i), query)
+                if counts:
+                    exact_counts[i] = counts
+            return exact_counts
+
+        per_index: Dict[int, Dict[str, int]] = {}
+        for keyword, pattern, _ in query.entries:
+            for i, count in self.count(pattern).items():
+                per_index.setdefault(i, {})[keyword] = count
+        return {i: per_index[i] for i in sorted(per_index)}
+
+    def __len__(self) -> int:
+        return self._count
+
+    # @brief Menutup mmap dan file
+    # @return: None
+    def close(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "MmapCorpus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
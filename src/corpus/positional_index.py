@@ -0,0 +1,430 @@
+##########################################################################
+##########################################################################
+## @file positional_index.py
+## Ini isinya inverted index posisional yang disimpan di disk dan dibuka
+## pakai mmap, buat korpus yang postings-nya udah gak muat di memori.
+## Teks ternormalisasi dipecah jadi run token bergantian (non-whitespace /
+## whitespace), jadi tiap karakter teks masuk tepat satu token dan posisi
+## = nomor urut token. Dengan begitu jumlah kemunculan keyword (substring,
+## overlap ikut) bisa dihitung persis dari index, sama dengan hasil
+## CVSearcher.exact_match:
+##   - keyword satu run: jumlah kemunculan di term * tf term di CV
+##   - keyword beberapa run: run pertama = akhiran token j, run tengah =
+##     token j+1.. persis, run terakhir = awalan token j+k
+##
+## Layout file:
+##   MAGIC (8 byte) | versi (uint16) | jumlah CV (uint32) | jumlah term (uint32)
+##   | offset tabel term (uint64) | offset kamus term (uint64)
+##   | postings semua term (urut term)
+##   | tabel term: per term (offset di kamus, offset postings, panjang postings, df)
+##   | kamus term: NUL t0 NUL t1 NUL ... tn NUL (UTF-8, urut byte)
+##
+## Postings per term, semua angka varint: per CV (delta id CV, tf, panjang
+## byte posisi, posisi delta-encoded). Panjang byte posisi bikin CV yang
+## gak perlu dicek bisa dilompati tanpa decode posisinya.
+## Writer-nya nge-spill run terurut ke file sementara kalau buffer lewat
+## memory_limit lalu merge, reader cuma mmap + header, jadi memori dua-duanya
+## gak ikut membesar sama ukuran korpus.
+## Index ini dibangun dan dibaca lewat src/corpus_cli.py (build, lalu
+## search --index), GUI gak nulis maupun baca index ini.
+##########################################################################
+##########################################################################
+
+import heapq
+import mmap
+import os
+import re
+import shutil
+import struct
+import tempfile
+from typing import List, Dict, Any, Iterable, Iterator, Tuple, Set, BinaryIO
+
+from corpus.store import CorpusStore
+
+MAGIC = b'CVPIDX\x00\x01'
+FORMAT_VERSION = 1
+_PREFIX = struct.Struct('<8sHIIQQ')
+_TERM = struct.Struct('<QQQI')
+# run NUL dipisah sendiri: gak masuk kamus (NUL = pemisah term), tapi tetap makan satu posisi
+_TOKEN = re.compile(r'[^\s\x00]+|\s+|\x00+')
+_NUL = b'\x00'
+
+# @brief Menambahkan satu angka varint (7 bit per byte, LSB dulu)
+# @param value: Angka >= 0
+# @param out: Buffer tujuan
+# @return: None
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+# @brief Membaca satu angka varint
+# @param buf: Buffer sumber (bytes / mmap)
+# @param position: Posisi byte awal
+# @return: Tuple (angka, posisi byte setelahnya)
+def _decode_varint(buf, position: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+# @brief Membaca satu record run (term, df, id CV terakhir, postings) dari file run
+# @param f: File run yang dibuka biner
+# @param run: Nomor run (buat urutan merge kalau term-nya sama)
+# @return: Iterator tuple (term, nomor run, df, id CV terakhir, postings)
+def _read_run(f: BinaryIO, run: int) -> Iterator[Tuple[bytes, int, int, int, bytes]]:
+    f.seek(0)
+    def varint() -> int:
+        result = 0
+        shift = 0
+        while True:
+            byte = f.read(1)
+            if not byte:
+                raise EOFError
+            result |= (byte[0] & 0x7F) << shift
+            if byte[0] < 0x80:
+                return result
+            shift += 7
+
+    while True:
+        try:
+            term_length = varint()
+        except EOFError:
+            return
+        term = f.read(term_length)
+        doc_count = varint()
+        last_doc = varint()
+        postings = f.read(varint())
+        yield term, run, doc_count, last_doc, postings
+
+class IndexWriter:
+    # @param path: Path file index
+    # @param memory_limit: Perkiraan byte postings di buffer sebelum di-spill ke file sementara
+    def __init__(self, path: str, memory_limit: int = 64 * 1024 * 1024):
+        self.path = path
+        self.memory_limit = memory_limit
+        self._buffer: Dict[str, List[Any]] = {}   # term -> [postings, df, id CV terakhir]
+        self._buffered = 0
+        self._runs: List[BinaryIO] = []
+        self._count = 0
+
+    # @brief Menambah satu CV ke index
+    # @param text: Teks yang sudah dinormalisasi (CorpusStore.normalize)
+    # @return: Id CV (urutan add, mulai dari 0)
+    def add(self, text: str) -> int:
+        doc = self._count
+        self._count += 1
+
+        positions_by_term: Dict[str, List[int]] = {}
+        for position, token in enumerate(_TOKEN.findall(text)):
+            if token[0] != '\x00':
+                positions_by_term.setdefault(token, []).append(position)
+
+        for term, positions in positions_by_term.items():
+            entry = self._buffer.get(term)
+            if entry is None:
+                entry = self._buffer[term] = [bytearray(), 0, 0]
+                self._buffered += len(term) + 96 # perkiraan overhead dict + list + bytearray
+            postings = entry[0]
+            before = len(postings)
+
+            encoded = bytearray()
+            previous = 0
+            for position in positions:
+                _encode_varint(position - previous, encoded)
+                previous = position
+
+            _encode_varint(doc - entry[2], postings)
+            _encode_varint(len(positions), postings)
+            _encode_varint(len(encoded), postings)
+            postings += encoded
+            entry[1] += 1
+            entry[2] = doc
+            self._buffered += len(postings) - before
+
+        if self._buffered >= self.memory_limit:
+            self._spill()
+        return doc
+
+    # @brief Isi buffer dalam urutan term (urut byte UTF-8)
+    # @param run: Nomor run buffer ini
+    # @return: Iterator tuple (term, nomor run, df, id CV terakhir, postings)
+    def _buffer_items(self, run: int) -> Iterator[Tuple[bytes, int, int, int, bytes]]:
+        for term, (postings, doc_count, last_doc) in sorted(
+                ((term.encode('utf-8'), entry) for term, entry in self._buffer.items()), key=lambda item: item[0]):
+            yield term, run, doc_count, last_doc, bytes(postings)
+
+    # @brief Menulis buffer sebagai run terurut ke file sementara lalu mengosongkannya
+    # @return: None
+    def _spill(self) -> None:
+        run = tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(self.path)))
+        for term, _, doc_count, last_doc, postings in self._buffer_items(len(self._runs)):
+            record = bytearray()
+            _encode_varint(len(term), record)
+            record += term
+            _encode_varint(doc_count, record)
+            _encode_varint(last_doc, record)
+            _encode_varint(len(postings), record)
+            run.write(record)
+            run.write(postings)
+        self._runs.append(run)
+        self._buffer = {}
+        self._buffered = 0
+
+    # @brief Merge semua run jadi file index akhir (atomik: tulis ke .tmp lalu rename)
+    # @return: None
+    def close(self) -> None:
+        sources = [_read_run(run, i) for i, run in enumerate(self._runs)]
+        sources.append(self._buffer_items(len(self._runs)))
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp_path = f"{self.path}.tmp"
+        term_count = 0
+        try:
+            with open(tmp_path, 'wb') as f, tempfile.TemporaryFile(dir=directory) as table, \
+                    tempfile.TemporaryFile(dir=directory) as terms:
+                f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, 0, 0, 0, 0))
+                terms.write(_NUL)
+                term_offset = 1
+
+                current = None
+                doc_count = 0
+                last_doc = 0
+                postings_offset = 0
+                for term, _, run_doc_count, run_last_doc, postings in heapq.merge(*sources, key=lambda item: item[:2]):
+                    if term != current:
+                        if current is not None:
+                            table.write(_TERM.pack(term_offset, postings_offset, f.tell() - postings_offset, doc_count))
+                            terms.write(current + _NUL)
+                            term_offset += len(current) + 1
+                            term_count += 1
+                        current = term
+                        doc_count = 0
+                        last_doc = 0
+                        postings_offset = f.tell()
+                    # CV pertama di tiap run disimpan absolut, di file akhir jadi delta dari run sebelumnya
+                    first_doc, rest = _decode_varint(postings, 0)
+                    head = bytearray()
+                    _encode_varint(first_doc - last_doc, head)
+                    f.write(head)
+                    f.write(postings[rest:])
+                    doc_count += run_doc_count
+                    last_doc = run_last_doc
+                if current is not None:
+                    table.write(_TERM.pack(term_offset, postings_offset, f.tell() - postings_offset, doc_count))
+                    terms.write(current + _NUL)
+                    term_count += 1
+
+                table_offset = f.tell()
+                table.seek(0)
+                shutil.copyfileobj(table, f)
+                terms_offset = f.tell()
+                terms.seek(0)
+                shutil.copyfileobj(terms, f)
+                f.seek(0)
+                f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, self._count, term_count, table_offset, terms_offset))
+            os.replace(tmp_path, self.path)
+        finally:
+            for run in self._runs:
+                run.close()
+            self._runs = []
+            self._buffer = {}
+            self._buffered = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "IndexWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            for run in self._runs:
+                run.close()
+
+# @brief Menulis file index dari teks yang sudah dinormalisasi
+# @param path: Path file index
+# @param texts: Teks ternormalisasi sesuai urutan cv_data (misal CorpusStore.texts)
+# @param memory_limit: Batas buffer writer (lihat IndexWriter)
+# @return: Jumlah CV yang di-index
+def write_index(path: str, texts: Iterable[str], memory_limit: int = 64 * 1024 * 1024) -> int:
+    with IndexWriter(path, memory_limit) as writer:
+        for text in texts:
+            writer.add(text)
+        return len(writer)
+
+# @brief Menulis file index langsung dari hasil PDFExtractor.extract_all_pdfs_from_directory
+# @param path: Path file index
+# @param extracted_data: List dict CV (teks di key 'text', belum lowercase)
+# @param memory_limit: Batas buffer writer (lihat IndexWriter)
+# @return: Jumlah CV yang di-index
+def write_index_from_extracted(path: str, extracted_data: Iterable[Dict[str, Any]], memory_limit: int = 64 * 1024 * 1024) -> int:
+    return write_index(path, (CorpusStore.normalize(cv['text']) for cv in extracted_data), memory_limit)
+
+class PositionalIndex:
+    # @param path: Path file hasil IndexWriter / write_index
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count, term_count, table_offset, terms_offset = _PREFIX.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{path} is not a supported index file")
+        except Exception:
+            self._file.close()
+            raise
+        self._count = count
+        self.term_count = term_count
+        self._table = table_offset
+        self._terms = terms_offset
+
+    # @brief Record tabel satu term
+    # @param term: Index term di kamus
+    # @return: Tuple (offset di kamus, offset postings, panjang postings, df)
+    def _term(self, term: int) -> Tuple[int, int, int, int]:
+        return _TERM.unpack_from(self._mm, self._table + term * _TERM.size)
+
+    # @brief Term yang memuat offset kamus tertentu (binary search di tabel, tanpa list di memori)
+    # @param offset: Offset relatif kamus
+    # @return: Index term
+    def _term_at(self, offset: int) -> int:
+        low, high = 0, self.term_count - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._term(middle)[0] <= offset:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    # @brief Mencari pola di kamus term dengan mmap.find
+    # @param needle: Pola UTF-8, boleh diapit NUL (NUL di depan = awalan term, di belakang = akhiran term)
+    # @return: Dictionary <index term, jumlah kemunculan pola di term itu>
+    def _term_hits(self, needle: bytes) -> Dict[int, int]:
+        hits: Dict[int, int] = {}
+        if not self.term_count:
+            return hits
+        shift = 1 if needle.startswith(_NUL) else 0
+        find = self._mm.find
+        end = len(self._mm)
+        term, term_end = -1, -1
+        hit = find(needle, self._terms, end)
+        while hit != -1:
+            offset = hit - self._terms + shift
+            if offset >= term_end:
+                term = self._term_at(offset)
+                term_end = self._term(term + 1)[0] if term + 1 < self.term_count else end - self._terms
+            hits[term] = hits.get(term, 0) + 1
+            hit = find(needle, hit + 1, end)
+        return hits
+
+    # @brief Membaca postings satu term
+    # @param term: Index term
+    # @return: Iterator tuple (id CV, tf, awal byte posisi, akhir byte posisi)
+    def _postings(self, term: int) -> Iterator[Tuple[int, int, int, int]]:
+        _, position, _, doc_count = self._term(term)
+        mm = self._mm
+        doc = 0
+        for _ in range(doc_count):
+            delta, position = _decode_varint(mm, position)
+            frequency, position = _decode_varint(mm, position)
+            size, position = _decode_varint(mm, position)
+            doc += delta
+            yield doc, frequency, position, position + size
+            position += size
+
+    # @brief Decode posisi (nomor token) satu CV dari postings
+    # @param start: Awal byte posisi
+    # @param end: Akhir byte posisi
+    # @return: List posisi urut
+    def _positions(self, start: int, end: int) -> List[int]:
+        positions = []
+        previous = 0
+        while start < end:
+            delta, start = _decode_varint(self._mm, start)
+            previous += delta
+            positions.append(previous)
+        return positions
+
+    # @brief Menghitung kemunculan satu pola (sudah lowercase) per CV
+    # @param pattern: Pola lowercase
+    # @return: Dictionary <id CV, jumlah> (overlap ikut dihitung), CV tanpa match gak dimasukkan
+    def count(self, pattern: str) -> Dict[int, int]:
+        counts: Dict[int, int] = {}
+        runs = [run.encode('utf-8') for run in _TOKEN.findall(pattern)]
+        if not runs or any(run.startswith(_NUL) for run in runs):
+            return counts
+
+        if len(runs) == 1:
+            # keyword di dalam satu token: kemunculan di term dikali tf
+            for term, occurrences in self._term_hits(runs[0]).items():
+                for doc, frequency, _, _ in self._postings(term):
+                    counts[doc] = counts.get(doc, 0) + occurrences * frequency
+            return counts
+
+        # run pertama = akhiran token, run tengah = token persis, run terakhir = awalan token
+        needles = [runs[0] + _NUL] + [_NUL + run + _NUL for run in runs[1:-1]] + [_NUL + runs[-1]]
+        terms_per_run = [list(self._term_hits(needle)) for needle in needles]
+        if not all(terms_per_run):
+            return counts
+
+        # CV kandidat dulu (posisi dilompati), posisi baru di-decode untuk CV yang lolos semua run
+        candidates: Set[int] = None
+        for terms in sorted(terms_per_run, key=lambda terms: sum(self._term(term)[3] for term in terms)):
+            docs = {doc for term in terms for doc, _, _, _ in self._postings(term) if candidates is None or doc in candidates}
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return counts
+
+        starts: Dict[int, Set[int]] = {}
+        for offset, terms in enumerate(terms_per_run):
+            shifted: Dict[int, Set[int]] = {}
+            for term in terms:
+                for doc, _, start, end in self._postings(term):
+                    if doc in candidates:
+                        shifted.setdefault(doc, set()).update(position - offset for position in self._positions(start, end))
+            if offset == 0:
+                starts = shifted
+            else:
+                starts = {doc: positions & shifted[doc] for doc, positions in starts.items() if doc in shifted}
+
+        for doc, positions in starts.items():
+            if positions:
+                counts[doc] = len(positions)
+        return counts
+
+    # @brief Exact match seluruh korpus, format sama dengan CVSearcher.exact_match
+    # @param keywords: List keyword (case asli; duplikat & string kosong dibuang)
+    # @return: Dictionary <id CV, <keyword, jumlah>>, urut id, CV tanpa match gak dimasukkan
+    def exact_match(self, keywords: List[str]) -> Dict[int, Dict[str, int]]:
+        per_doc: Dict[int, Dict[str, int]] = {}
+        for keyword in dict.fromkeys(keywords):
+            if not keyword:
+                continue
+            for doc, count in self.count(CorpusStore.normalize(keyword)).items():
+                per_doc.setdefault(doc, {})[keyword] = count
+        return {doc: per_doc[doc] for doc in sorted(per_doc)}
+
+    def __len__(self) -> int:
+        return self._count
+
+    # @brief Menutup mmap dan file
+    # @return: None
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "PositionalIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
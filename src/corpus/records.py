@@ -0,0 +1,216 @@
+##########################################################################
+##########################################################################
+## @file records.py
+## Ini isinya representasi CV yang ringkas: CVRecord pakai __slots__ (gak
+## ada __dict__ per CV), string kategori di-intern, tiap CV punya id
+## integer = posisinya di CVStore. Hasil pencarian (SearchResult) cuma
+## nyimpen id + info match dan nunjuk ke record-nya, jadi teks dan
+## field lain gak disalin per hasil.
+## Akses gaya dict (cv['path'], cv.get('db_phone', '')) tetap didukung
+## biar kode lama (benchmark, snapshot lama, dsb) gak perlu diubah.
+## Kalau CVStore dikasih DiskTextStore, teks CV dipindah ke disk dan
+## record cuma nyimpen id teksnya (CVRecord.text baca dari mmap).
+##########################################################################
+##########################################################################
+
+import sys
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
+
+# field profil DB baru ada setelah attach_database_info (kayak key dict dulu)
+PROFILE_FIELDS = ('applicant_id', 'db_first_name', 'db_last_name', 'db_phone', 'db_address', 'db_dob')
+FIELDS = ('id', 'path', 'filename', 'text', 'category', 'extracted_info', 'name') + PROFILE_FIELDS
+
+class CVRecord:
+    # _text: teks (str), atau id teks di _store kalau teksnya ada di disk
+    __slots__ = ('id', 'path', 'filename', '_text', '_store', 'category', 'extracted_info', 'name') + PROFILE_FIELDS
+
+    # @param id: Id CV (index di CVStore)
+    # @param path: Path file PDF
+    # @param filename: Nama file PDF
+    # @param text: Teks hasil clean_text
+    # @param category: Kategori / application role (di-intern)
+    # @param extracted_info: Hasil RegexExtractor.extract_all
+    # @param name: Nama dari extracted_info atau filename
+    def __init__(self, id: int, path: str, filename: str, text: str, category: str,
+                 extracted_info: Dict[str, Any] = None, name: str = ''):
+        self.id = id
+        self.path = path
+        self.filename = filename
+        self.text = text
+        self.category = sys.intern(category)
+        self.extracted_info = extracted_info if extracted_info is not None else {}
+        self.name = name
+
+    @property
+    def text(self) -> str:
+        return self._text if self._store is None else self._store.get(self._text)
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        self._store = None
+
+    # @brief Memindahkan teks ke disk (kalau belum)
+    # @param store: DiskTextStore tujuan
+    # @return: None
+    def spill_text(self, store) -> None:
+        if self._store is None:
+            self._text = store.add(self._text)
+            self._store = store
+
+    # @brief Membuat record dari dict CV versi lama
+    # @param id: Id CV
+    # @param cv: Dict CV (path, filename, text, category, extracted_info, name, db_*, ...)
+    # @return: CVRecord
+    @classmethod
+    def from_dict(cls, id: int, cv: Dict[str, Any]) -> "CVRecord":
+        record = cls(id, cv.get('path', ''), cv.get('filename', ''), cv.get('text', ''),
+                     cv.get('category', ''), cv.get('extracted_info'), cv.get('name', ''))
+        for field in PROFILE_FIELDS:
+            if field in cv:
+                setattr(record, field, cv[field])
+        return record
+
+    # @brief Konversi balik ke dict (misal buat diekspor)
+    # @return: Dict dengan field yang sudah diisi
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in FIELDS[1:] if hasattr(self, field)}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in FIELDS and hasattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in FIELDS else default
+
+    def __repr__(self) -> str:
+        return f"CVRecord({self.id}, {self.path!r})"
+
+class CVStore:
+    # @param records: CVRecord / dict CV awal
+    # @param text_store: DiskTextStore (opsional); kalau ada, teks tiap CV yang ditambahkan disimpan di disk
+    def __init__(self, records: Iterable[Union[CVRecord, Dict[str, Any]]] = (), text_store=None):
+        self._records: List[CVRecord] = []
+        self._by_path: Dict[str, CVRecord] = {}
+        self.text_store = text_store
+        for record in records:
+            self.add(record)
+
+    # @brief Record dengan id tertentu dari CVRecord / dict
+    # @param id: Id yang mau dipakai
+    # @param cv: CVRecord atau dict CV versi lama
+    # @return: CVRecord
+    def _make(self, id: int, cv: Union[CVRecord, Dict[str, Any]]) -> CVRecord:
+        if isinstance(cv, CVRecord) and cv.id == id:
+            record = cv
+        else:
+            # record milik store lain dibuat ulang (field-nya tetap referensi yang sama)
+            record = CVRecord.from_dict(id, cv.to_dict() if isinstance(cv, CVRecord) else cv)
+        if self.text_store is not None:
+            record.spill_text(self.text_store)
+        return record
+
+    # @brief Menambah satu CV
+    # @param cv: CVRecord atau dict CV versi lama
+    # @return: Id CV yang baru
+    def add(self, cv: Union[CVRecord, Dict[str, Any]]) -> int:
+        id = len(self._records)
+        record = self._make(id, cv)
+        self._records.append(record)
+        self._by_path[record.path] = record
+        return id
+
+    # @brief Mengganti isi CV di id tertentu (id-nya tetap)
+    # @param id: Id CV
+    # @param cv: CVRecord atau dict CV yang baru
+    # @return: CVRecord yang baru
+    def replace(self, id: int, cv: Union[CVRecord, Dict[str, Any]]) -> CVRecord:
+        old = self._records[id]
+        if self._by_path.get(old.path) is old:
+            del self._by_path[old.path]
+        record = self._make(id, cv)
+        self._records[id] = record
+        self._by_path[record.path] = record
+        return record
+
+    # @brief Menghapus CV; id CV sesudahnya turun satu (urutannya tetap)
+    # @param id: Id CV
+    # @return: CVRecord yang dihapus
+    def remove(self, id: int) -> CVRecord:
+        record = self._records.pop(id)
+        if self._by_path.get(record.path) is record:
+            del self._by_path[record.path]
+        for i in range(id, len(self._records)):
+            self._records[i].id = i
+        return record
+
+    # @brief Mencari CV berdasarkan path
+    # @param path: Path file PDF
+    # @return: CVRecord, atau None kalau gak ada
+    def find(self, path: str) -> Optional[CVRecord]:
+        return self._by_path.get(path)
+
+    # @brief Semua kategori yang ada (masing-masing cuma satu objek string)
+    # @return: List kategori, urut
+    def categories(self) -> List[str]:
+        return sorted({record.category for record in self._records})
+
+    def __getitem__(self, id: int) -> CVRecord:
+        return self._records[id]
+
+    def __iter__(self) -> Iterator[CVRecord]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __bool__(self) -> bool:
+        return bool(self._records)
+
+    # map path dibangun ulang pas unpickle, jadi snapshot cuma nyimpen list record
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'records': self._records, 'text_store': self.text_store}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._records = state['records']
+        self.text_store = state.get('text_store')
+        self._by_path = {record.path: record for record in self._records}
+
+class SearchResult:
+    __slots__ = ('cv_id', 'match_count', 'keywords_found', 'unique_keywords_matched', 'record')
+
+    # @param record: CVRecord yang cocok (referensi, bukan salinan)
+    # @param match_count: Total kemunculan keyword
+    # @param keywords_found: Dict keyword -> jumlah (exact) atau info match fuzzy
+    # @param unique_keywords_matched: Banyak keyword berbeda yang ketemu
+    def __init__(self, record: CVRecord, match_count: int, keywords_found: Dict[str, Any], unique_keywords_matched: int):
+        self.cv_id = record.id
+        self.record = record
+        self.match_count = match_count
+        self.keywords_found = keywords_found
+        self.unique_keywords_matched = unique_keywords_matched
+
+    # akses gaya dict: field hasil dulu, lalu field record (path, name, db_*, ...)
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        return self.record[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        return self.record.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__ or key in self.record
+
+    def __repr__(self) -> str:
+        return f"SearchResult({self.cv_id}, match_count={self.match_count})"
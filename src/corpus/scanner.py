@@ -0,0 +1,59 @@
+##########################################################################
+##########################################################################
+## @file scanner.py
+## Ini isinya DirectoryScanner: polling folder data buat nyari PDF yang
+## baru ditambah, diubah, atau dihapus sejak scan terakhir, cukup dari
+## mtime dan ukuran file (gak baca isi PDF). State-nya (path relatif ->
+## (mtime_ns, size)) disimpan bareng snapshot, jadi pas startup cuma PDF
+## yang berubah yang perlu diekstrak ulang lewat CVSearcher.add_cv /
+## update_cv / remove_cv.
+##########################################################################
+##########################################################################
+
+import os
+from typing import List, Dict, Tuple, Optional
+
+# @brief Mengambil state semua PDF di folder data
+# @param directory: Folder data CV
+# @return: Dictionary <path relatif, (mtime_ns, ukuran)>
+def scan_directory(directory: str) -> Dict[str, Tuple[int, int]]:
+    states = {}
+    for root, dirs, files in os.walk(directory):
+        for file in files:
+            if not file.endswith('.pdf'):
+                continue
+            path = os.path.join(root, file)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue # file kehapus di tengah scan, kebaca lagi di scan berikutnya
+            states[os.path.relpath(path, directory)] = (stat.st_mtime_ns, stat.st_size)
+    return states
+
+class DirectoryScanner:
+    # @param directory: Folder data CV
+    # @param states: State scan terakhir (misal dari snapshot); None = scan sekarang jadi titik awal
+    def __init__(self, directory: str, states: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.directory = directory
+        self.states: Dict[str, Tuple[int, int]] = dict(states) if states is not None else scan_directory(directory)
+
+    # @brief Membandingkan isi folder sekarang dengan state scan terakhir, lalu state-nya diperbarui
+    # @return: Tuple (path baru, path yang berubah, path yang dihapus), path absolut seperti cv['path'], urut
+    def diff(self) -> Tuple[List[str], List[str], List[str]]:
+        current = scan_directory(self.directory)
+        added = sorted(path for path in current if path not in self.states)
+        changed = sorted(path for path, state in current.items() if path in self.states and self.states[path] != state)
+        removed = sorted(path for path in self.states if path not in current)
+        self.states = current
+
+        absolute = lambda paths: [os.path.join(self.directory, path) for path in paths]
+        return absolute(added), absolute(changed), absolute(removed)
+
+    # @brief Membuang path dari state, jadi di diff berikutnya muncul lagi sebagai path baru
+    # @details Dipakai buat PDF yang dilewati kebijakan load (misal kategori sudah penuh), biar
+    #          dipertimbangkan ulang begitu ada slot kosong
+    # @param paths: Path absolut
+    # @return: None
+    def forget(self, paths: List[str]) -> None:
+        for path in paths:
+            self.states.pop(os.path.relpath(path, self.directory), None)
@@ -0,0 +1,117 @@
+##########################################################################
+##########################################################################
+## @file signature.py
+## Ini isinya signature q-gram per CV buat prefilter exact match.
+## Tiap CV punya bitmap ukuran tetap (int Python, default 4096 bit) yang
+## isinya hash bigram & trigram dari teks lowercase-nya. Keyword juga
+## dipecah jadi q-gram; CV yang bitmap-nya bukan superset dari mask
+## keyword pasti gak ngandung keyword itu, jadi gak perlu di-scan.
+## Hash-nya pakai crc32 (bukan hash() bawaan yang diacak per proses),
+## jadi signature aman disimpan ke snapshot.
+##########################################################################
+##########################################################################
+
+import zlib
+from typing import List, Dict, Any, Iterable, Tuple
+
+SIGNATURE_BITS = 4096
+QGRAM_SIZES = (2, 3)
+
+class SignatureIndex:
+    # @param bits: Ukuran bitmap per CV (kelipatan 8)
+    # @param q_sizes: Panjang q-gram yang dimasukkan ke bitmap
+    def __init__(self, bits: int = SIGNATURE_BITS, q_sizes: Tuple[int, ...] = QGRAM_SIZES):
+        self.bits = bits
+        self.q_sizes = tuple(q_sizes)
+        self._signatures: List[int] = []
+        self._bit_cache: Dict[str, int] = {} # q-gram -> index bit, dipakai bareng semua CV
+
+    # @brief Index bit untuk satu q-gram
+    # @param gram: q-gram (sudah lowercase)
+    # @return: Index bit di bitmap
+    def _bit(self, gram: str) -> int:
+        bit = self._bit_cache.get(gram)
+        if bit is None:
+            bit = zlib.crc32(gram.encode('utf-8')) % self.bits
+            self._bit_cache[gram] = bit
+        return bit
+
+    # @brief Membuat bitmap dari semua q-gram sebuah teks
+    # @param text: Teks yang sudah lowercase
+    # @return: Bitmap dalam bentuk int
+    def signature(self, text: str) -> int:
+        grams = set()
+        for q in self.q_sizes:
+            grams.update(text[i:i + q] for i in range(len(text) - q + 1))
+
+        bitmap = bytearray(self.bits // 8)
+        for gram in grams:
+            bit = self._bit(gram)
+            bitmap[bit >> 3] |= 1 << (bit & 7)
+        return int.from_bytes(bitmap, 'little')
+
+    # @brief Mask q-gram sebuah keyword (keyword lebih pendek dari q-gram terkecil -> 0, lolos semua)
+    # @param keyword: Keyword yang sudah lowercase
+    # @return: Bitmap dalam bentuk int
+    def mask(self, keyword: str) -> int:
+        return self.signature(keyword)
+
+    # @brief Menghitung signature semua CV
+    # @param texts: Teks ternormalisasi sesuai urutan cv_data
+    # @return: None
+    def build(self, texts: Iterable[str]) -> None:
+        self._signatures = [self.signature(text) for text in texts]
+
+    # @brief Menambah signature satu CV di akhir
+    # @param text: Teks yang sudah lowercase
+    # @return: None
+    def append(self, text: str) -> None:
+        self._signatures.append(self.signature(text))
+
+    # @brief Menghitung ulang signature satu CV
+    # @param index: Index CV
+    # @param text: Teks yang sudah lowercase
+    # @return: None
+    def replace(self, index: int, text: str) -> None:
+        self._signatures[index] = self.signature(text)
+
+    # @brief Menghapus signature satu CV (index sesudahnya turun satu)
+    # @param index: Index CV
+    # @return: None
+    def remove(self, index: int) -> None:
+        del self._signatures[index]
+
+    # @brief Mengambil signature dalam bentuk yang bisa disimpan ke snapshot
+    # @return: Dict berisi parameter dan list signature
+    def export(self) -> Dict[str, Any]:
+        return {'bits': self.bits, 'q_sizes': self.q_sizes, 'values': self._signatures}
+
+    # @brief Memuat signature dari hasil export
+    # @param exported: Hasil export()
+    # @param count: Banyak CV yang diharapkan
+    # @return: True kalau cocok dan berhasil dimuat, False kalau parameternya beda
+    def load(self, exported: Dict[str, Any], count: int) -> bool:
+        if (exported.get('bits') != self.bits or tuple(exported.get('q_sizes', ())) != self.q_sizes
+                or len(exported.get('values', [])) != count):
+            return False
+        self._signatures = list(exported['values'])
+        return True
+
+    # @brief Signature milik satu CV
+    # @param index: Index CV
+    # @return: Bitmap dalam bentuk int
+    def signature_of(self, index: int) -> int:
+        return self._signatures[index]
+
+    # @brief Seberapa banyak q-gram mask yang ada di signature satu CV (prior murah buat fuzzy)
+    # @param index: Index CV
+    # @param mask: Mask q-gram (misal gabungan mask keyword)
+    # @return: Rasio bit mask yang nyala di signature, 0.0 - 1.0 (mask kosong -> 1.0)
+    def overlap(self, index: int, mask: int) -> float:
+        total = bin(mask).count('1')
+        if not total:
+            return 1.0
+        return bin(self._signatures[index] & mask).count('1') / total
+
+    def __len__(self) -> int:
+        return len(self._signatures)
@@ -0,0 +1,97 @@
+##########################################################################
+##########################################################################
+## @file snapshot.py
+## Ini isinya format snapshot untuk startup cepat: seluruh state korpus
+## yang sudah selesai di-load (teks, metadata CV, extracted_info, profil
+## DB, cache tabel algoritma) ditulis ke satu file biner berversi, lalu
+## dibaca lagi dengan satu kali mmap. Snapshot yang sudah basi tetap bisa
+## dipakai (allow_stale) kalau perubahannya mau diterapkan incremental
+## pakai state DirectoryScanner yang ikut tersimpan di payload.
+##
+## Layout file:
+##   MAGIC (8 byte) | versi (uint16) | panjang header (uint32)
+##   | header JSON (fingerprint folder data, jumlah CV, waktu dibuat)
+##   | payload pickle (state dari CVSearcher.export_state)
+##########################################################################
+##########################################################################
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import time
+from typing import Dict, Any, Optional
+
+MAGIC = b'CVSNAP\x00\x01'
+FORMAT_VERSION = 7
+_PREFIX = struct.Struct('<8sHI')
+
+# @brief Menghitung sidik jari folder data dari daftar PDF (path relatif, ukuran, mtime)
+# @param data_dir: Folder data CV
+# @return: Hash hex; berubah kalau ada PDF yang ditambah, dihapus, atau diubah
+def compute_fingerprint(data_dir: str) -> str:
+    entries = []
+    for root, dirs, files in os.walk(data_dir):
+        for file in files:
+            if not file.endswith('.pdf'):
+                continue
+            path = os.path.join(root, file)
+            stat = os.stat(path)
+            entries.append(f"{os.path.relpath(path, data_dir)}|{stat.st_size}|{stat.st_mtime_ns}")
+    entries.sort()
+    return hashlib.sha1('\n'.join(entries).encode('utf-8')).hexdigest()
+
+# @brief Menulis snapshot secara atomik (tulis ke file sementara lalu rename)
+# @param path: Path file snapshot
+# @param data_dir: Folder data yang jadi sumber state
+# @param state: State hasil CVSearcher.export_state()
+# @param fingerprint: Fingerprint yang sudah dihitung (opsional)
+# @return: None
+def write_snapshot(path: str, data_dir: str, state: Dict[str, Any], fingerprint: Optional[str] = None) -> None:
+    header = json.dumps({
+        'fingerprint': fingerprint or compute_fingerprint(data_dir),
+        'cv_count': len(state.get('cv_data', [])),
+        'created': time.time()
+    }).encode('utf-8')
+    payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+# @brief Membaca snapshot kalau masih valid untuk folder data saat ini
+# @param path: Path file snapshot
+# @param data_dir: Folder data yang mau dicocokkan
+# @param fingerprint: Fingerprint folder data yang sudah dihitung (opsional)
+# @param allow_stale: True = snapshot basi tetap dikembalikan (perubahan PDF diterapkan incremental oleh pemanggil)
+# @return: State, atau None kalau file gak ada, versinya beda, rusak, atau sudah basi (tanpa allow_stale)
+def read_snapshot(path: str, data_dir: str, fingerprint: Optional[str] = None, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, header_len = _PREFIX.unpack_from(mm, 0)
+                if magic != MAGIC or version != FORMAT_VERSION:
+                    print(f"Snapshot {path} has an unsupported format, ignoring it")
+                    return None
+
+                header_start = _PREFIX.size
+                header = json.loads(mm[header_start:header_start + header_len].decode('utf-8'))
+                if header['fingerprint'] != (fingerprint or compute_fingerprint(data_dir)):
+                    if not allow_stale:
+                        print(f"Snapshot {path} is stale, doing a full load")
+                        return None
+                    print(f"Snapshot {path} is stale, changed PDFs will be ingested incrementally")
+
+                with memoryview(mm) as view:
+                    return pickle.loads(view[header_start + header_len:])
+    except (OSError, ValueError, struct.error, pickle.UnpicklingError, EOFError) as e:
+        print(f"Error reading snapshot {path}: {e}")
+        return None
@@ -0,0 +1,124 @@
+##########################################################################
+##########################################################################
+## @file store.py
+## Ini isinya CorpusStore: tempat nyimpen teks CV yang sudah dinormalisasi
+## (lowercase) sekali aja pas load, biar algoritma gak perlu manggil
+## text.lower() ke seluruh teks CV di setiap query.
+## Kalau dikasih DiskTextStore, teks ternormalisasinya disimpan di disk
+## dan yang di memori cuma id teks per CV (array int64).
+##########################################################################
+##########################################################################
+
+from array import array
+from typing import List, Iterable, Iterator, Union
+
+class StoredTexts:
+    # @brief Tampilan list teks yang isinya dibaca dari DiskTextStore satu per satu
+    # @param store: DiskTextStore
+    # @param ids: Id teks per CV
+    def __init__(self, store, ids: array):
+        self.store = store
+        self.ids = ids
+
+    def __getitem__(self, index: int) -> str:
+        return self.store.get(self.ids[index])
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.store.get(id) for id in self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+class CorpusStore:
+    def __init__(self):
+        self._normalized: Union[List[str], array] = []
+        self._store = None # DiskTextStore kalau teksnya disimpan di disk
+
+    # @brief Normalisasi yang dipakai semua algoritma (harus sama persis dengan pattern.lower())
+    # @details Sengaja pakai lower(), bukan casefold(): casefold bisa ngubah panjang string
+    #          (misal 'ß' -> 'ss') sehingga posisi match gak lagi sejajar dengan teks asli.
+    # @param text: Teks asli
+    # @return: Teks yang sudah dinormalisasi
+    @staticmethod
+    def normalize(text: str) -> str:
+        return text.lower()
+
+    # @brief Teks ternormalisasi dalam bentuk yang disimpan (str, atau id teks di disk)
+    # @param text: Teks asli
+    # @return: str atau id teks
+    def _keep(self, text: str):
+        normalized = self.normalize(text)
+        return normalized if self._store is None else self._store.add(normalized)
+
+    # @brief Mengisi ulang store dari kumpulan teks asli
+    # @param texts: Teks CV sesuai urutan cv_data
+    # @param text_store: DiskTextStore (opsional); kalau ada, teks ternormalisasi ditulis ke disk
+    # @return: None
+    def build(self, texts: Iterable[str], text_store=None) -> None:
+        self._store = text_store
+        self._normalized = [] if text_store is None else array('q')
+        for text in texts:
+            self._normalized.append(self._keep(text))
+
+    # @brief Mengisi store dari teks yang sudah dinormalisasi (misal dari snapshot)
+    # @param normalized_texts: Teks hasil normalize() sesuai urutan cv_data, atau StoredTexts
+    # @return: None
+    def load_normalized(self, normalized_texts) -> None:
+        if isinstance(normalized_texts, StoredTexts):
+            self._store = normalized_texts.store
+            self._normalized = array('q', normalized_texts.ids)
+        else:
+            self._store = None
+            self._normalized = list(normalized_texts)
+
+    # @brief Menambah satu teks di akhir
+    # @param text: Teks asli
+    # @return: None
+    def append(self, text: str) -> None:
+        self._normalized.append(self._keep(text))
+
+    # @brief Mengganti teks satu CV
+    # @param index: Index CV
+    # @param text: Teks asli yang baru
+    # @return: None
+    def replace(self, index: int, text: str) -> None:
+        self._normalized[index] = self._keep(text)
+
+    # @brief Menghapus teks satu CV (index sesudahnya turun satu)
+    # @param index: Index CV
+    # @return: None
+    def remove(self, index: int) -> None:
+        del self._normalized[index]
+
+    # @brief Mengambil teks ternormalisasi tanpa menyalin (mode disk: di-decode dari mmap)
+    # @param index: Index CV
+    # @return: Teks lowercase milik CV tersebut
+    def normalized(self, index: int) -> str:
+        if self._store is None:
+            return self._normalized[index]
+        return self._store.get(self._normalized[index])
+
+    # @brief Panjang teks satu CV dalam karakter, tanpa membaca teksnya dari disk
+    # @param index: Index CV
+    # @return: Panjang teks
+    def length(self, index: int) -> int:
+        if self._store is None:
+            return len(self._normalized[index])
+        return self._store.length_of(self._normalized[index])
+
+    # @brief Semua teks ternormalisasi (referensi, bukan salinan)
+    # @return: List teks lowercase, atau StoredTexts kalau teksnya di disk
+    @property
+    def texts(self) -> Union[List[str], StoredTexts]:
+        if self._store is None:
+            return self._normalized
+        return StoredTexts(self._store, self._normalized)
+
+    # @brief Apakah teksnya disimpan di disk
+    # @return: True kalau pakai DiskTextStore
+    @property
+    def on_disk(self) -> bool:
+        return self._store is not None
+
+    def __len__(self) -> int:
+        return len(self._normalized)
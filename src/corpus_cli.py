@@ -0,0 +1,149 @@
+##########################################################################
+##########################################################################
+## @file corpus_cli.py
+## Ini isinya CLI untuk korpus mmap (corpus/mmap_corpus.py) dan index
+## posisional (corpus/positional_index.py) tanpa GUI:
+##   build  -> ekstrak PDF di folder data lalu tulis cv_corpus.bin dan
+##             cv_index.bin (urutan CV sama)
+##   search -> exact match keyword langsung di atas file korpus yang
+##             di-mmap (atau dari index pakai --index), ranking sama
+##             dengan bagian exact CVSearcher.search
+## Beberapa proses search yang buka file yang sama cukup berbagi satu
+## salinan korpus di page cache.
+##
+## Contoh:
+##   python src/corpus_cli.py build
+##   python src/corpus_cli.py search python react --top-n 5
+##   python src/corpus_cli.py search "data analysis" --index
+##########################################################################
+##########################################################################
+
+import argparse
+import heapq
+import os
+import sys
+import time
+from typing import List, Dict, Any, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from algorithms.query import compile_query
+from corpus.mmap_corpus import write_corpus, MmapCorpus, ENCODINGS
+from corpus.positional_index import write_index_from_extracted, PositionalIndex
+from corpus.store import CorpusStore
+from extractors.pdf_extractor import PDFExtractor
+from extractors.regex_extractor import RegexExtractor
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+DEFAULT_DATA_DIR = os.path.join(BASE_DIR, 'data', 'data')
+DEFAULT_CORPUS_PATH = os.path.join(BASE_DIR, 'data', 'cv_corpus.bin')
+DEFAULT_INDEX_PATH = os.path.join(BASE_DIR, 'data', 'cv_index.bin')
+ALGORITHMS = ['KMP', 'AC', 'NATIVE'] # KMP/AC scan bytes per CV, NATIVE pakai mmap.find sekali lewat
+
+# @brief Mengekstrak semua PDF di folder data lalu menulis file korpus mmap (dan index posisional)
+# @param data_dir: Folder data CV (subfolder = kategori)
+# @param corpus_path: Path file korpus yang ditulis
+# @param encoding: Encoding blob teks ('utf-8' atau 'utf-32-le')
+# @param index_path: Path file index posisional, None = gak ditulis
+# @param memory_limit: Batas buffer writer index dalam byte (lihat IndexWriter)
+# @return: Jumlah CV yang ditulis
+def build_corpus(data_dir: str, corpus_path: str, encoding: str = 'utf-8', index_path: Optional[str] = None,
+                 memory_limit: int = 64 * 1024 * 1024) -> int:
+    pdf_extractor = PDFExtractor(cache_texts=False)
+    regex_extractor = RegexExtractor()
+
+    cv_data = pdf_extractor.extract_all_pdfs_from_directory(data_dir)
+    for cv in cv_data:
+        # nama diambil dengan cara yang sama kayak LoaderThread di MainWindow
+        personal_info = regex_extractor.extract_all(cv['text']).get('personal_info', {})
+        cv['name'] = personal_info.get('name', cv['filename'].replace('.pdf', ''))
+
+    write_corpus(corpus_path, (CorpusStore.normalize(cv['text']) for cv in cv_data), cv_data, encoding)
+    if index_path is not None:
+        write_index_from_extracted(index_path, cv_data, memory_limit)
+    return len(cv_data)
+
+# @brief Exact match keyword di file korpus mmap
+# @param corpus: MmapCorpus yang sudah dibuka
+# @param keywords: List keyword
+# @param top_n: Banyak hasil teratas
+# @param algorithm: "KMP", "AC", atau "NATIVE"
+# @param index: PositionalIndex dari build yang sama; kalau diisi, jumlah kemunculan diambil dari index
+# @return: List dict hasil (metadata CV + keywords_found, match_count, unique_keywords_matched)
+def search_corpus(corpus: MmapCorpus, keywords: List[str], top_n: int, algorithm: str = "KMP",
+                  index: Optional[PositionalIndex] = None) -> List[Dict[str, Any]]:
+    if index is not None:
+        if len(index) != len(corpus):
+            raise ValueError(f"Index has {len(index)} CVs but the corpus has {len(corpus)}, rebuild both")
+        exact_counts = index.exact_match(keywords)
+    else:
+        # query mode bytes cuma bisa discan langsung di blob UTF-8
+        bytes_mode = algorithm in ('KMP', 'AC') and corpus.unit == 1
+        query = compile_query(keywords, algorithm, encoding=corpus.encoding if bytes_mode else None)
+        exact_counts = corpus.exact_match(query)
+
+    # urut index dulu biar seri diputus dengan cara yang sama kayak CVSearcher.search
+    winners = heapq.nlargest(top_n, sorted(exact_counts.items()),
+                             key=lambda item: (len(item[1]), sum(item[1].values())))
+    results = []
+    for cv_id, counts in winners:
+        result = corpus.meta(cv_id)
+        result.update({
+            'keywords_found': counts,
+            'match_count': sum(counts.values()),
+            'unique_keywords_matched': len(counts)
+        })
+        results.append(result)
+    return results
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build and search the mmap CV corpus file")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help="Ekstrak PDF lalu tulis file korpus")
+    build_parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR)
+    build_parser.add_argument('--corpus', default=DEFAULT_CORPUS_PATH)
+    build_parser.add_argument('--encoding', choices=ENCODINGS, default='utf-8')
+    build_parser.add_argument('--index-path', default=DEFAULT_INDEX_PATH)
+    build_parser.add_argument('--no-index', action='store_true', help="Gak usah nulis index posisional")
+    build_parser.add_argument('--memory-limit-mb', type=int, default=64, help="Batas buffer writer index")
+
+    search_parser = subparsers.add_parser('search', help="Cari keyword di file korpus")
+    search_parser.add_argument('keywords', nargs='+')
+    search_parser.add_argument('--corpus', default=DEFAULT_CORPUS_PATH)
+    search_parser.add_argument('--algorithm', choices=ALGORITHMS, default='KMP')
+    search_parser.add_argument('--top-n', type=int, default=10)
+    search_parser.add_argument('--index', action='store_true', help="Hitung kemunculan dari index posisional")
+    search_parser.add_argument('--index-path', default=DEFAULT_INDEX_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        index_path = None if args.no_index else args.index_path
+        count = build_corpus(args.data_dir, args.corpus, args.encoding, index_path, args.memory_limit_mb * 1024 * 1024)
+        print(f"Wrote {count} CVs to {args.corpus}" + (f" and {index_path}" if index_path else ""))
+        return 0
+
+    for path in [args.corpus] + ([args.index_path] if args.index else []):
+        if not os.path.exists(path):
+            print(f"File {path} not found, run 'build' first")
+            return 1
+
+    index = PositionalIndex(args.index_path) if args.index else None
+    try:
+        with MmapCorpus(args.corpus) as corpus:
+            start = time.perf_counter()
+            results = search_corpus(corpus, args.keywords, args.top_n, args.algorithm, index)
+            elapsed = time.perf_counter() - start
+
+            print(f"{len(results)} result(s) from {len(corpus)} CVs in {elapsed * 1000:.1f} ms")
+            for rank, result in enumerate(results, 1):
+                keywords = ', '.join(f"{keyword}: {count}" for keyword, count in result['keywords_found'].items())
+                print(f"{rank}. {result['name']} ({result['category']}) - {result['match_count']} matches [{keywords}]")
+                print(f"   {result['path']}")
+    finally:
+        if index is not None:
+            index.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
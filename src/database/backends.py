@@ -0,0 +1,149 @@
+import os
+import sqlite3
+from functools import lru_cache
+
+# Kelas dasar storage engine yang dipakai DatabaseConnection.
+# Error = kelas exception driver-nya (yang ditangkap DatabaseConnection)
+class StorageBackend:
+    name = "base"
+    Error = Exception
+
+    # @brief Membuka koneksi ke database
+    # @return: Tuple (connection, cursor), (None, None) kalau gagal konek
+    def connect(self):
+        raise NotImplementedError
+
+    # @brief Mengecek apakah koneksi masih hidup
+    # @param connection: Koneksi hasil connect()
+    # @return: True kalau masih tersambung
+    def is_connected(self, connection):
+        return connection is not None
+
+    # @brief Menerjemahkan query yang ditulis pakai placeholder %s ke paramstyle backend
+    # @param query: Query SQL
+    # @return: Query yang siap dieksekusi backend ini
+    def prepare(self, query):
+        return query
+
+    # @brief DDL tabel ApplicantProfile dan ApplicationDetail untuk backend ini
+    # @return: List statement CREATE TABLE
+    def create_table_statements(self):
+        raise NotImplementedError
+
+
+# Backend MySQL server (setup awal aplikasi)
+class MySQLBackend(StorageBackend):
+    name = "mysql"
+
+    def __init__(self):
+        # import di sini biar deployment SQLite gak wajib install mysql-connector
+        import mysql.connector
+        self._mysql = mysql.connector
+        self.Error = mysql.connector.Error
+
+    def connect(self):
+        connection = self._mysql.connect(
+            host=os.getenv('DB_HOST', 'localhost'),
+            database=os.getenv('DB_NAME', 'ats_db'),
+            user=os.getenv('DB_USER', 'root'),
+            password=os.getenv('DB_PASSWORD', '')
+        )
+        if not connection.is_connected():
+            return None, None
+        return connection, connection.cursor(dictionary=True)
+
+    def is_connected(self, connection):
+        return connection is not None and connection.is_connected()
+
+    def create_table_statements(self):
+        return [
+            """
+            CREATE TABLE IF NOT EXISTS ApplicantProfile (
+                applicant_id INT AUTO_INCREMENT PRIMARY KEY,
+                first_name VARCHAR(50) DEFAULT NULL,
+                last_name VARCHAR(50) DEFAULT NULL,
+                date_of_birth DATE DEFAULT NULL,
+                address VARCHAR(255) DEFAULT NULL,
+                phone_number varchar(100) DEFAULT NULL)
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS ApplicationDetail (
+                detail_id INT AUTO_INCREMENT PRIMARY KEY,
+                applicant_id INT NOT NULL,
+                application_role VARCHAR(100) DEFAULT NULL,
+                cv_path TEXT,
+                FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
+            )
+            """
+        ]
+
+
+@lru_cache(maxsize=256)
+def _to_qmark(query):
+    # string hasil translasi harus identik tiap panggilan biar statement cache sqlite3 kepakai
+    return query.replace('%s', '?')
+
+
+# baris hasil query jadi dict, sama kayak cursor(dictionary=True) di MySQL
+def _dict_factory(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+# Backend SQLite di dalam proses (mode WAL), skemanya sama dengan MySQL
+class SQLiteBackend(StorageBackend):
+    name = "sqlite"
+    Error = sqlite3.Error
+
+    # @param path: Path file database (default DB_PATH di .env, ':memory:' = database di memori)
+    def __init__(self, path=None):
+        self.path = path or os.getenv('DB_PATH', 'ats_db.sqlite3')
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, check_same_thread=False, cached_statements=256)
+        connection.row_factory = _dict_factory
+        if self.path != ':memory:':
+            connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection, connection.cursor()
+
+    def prepare(self, query):
+        return _to_qmark(query)
+
+    def create_table_statements(self):
+        return [
+            """
+            CREATE TABLE IF NOT EXISTS ApplicantProfile (
+                applicant_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                first_name VARCHAR(50) DEFAULT NULL,
+                last_name VARCHAR(50) DEFAULT NULL,
+                date_of_birth DATE DEFAULT NULL,
+                address VARCHAR(255) DEFAULT NULL,
+                phone_number VARCHAR(100) DEFAULT NULL)
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS ApplicationDetail (
+                detail_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                applicant_id INT NOT NULL,
+                application_role VARCHAR(100) DEFAULT NULL,
+                cv_path TEXT,
+                FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
+            )
+            """
+        ]
+
+
+BACKENDS = {
+    'mysql': MySQLBackend,
+    'sqlite': SQLiteBackend,
+}
+
+
+# @brief Membuat backend sesuai DB_BACKEND di .env (default mysql)
+# @param name: Nama backend ('mysql' atau 'sqlite'), None = ambil dari DB_BACKEND
+# @return: Instance StorageBackend
+def get_backend(name=None):
+    name = (name or os.getenv('DB_BACKEND', 'mysql')).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown DB_BACKEND '{name}', choose one of: {', '.join(BACKENDS)}")
+    return BACKENDS[name]()
@@ -1,97 +1,79 @@
-import mysql.connector
-from mysql.connector import Error
 import os
 from dotenv import load_dotenv
 
+from database.backends import get_backend
+
 load_dotenv()
 
 class DatabaseConnection:
-    def __init__(self):
+    def __init__(self, backend=None):
+        self.backend = backend
         self.connection = None
         self.cursor = None
-        
+
     def connect(self):
+        if self.backend is None:
+            self.backend = get_backend()
         try:
-            self.connection = mysql.connector.connect(
-                host=os.getenv('DB_HOST', 'localhost'),
-                database=os.getenv('DB_NAME', 'ats_db'),
-                user=os.getenv('DB_USER', 'root'),
-                password=os.getenv('DB_PASSWORD', '')
-            )
-            
-            if self.connection.is_connected():
-                self.cursor = self.connection.cursor(dictionary=True)
-                print("Successfully connected to MySQL database")
-                return True
-                
-        except Error as e:
-            print(f"Error connecting to MySQL: {e}")
+            self.connection, self.cursor = self.backend.connect()
+        except self.backend.Error as e:
+            print(f"Error connecting to {self.backend.name} database: {e}")
+            self.connection = None
+            self.cursor = None
             return False
-    
+
+        if self.backend.is_connected(self.connection):
+            print(f"Successfully connected to {self.backend.name} database")
+            return True
+        return False
+
     def execute_query(self, query, params=None):
         try:
+            query = self.backend.prepare(query)
             if params:
                 self.cursor.execute(query, params)
             else:
                 self.cursor.execute(query)
             self.connection.commit()
             return True
-        except Error as e:
+        except self.backend.Error as e:
             print(f"Error executing query: {e}")
             self.connection.rollback()
             return False
-    
+
     def fetch_all(self, query, params=None):
         try:
+            query = self.backend.prepare(query)
             if params:
                 self.cursor.execute(query, params)
             else:
                 self.cursor.execute(query)
             return self.cursor.fetchall()
-        except Error as e:
+        except self.backend.Error as e:
             print(f"Error fetching data: {e}")
             return []
-    
+
     def fetch_one(self, query, params=None):
         try:
+            query = self.backend.prepare(query)
             if params:
                 self.cursor.execute(query, params)
             else:
                 self.cursor.execute(query)
             return self.cursor.fetchone()
-        except Error as e:
+        except self.backend.Error as e:
             print(f"Error fetching data: {e}")
             return None
-    
+
     def close(self):
-        if self.connection and self.connection.is_connected():
+        if self.backend and self.backend.is_connected(self.connection):
             self.cursor.close()
             self.connection.close()
-            print("MySQL connection closed")
-    
+            self.connection = None
+            print(f"{self.backend.name} connection closed")
+
     def create_tables(self):
-        # Create ApplicantProfile table
-        create_applicant_profile = """
-        CREATE TABLE IF NOT EXISTS ApplicantProfile (
-            applicant_id INT AUTO_INCREMENT PRIMARY KEY,
-            first_name VARCHAR(50) DEFAULT NULL,
-            last_name VARCHAR(50) DEFAULT NULL,
-            date_of_birth DATE DEFAULT NULL,
-            address VARCHAR(255) DEFAULT NULL,
-            phone_number varchar(100) DEFAULT NULL)
-        """
-        
-        # Create ApplicationDetail table
-        create_application_detail = """
-        CREATE TABLE IF NOT EXISTS ApplicationDetail (
-            detail_id INT AUTO_INCREMENT PRIMARY KEY,
-            applicant_id INT NOT NULL,
-            application_role VARCHAR(100) DEFAULT NULL,
-            cv_path TEXT,
-            FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
-        )
-        """
-        
-        self.execute_query(create_applicant_profile)
-        self.execute_query(create_application_detail)
-        print("Tables created successfully")
\ No newline at end of file
+        # DDL-nya beda tiap backend (AUTO_INCREMENT vs AUTOINCREMENT)
+        for statement in self.backend.create_table_statements():
+            self.execute_query(statement)
+        print("Tables created successfully")
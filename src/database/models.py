@@ -3,8 +3,8 @@ from encryption.custom_encryption import CustomEncryption
 from datetime import datetime
 
 class ApplicantModel:
-    def __init__(self):
-        self.db = DatabaseConnection()
+    def __init__(self, backend=None):
+        self.db = DatabaseConnection(backend)
         self.encryption = CustomEncryption()
         self.db.connect()
         self.db.create_tables()
@@ -96,8 +96,8 @@ class ApplicantModel:
 
 
 class ApplicationModel:
-    def __init__(self):
-        self.db = DatabaseConnection()
+    def __init__(self, backend=None):
+        self.db = DatabaseConnection(backend)
         self.db.connect()
     
     def create_application(self, applicant_id, application_role, cv_path):
@@ -1,11 +1,15 @@
 import PyPDF2
 import os
+import random
 import sys
 from datetime import datetime
 
 class PDFExtractor:
-    def __init__(self):
+    # cache_texts=False: teks hasil ekstraksi gak disimpan lagi di extracted_texts
+    # (misal kalau sudah dipegang CVSearcher / file korpus mmap)
+    def __init__(self, cache_texts=True):
         self.extracted_texts = {}
+        self.cache_texts = cache_texts
         self.show_progress = True
         self.debug_mode = True
         
@@ -22,31 +26,58 @@ class PDFExtractor:
             with open(filepath, 'w', encoding='utf-8', errors='ignore') as f:
                 f.write(content)
     
-    def extract_text_from_pdf(self, pdf_path):
+    # Generator halaman: tiap halaman di-yield begitu selesai diekstrak (plus "\n" pemisah),
+    # jadi matcher streaming bisa jalan sambil PyPDF2 masih ngerjain halaman berikutnya
+    def iter_raw_pages(self, pdf_path):
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            
+            page_count = len(pdf_reader.pages)
+
+            for page_num in range(page_count):
+                page = pdf_reader.pages[page_num]
+                page_text = page.extract_text()
+                yield page_text + "\n"
+    
+    def extract_raw_text_from_pdf(self, pdf_path):
+        return ''.join(self.iter_raw_pages(pdf_path))
+    
+    # Cari keyword per halaman pakai StreamingMatcher (algorithms/streaming.py).
+    # Posisi yang dikembalikan adalah offset di teks mentah (gabungan halaman sebelum clean_text),
+    # bukan di cv['text']. Error ekstraksi (file rusak, PyPDF2 gagal) dilempar ke pemanggil,
+    # biar hasil parsial dari halaman-halaman awal gak kebaca seolah hasil lengkap.
+    def stream_search_pdf(self, pdf_path, matcher):
+        for page_text in self.iter_raw_pages(pdf_path):
+            matcher.feed(page_text)
+        return matcher.finish()
+    
+    # matcher (opsional): StreamingMatcher yang disuapin tiap halaman begitu selesai diekstrak,
+    # hasilnya diambil pakai matcher.finish() setelah fungsi ini selesai. Posisinya offset di teks
+    # mentah (sebelum clean_text). Kalau ekstraksi gagal (return ""), matcher di-reset jadi
+    # finish() kosong, gak ada hasil parsial.
+    def extract_text_from_pdf(self, pdf_path, matcher=None):
         try:
             pdf_name = os.path.basename(pdf_path).replace('.pdf', '')
-            raw_text = ""
+            if matcher is None:
+                raw_text = self.extract_raw_text_from_pdf(pdf_path)
+            else:
+                pages = []
+                for page_text in self.iter_raw_pages(pdf_path):
+                    matcher.feed(page_text)
+                    pages.append(page_text)
+                raw_text = ''.join(pages)
             
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                page_count = len(pdf_reader.pages)
-
-                page_texts = []
-                for page_num in range(page_count):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    page_texts.append(f"=== PAGE {page_num + 1} ===\n{page_text}\n")
-                    raw_text += page_text + "\n"
-                
-                cleaned_text = self.clean_text(raw_text, pdf_name)
+            cleaned_text = self.clean_text(raw_text, pdf_name)
+            if self.cache_texts:
                 self.extracted_texts[pdf_path] = cleaned_text
-                
-                return cleaned_text
+            
+            return cleaned_text
                 
         except Exception as e:
             error_msg = f"Error extracting text from {pdf_path}: {e}"
             print(error_msg)
+            if matcher is not None:
+                matcher.reset()
             self.save_debug(f"error.txt", error_msg, pdf_name)
             return ""
     
@@ -96,58 +127,70 @@ class PDFExtractor:
         
         return cleaned.strip()
     
-    def extract_all_pdfs_from_directory(self, directory_path):
-        extracted_data = []
-        category_count = {}
-        total_files = 0
-        processed_files = 0
+    # Ekstrak satu PDF jadi dict CV (dipakai juga buat ingest satu file lewat DirectoryScanner),
+    # kategori = nama folder PDF-nya. None kalau teksnya kosong / gagal.
+    # matcher (opsional): diteruskan ke extract_text_from_pdf
+    def extract_cv(self, pdf_path, matcher=None):
+        text = self.extract_text_from_pdf(pdf_path, matcher)
+        if not text:
+            return None
+        return {
+            'path': pdf_path,
+            'filename': os.path.basename(pdf_path),
+            'text': text,
+            'category': os.path.basename(os.path.dirname(pdf_path))
+        }
+    
+    # Pilih PDF yang mau di-load, urut folder lalu nama file:
+    # mode 'all' = semua, 'per_category' = limit file pertama per kategori, 'sample' = limit file acak (seed)
+    def select_pdfs(self, directory_path, mode='all', limit=None, seed=0):
+        selected = []
         
         print("\n=== Scanning for PDF files ===")
-        for root, dirs, files in os.walk(directory_path):
+        for root, dirs, files in sorted(os.walk(directory_path)):
             category = os.path.basename(root)
-            pdf_files = [f for f in files if f.endswith('.pdf')]
+            pdf_files = sorted([f for f in files if f.endswith('.pdf')])
             if pdf_files:
                 print(f"Found {len(pdf_files)} PDFs in {category}")
-                total_files += min(len(pdf_files), 20)  
+                if mode == 'per_category':
+                    pdf_files = pdf_files[:limit]
+                selected.extend(os.path.join(root, f) for f in pdf_files)
+        
+        if mode == 'sample' and limit < len(selected):
+            chosen = set(random.Random(seed).sample(range(len(selected)), limit))
+            selected = [path for i, path in enumerate(selected) if i in chosen]
+        
+        return selected
+    
+    # Generator dict CV dari daftar PDF: tiap CV di-yield begitu selesai diekstrak,
+    # jadi pemanggil bisa langsung proses / simpan ke disk tanpa nahan semua teks
+    def iter_pdfs(self, pdf_paths):
+        total_files = len(pdf_paths)
+        processed_files = 0
+        successful = 0
         
         print(f"\nTotal PDFs to process: {total_files}")
         print("=== Starting extraction ===\n")
         
         start_time = datetime.now()
         
-        for root, dirs, files in os.walk(directory_path):
-            category = os.path.basename(root)
-            pdf_files = sorted([f for f in files if f.endswith('.pdf')])
+        for pdf_path in pdf_paths:
+            category = os.path.basename(os.path.dirname(pdf_path))
             
-            for file in pdf_files:
-                # Limit to 20 files per category
-                if category not in category_count:
-                    category_count[category] = 0
-                
-                if category_count[category] >= 20:
-                    continue
-                
-                pdf_path = os.path.join(root, file)
-                
-                # Show progress
-                processed_files += 1
-                print(f"[{processed_files}/{total_files}] Processing: {category}/{file}", end='')
-                sys.stdout.flush()
-                
-                # Extract text
-                text = self.extract_text_from_pdf(pdf_path)
-                
-                if text:
-                    extracted_data.append({
-                        'path': pdf_path,
-                        'filename': file,
-                        'text': text,
-                        'category': category
-                    })
-                    category_count[category] += 1
-                    print(" ✓")
-                else:
-                    print(" ✗ (failed)")
+            # Show progress
+            processed_files += 1
+            print(f"[{processed_files}/{total_files}] Processing: {category}/{os.path.basename(pdf_path)}", end='')
+            sys.stdout.flush()
+            
+            # Extract text
+            cv = self.extract_cv(pdf_path)
+            
+            if cv:
+                successful += 1
+                print(" ✓")
+                yield cv
+            else:
+                print(" ✗ (failed)")
         
         # Show completion statistics
         end_time = datetime.now()
@@ -155,13 +198,14 @@ class PDFExtractor:
         
         print(f"\n=== Extraction Complete ===")
         print(f"Total processed: {processed_files} files")
-        print(f"Successful: {len(extracted_data)} files")
-        print(f"Failed: {processed_files - len(extracted_data)} files")
+        print(f"Successful: {successful} files")
+        print(f"Failed: {processed_files - successful} files")
         print(f"Time taken: {duration:.2f} seconds")
-        print(f"Average: {duration/processed_files:.2f} seconds per file")
+        print(f"Average: {duration/max(processed_files, 1):.2f} seconds per file")
         print("========================\n")
-        
-        return extracted_data
+    
+    def extract_all_pdfs_from_directory(self, directory_path, mode='all', limit=None, seed=0):
+        return list(self.iter_pdfs(self.select_pdfs(directory_path, mode, limit, seed)))
     
     def get_cached_text(self, pdf_path):
         return self.extracted_texts.get(pdf_path, None)
\ No newline at end of file
@@ -7,21 +7,74 @@ import time
 from threading import Thread
 import random
 from datetime import datetime, timedelta
+from collections import Counter
 
-from algorithms.kmp import KMP
-from algorithms.boyer_moore import BoyerMoore
-from algorithms.aho_corasick import AhoCorasick
-from algorithms.levenshtein import LevenshteinDistance
 from extractors.pdf_extractor import PDFExtractor
 from extractors.regex_extractor import RegexExtractor
 from database.models import ApplicantModel, ApplicationModel
 from gui.summary_window import SummaryWindow
-from utils.seed import Seeder
+from search.cv_searcher import CVSearcher
+from algorithms.vectorized import NUMPY_AVAILABLE
+from algorithms.streaming import STREAMING_MATCHERS, StreamingAhoCorasick
+from corpus.snapshot import compute_fingerprint, read_snapshot, write_snapshot
+from corpus.scanner import DirectoryScanner
+from corpus.loading import LoadPolicy, estimate_corpus_memory
+from corpus.disk_texts import DiskTextStore
+from corpus.records import CVStore
+
+SNAPSHOT_FILENAME = "cv_snapshot.bin"
+TEXTS_FILENAME = "cv_texts.bin" # teks CV di disk kalau korpus lewat MEMORY_BUDGET_MB
+
+# Isi extracted_info dan name satu CV hasil PDFExtractor (dipakai load penuh maupun ingest incremental)
+def enrich_cv(cv, regex_extractor):
+    cv['extracted_info'] = regex_extractor.extract_all(cv['text'])
+    
+    # Get name from extracted info or filename
+    personal_info = cv['extracted_info'].get('personal_info', {})
+    cv['name'] = personal_info.get('name', cv['filename'].replace('.pdf', ''))
+    return cv
+
+# Ekstrak ulang PDF yang baru/berubah di background, hasilnya diterapkan ke searcher di thread GUI.
+# Kalau ada keyword pencarian terakhir, tiap PDF sekalian dicek pakai StreamingMatcher sambil
+# halamannya diekstrak (WM/NATIVE/NUMPY gak punya versi streaming -> Aho-Corasick)
+class IngestThread(QThread):
+    finished_signal = pyqtSignal(list, list, dict)
+    
+    def __init__(self, pdf_extractor, regex_extractor, paths, keywords=None, algorithm="AC"):
+        super().__init__()
+        self.pdf_extractor = pdf_extractor
+        self.regex_extractor = regex_extractor
+        self.paths = paths
+        self.keywords = keywords or []
+        self.algorithm = algorithm
+        self.result = None # (cvs, failed, matches), dipakai closeEvent kalau sinyalnya belum sempat diproses
+    
+    def run(self):
+        cvs = []
+        failed = []
+        matches = {} # path -> keyword pencarian terakhir yang ketemu di PDF itu
+        matcher = STREAMING_MATCHERS.get(self.algorithm, StreamingAhoCorasick)(self.keywords) if self.keywords else None
+        for path in self.paths:
+            if matcher is not None:
+                matcher.reset()
+            cv = self.pdf_extractor.extract_cv(path, matcher)
+            if cv:
+                cvs.append(enrich_cv(cv, self.regex_extractor))
+                # cuma nama keyword-nya yang dipakai, posisinya offset teks mentah (bukan cv['text'])
+                found = matcher.finish() if matcher is not None else {}
+                if found:
+                    matches[path] = list(found)
+            else:
+                failed.append(path)
+        self.result = (cvs, failed, matches)
+        self.finished_signal.emit(cvs, failed, matches)
 
 class CVCard(QWidget):
-    def __init__(self, cv_data, parent=None):
+    # result: SearchResult dari CVSearcher.search (data CV-nya ada di result.record)
+    def __init__(self, result, parent=None):
         super().__init__(parent)
-        self.cv_data = cv_data
+        self.result = result
+        self.cv = result.record
         self.parent_window = parent
         self.init_ui()
     
@@ -53,19 +106,19 @@ class CVCard(QWidget):
         """)
         
         # Name - Use decrypted name
-        fullname = self.cv_data.get('db_first_name', '') + ' ' + self.cv_data.get('db_last_name', '')
+        fullname = self.cv.get('db_first_name', '') + ' ' + self.cv.get('db_last_name', '')
         name = fullname if fullname else "Fulan"
         name_label = QLabel(f"<b>{fullname}</b>")
         name_label.setFont(QFont("Arial", 12))
         layout.addWidget(name_label)
         
         # Match count
-        match_label = QLabel(f"{self.cv_data['match_count']} matches")
+        match_label = QLabel(f"{self.result.match_count} matches")
         layout.addWidget(match_label)
         
         # Keywords found
         keywords_text = ""
-        for keyword, info in self.cv_data['keywords_found'].items():
+        for keyword, info in self.result.keywords_found.items():
             # If info is a dict (fuzzy), show matched words
             if isinstance(info, dict) and 'matches' in info:
                 matches = info['matches']
@@ -95,17 +148,22 @@ class CVCard(QWidget):
         self.setMaximumHeight(200)
     
     def show_summary(self):
-        summary_window = SummaryWindow(self.cv_data, self)
+        # posisi keyword exact baru dihitung di sini (search cuma butuh jumlahnya)
+        exact_keywords = [keyword for keyword, info in self.result.keywords_found.items() if not isinstance(info, dict)]
+        keyword_matches = {}
+        if exact_keywords and self.parent_window is not None:
+            keyword_matches = self.parent_window.searcher.match_positions(self.cv.path, exact_keywords)
+        summary_window = SummaryWindow(self.cv, self, keyword_matches)
         summary_window.show()
     
     def view_cv(self):
         try:
             if sys.platform == "win32":
-                os.startfile(self.cv_data['path'])
+                os.startfile(self.cv.path)
             elif sys.platform == "darwin":
-                os.system(f"open {self.cv_data['path']}")
+                os.system(f"open {self.cv.path}")
             else:
-                os.system(f"xdg-open {self.cv_data['path']}")
+                os.system(f"xdg-open {self.cv.path}")
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Cannot open CV: {str(e)}")
 
@@ -113,15 +171,32 @@ class CVCard(QWidget):
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.pdf_extractor = PDFExtractor()
+        self.pdf_extractor = PDFExtractor(cache_texts=False) # teksnya sudah dipegang CVSearcher
         self.regex_extractor = RegexExtractor()
-        self.kmp = KMP()
-        self.boyer_moore = BoyerMoore()
-        self.aho_corasick = AhoCorasick()
-        self.levenshtein = LevenshteinDistance()
+        self.searcher = CVSearcher()
+        # Batas waktu tahap fuzzy biar pencarian tetap responsif (FUZZY_BUDGET_MS=0 -> tanpa batas)
+        fuzzy_budget_ms = float(os.getenv('FUZZY_BUDGET_MS', '1000'))
+        self.searcher.fuzzy_budget = fuzzy_budget_ms / 1000 if fuzzy_budget_ms > 0 else None
+        # Exact match multi-core untuk korpus besar (SEARCH_WORKERS=0/1 -> sekuensial)
+        search_workers = int(os.getenv('SEARCH_WORKERS', '0'))
+        if search_workers > 1:
+            self.searcher.enable_parallel(search_workers)
         
         self.cv_data = []
         self.current_algorithm = "KMP"
+        self.data_path = None
+        self.snapshot_path = None
+        self.snapshot_fingerprint = None
+        self.scanner = None
+        self.ingest_thread = None
+        self.ingest_pending = False # diff scanner sudah maju tapi hasil ingest-nya belum diterapkan
+        # Polling folder data: PDF baru/berubah/dihapus di-ingest tanpa load ulang (SCAN_INTERVAL_MS=0 -> mati)
+        self.scan_timer = QTimer(self)
+        self.scan_timer.timeout.connect(self.poll_directory)
+        self.scan_interval_ms = int(os.getenv('SCAN_INTERVAL_MS', '10000'))
+        self.last_keywords = [] # keyword pencarian terakhir, dicek juga ke PDF yang baru di-ingest
+        # PDF mana yang di-load + budget memori (LOAD_POLICY, LOAD_SEED, MEMORY_BUDGET_MB)
+        self.load_policy = LoadPolicy.from_env()
         
         self.init_ui()
         self.load_cv_data()
@@ -210,6 +285,20 @@ class MainWindow(QMainWindow):
         self.ac_radio.toggled.connect(lambda: self.set_algorithm("AC"))
         algo_layout.addWidget(self.ac_radio)
         
+        self.wm_radio = QRadioButton("Wu-Manber")
+        self.wm_radio.toggled.connect(lambda: self.set_algorithm("WM"))
+        algo_layout.addWidget(self.wm_radio)
+        
+        self.native_radio = QRadioButton("Native")
+        self.native_radio.toggled.connect(lambda: self.set_algorithm("NATIVE"))
+        algo_layout.addWidget(self.native_radio)
+        
+        # NumPy opsional, radio-nya cuma muncul kalau numpy terpasang
+        if NUMPY_AVAILABLE:
+            self.numpy_radio = QRadioButton("NumPy")
+            self.numpy_radio.toggled.connect(lambda: self.set_algorithm("NUMPY"))
+            algo_layout.addWidget(self.numpy_radio)
+        
         algo_layout.addStretch()
         main_layout.addLayout(algo_layout)
         
@@ -272,6 +361,7 @@ class MainWindow(QMainWindow):
         
     def set_algorithm(self, algorithm):
         self.current_algorithm = algorithm
+        self.searcher.set_algorithm(algorithm)
         
     def seed_database_for_loaded_cvs(self):
         try:
@@ -317,14 +407,14 @@ class MainWindow(QMainWindow):
                 # Create application
                 application_model.create_application(
                     applicant_id=applicant_id,
-                    application_role=cv['category'],
-                    cv_path=cv['path']
+                    application_role=cv.category,
+                    cv_path=cv.path
                 )
                 
                 # Store applicant_id in cv data
-                cv['applicant_id'] = applicant_id
+                cv.applicant_id = applicant_id
                 
-                print(f"Seeded: {first_name} {last_name} - {cv['filename']}")
+                print(f"Seeded: {first_name} {last_name} - {cv.filename}")
             
             applicant_model.close()
             application_model.close()
@@ -343,6 +433,25 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", f"Data folder not found: {data_path}")
             return
         
+        # Coba pulihkan dari snapshot dulu biar gak perlu ekstrak ulang semua PDF
+        self.data_path = data_path
+        self.snapshot_path = os.path.join(os.path.dirname(data_path), SNAPSHOT_FILENAME)
+        self.snapshot_fingerprint = compute_fingerprint(data_path)
+        # Snapshot basi tetap dipakai: PDF yang berubah sejak snapshot di-ingest lewat poll_directory
+        state = read_snapshot(self.snapshot_path, data_path, self.snapshot_fingerprint, allow_stale=True)
+        if state is not None and 'file_states' in state and state.get('load_policy') == self.load_policy.spec:
+            self.searcher.restore_state(state)
+            self.cv_data = self.searcher.cv_data
+            self.scanner = DirectoryScanner(data_path, state['file_states'])
+            print(f"Loaded {len(self.cv_data)} CVs from snapshot {self.snapshot_path}")
+            self.statusBar().showMessage(f"Loaded {len(self.cv_data)} CVs from snapshot")
+            self.poll_directory()
+            self.start_scan_timer()
+            return
+        
+        # state folder diambil sebelum ekstraksi, jadi PDF yang berubah selama load ke-ingest belakangan
+        self.scanner = DirectoryScanner(data_path)
+        
         # Create progress dialog
         progress = QProgressDialog("Loading CV files...", "Cancel", 0, 100, self)
         progress.setWindowTitle("Loading CVs")
@@ -353,33 +462,43 @@ class MainWindow(QMainWindow):
         # Create loading thread
         class LoaderThread(QThread):
             progress_update = pyqtSignal(int, str)
-            finished_signal = pyqtSignal(list)
+            finished_signal = pyqtSignal(object)
             
-            def __init__(self, pdf_extractor, regex_extractor, data_path):
+            def __init__(self, pdf_extractor, regex_extractor, data_path, policy, texts_path):
                 super().__init__()
                 self.pdf_extractor = pdf_extractor
                 self.regex_extractor = regex_extractor
                 self.data_path = data_path
+                self.policy = policy
+                self.texts_path = texts_path
             
             def run(self):
-                # Extract text from all PDFs
-                cv_data = self.pdf_extractor.extract_all_pdfs_from_directory(self.data_path)
+                policy = self.policy
+                pdf_paths = self.pdf_extractor.select_pdfs(self.data_path, policy.mode, policy.limit, policy.seed)
+                
+                # Perkiraan memori dilaporkan sebelum ekstraksi; lewat budget -> teks CV disimpan di disk
+                estimate = estimate_corpus_memory(self.pdf_extractor, pdf_paths)
+                use_disk = policy.use_disk(estimate)
+                budget = f"{policy.memory_budget / 2**20:.0f} MB" if policy.memory_budget is not None else "unlimited"
+                report = (f"Estimated corpus memory: {estimate['memory_bytes'] / 2**20:.1f} MB for {len(pdf_paths)} PDFs "
+                          f"(budget {budget}, texts {'on disk' if use_disk else 'in memory'})")
+                print(report)
+                self.progress_update.emit(0, report)
                 
-                # Process with regex extractor
-                total = len(cv_data)
-                for i, cv in enumerate(cv_data):
+                cv_data = CVStore(text_store=DiskTextStore(self.texts_path) if use_disk else None)
+                
+                # Extract + regex per CV, langsung masuk CVStore (mode disk: teksnya gak ditahan di memori)
+                total = max(len(pdf_paths), 1)
+                for i, cv in enumerate(self.pdf_extractor.iter_pdfs(pdf_paths)):
                     self.progress_update.emit(int((i / total) * 100), f"Processing {cv['filename']}...")
                     
-                    cv['extracted_info'] = self.regex_extractor.extract_all(cv['text'])
-                    
-                    # Get name from extracted info or filename
-                    personal_info = cv['extracted_info'].get('personal_info', {})
-                    cv['name'] = personal_info.get('name', cv['filename'].replace('.pdf', ''))
+                    cv_data.add(enrich_cv(cv, self.regex_extractor))
                 
                 self.finished_signal.emit(cv_data)
         
         # Create and start loader thread
-        self.loader_thread = LoaderThread(self.pdf_extractor, self.regex_extractor, data_path)
+        texts_path = os.path.join(os.path.dirname(data_path), TEXTS_FILENAME)
+        self.loader_thread = LoaderThread(self.pdf_extractor, self.regex_extractor, data_path, self.load_policy, texts_path)
         
         def update_progress(value, text):
             progress.setValue(value)
@@ -388,7 +507,9 @@ class MainWindow(QMainWindow):
                 self.loader_thread.terminate()
         
         def loading_finished(cv_data):
-            self.cv_data = cv_data
+            # GUI & searcher pegang CVStore yang sama
+            self.searcher.set_cv_data(cv_data)
+            self.cv_data = self.searcher.cv_data
             progress.close()
             
             # Seed database
@@ -396,6 +517,8 @@ class MainWindow(QMainWindow):
             
             # Load and decrypt data from database for each CV
             self.load_database_info()
+            self.save_snapshot()
+            self.start_scan_timer()
             
             QMessageBox.information(self, "Success", f"Loaded {len(self.cv_data)} CVs successfully!")
         
@@ -403,32 +526,126 @@ class MainWindow(QMainWindow):
         self.loader_thread.finished_signal.connect(loading_finished)
         self.loader_thread.start()
     
-    def load_database_info(self):
+    def save_snapshot(self):
+        if not self.cv_data or not self.snapshot_path:
+            return
+        try:
+            state = self.searcher.export_state()
+            if self.scanner is not None:
+                state['file_states'] = self.scanner.states
+            state['load_policy'] = self.load_policy.spec
+            write_snapshot(self.snapshot_path, self.data_path, state, self.snapshot_fingerprint)
+            print(f"Snapshot written to {self.snapshot_path}")
+        except Exception as e:
+            print(f"Error writing snapshot: {e}")
+    
+    def start_scan_timer(self):
+        if self.scan_interval_ms > 0:
+            self.scan_timer.start(self.scan_interval_ms)
+    
+    # Cek folder data (mtime + ukuran) dan terapkan perubahannya ke korpus yang sudah ter-load:
+    # PDF yang dihapus langsung dibuang, yang baru/berubah diekstrak di IngestThread
+    def poll_directory(self):
+        if self.scanner is None or self.ingest_pending:
+            return
+        
+        added, changed, removed = self.scanner.diff()
+        if self.load_policy.mode != 'all':
+            # korpus cuma sebagian folder: PDF yang gak ke-load tetap dilewati
+            changed = [path for path in changed if self.searcher.cv_data.find(path) is not None]
+            removed = [path for path in removed if self.searcher.cv_data.find(path) is not None]
+        if not (added or changed or removed):
+            return
+        
+        for path in removed:
+            self.searcher.remove_cv(path)
+        if self.load_policy.mode != 'all':
+            added = self.admit_by_policy(added, removed)
+            if not (added or changed or removed):
+                return
+        print(f"Data folder changed: {len(added)} added, {len(changed)} changed, {len(removed)} removed")
+        self.ingest_pending = True
+        
+        if not (added or changed):
+            self.ingest_finished([], [], {})
+            return
+        
+        self.ingest_thread = IngestThread(self.pdf_extractor, self.regex_extractor, added + changed,
+                                          self.last_keywords, self.searcher.current_algorithm)
+        self.ingest_thread.finished_signal.connect(self.ingest_finished)
+        self.ingest_thread.start()
+    
+    # PDF baru di mode LOAD_POLICY selain 'all': per_category:N -> diterima selama CV yang ter-load di
+    # kategorinya masih di bawah N, sample:N -> sampelnya tetap, PDF baru gak ikut. PDF yang ditolak
+    # karena kategorinya penuh dibuang dari state scanner, jadi dicek lagi di poll berikutnya; begitu ada
+    # CV yang dihapus, PDF lain di kategori itu yang belum ter-load juga dicek ulang
+    def admit_by_policy(self, added, removed):
+        if self.load_policy.mode != 'per_category':
+            return []
+        category_of = lambda path: os.path.basename(os.path.dirname(path))
+        loaded = Counter(cv.category for cv in self.searcher.cv_data)
+        
+        admitted = []
+        skipped = []
+        for path in added:
+            category = category_of(path)
+            if loaded[category] < self.load_policy.limit:
+                loaded[category] += 1
+                admitted.append(path)
+            else:
+                skipped.append(path)
+        
+        freed = {category_of(path) for path in removed}
+        if freed:
+            unloaded = (os.path.join(self.scanner.directory, path) for path in self.scanner.states)
+            skipped.extend(path for path in unloaded
+                           if category_of(path) in freed and self.searcher.cv_data.find(path) is None)
+        self.scanner.forget(skipped)
+        return admitted
+    
+    # matches: path -> keyword pencarian terakhir yang ketemu di PDF baru/berubah (hasil IngestThread).
+    # Ingest gak nulis apa-apa ke disk: snapshot ditulis sekali pas closeEvent. Kalau aplikasinya
+    # crash sebelum itu, file_states di snapshot lama masih cocok sama isinya, jadi perubahan yang
+    # sama di-ingest ulang pas startup berikutnya.
+    def ingest_finished(self, cvs, failed, matches):
+        if not self.ingest_pending:
+            return # sudah diterapkan closeEvent
+        self.ingest_pending = False
+        records = [self.searcher.update_cv(cv) for cv in cvs]
+        # versi lama PDF yang sekarang gagal diekstrak ikut dibuang
+        for path in failed:
+            self.searcher.remove_cv(path)
+        if records:
+            self.load_database_info(records)
+        
+        self.cv_data = self.searcher.cv_data
+        self.snapshot_fingerprint = compute_fingerprint(self.data_path)
+        message = f"Data folder updated: {len(self.cv_data)} CVs loaded"
+        if matches:
+            names = ', '.join(os.path.basename(path) for path in sorted(matches))
+            message += f" - {len(matches)} new/changed CVs match the last search: {names}"
+        self.statusBar().showMessage(message)
+    
+    def closeEvent(self, event):
+        self.scan_timer.stop()
+        if self.ingest_thread is not None:
+            self.ingest_thread.wait()
+            # hasil ingest yang sinyalnya belum diproses diterapkan dulu, biar file_states di snapshot
+            # gak ngaku udah nyimpen PDF yang sebenarnya belum masuk korpus
+            if self.ingest_pending and self.ingest_thread.result is not None:
+                self.ingest_finished(*self.ingest_thread.result)
+        # simpan juga tabel algoritma yang kebangun selama sesi ini
+        self.save_snapshot()
+        self.searcher.close()
+        super().closeEvent(event)
+    
+    # cvs: cuma CV ini yang diisi (misal hasil ingest incremental), default semua CV
+    def load_database_info(self, cvs=None):
         print("\n=== Memuat Info dari Database ===") 
         app_model = ApplicationModel()
         try:
             all_applications = app_model.get_all_applications_with_applicants()
-            path_to_profile_map = {app['cv_path']: app for app in all_applications}
-            for cv in self.cv_data:
-                relative_path = os.path.join('data', cv['category'], cv['filename'])
-                normalized_path = relative_path.replace('\\', '/')
-                applicant_profile = path_to_profile_map.get(normalized_path)
-                if applicant_profile:
-                    cv['applicant_id'] = applicant_profile['applicant_id']
-                    cv['db_first_name'] = applicant_profile['first_name']
-                    cv['db_last_name'] = applicant_profile['last_name']
-                    cv['db_phone'] = applicant_profile['phone_number']
-                    cv['db_address'] = applicant_profile['address']
-                    dob = applicant_profile['date_of_birth']
-                    cv['db_dob'] = dob.strftime('%Y-%m-%d') if isinstance(dob, datetime) else dob
-                else:
-                    seeder = Seeder()
-                    cv['applicant_id'] = None
-                    cv['db_first_name'] = Seeder.generate_first_name()
-                    cv['db_last_name'] = Seeder.generate_last_name()
-                    cv['db_phone'] = Seeder.generate_phone_number()
-                    cv['db_address'] = Seeder.generate_address()
-                    cv['db_dob'] = Seeder.generate_dob()
+            self.searcher.attach_database_info(all_applications, cvs)
         except Exception as e:
             print(f"Error loading applications: {e}")
             QMessageBox.critical(self, "Error", "Failed to load applications from database.")
@@ -449,128 +666,22 @@ class MainWindow(QMainWindow):
         
         # Parse keywords
         keywords = [k.strip() for k in keywords_text.split(',') if k.strip()]
+        self.last_keywords = keywords
         
         # Perform search
-        start_time = time.time()
-        
-        if self.current_algorithm == "KMP":
-            algorithm = self.kmp
-        elif self.current_algorithm == "BM":
-            for kw in keywords:
-                self.boyer_moore.preprocess_pattern(kw.lower())
-            algorithm = self.boyer_moore
-        else:  # Aho-Corasick
-            algorithm = self.aho_corasick
-        
-        # Exact match search
-        exact_results = []
-
-        if self.current_algorithm == "AC":
-            ac_root = self.aho_corasick.build_automaton(keywords)
-        
-        for cv in self.cv_data:
-            if self.current_algorithm == "AC":
-                matches = algorithm.search_multiple(cv['text'], keywords, root=ac_root)
-            else:
-                matches = algorithm.search_multiple(cv['text'], keywords)
-            
-            if matches:
-                total_count = sum(match['count'] for match in matches.values())
-                exact_results.append({
-                    'cv': cv,
-                    'matches': matches,
-                    'total_count': total_count
-                })
-        
-        exact_time = time.time() - start_time
-        
-        # Fuzzy match search for keywords not found
-        fuzzy_start = time.time()
-        fuzzy_results = []
-        
-        # Find keywords that weren't found in exact match
-        all_found_keywords = set()
-        for result in exact_results:
-            all_found_keywords.update(result['matches'].keys())
-        
-        missing_keywords = set(keywords) - all_found_keywords
-        
-        if missing_keywords:
-            for cv in self.cv_data:
-                fuzzy_matches = self.levenshtein.fuzzy_search(cv['text'], list(missing_keywords))
-                if fuzzy_matches:
-                    fuzzy_count = sum(len(matches) for matches in fuzzy_matches.values())
-                    fuzzy_results.append({
-                        'cv': cv,
-                        'fuzzy_matches': fuzzy_matches,
-                        'fuzzy_count': fuzzy_count
-                    })
-        
-        fuzzy_time = time.time() - fuzzy_start
-        
-        # Combine and sort results
-        all_results = []
-        
-        # Add exact match results
-        for result in exact_results:
-            cv_result = {
-                'path': result['cv']['path'],
-                'name': result['cv']['name'],
-                'match_count': result['total_count'],
-                'keywords_found': {k: v['count'] for k, v in result['matches'].items()},
-                'unique_keywords_matched': len(result['matches']),
-                'extracted_info': result['cv']['extracted_info'],
-                'text': result['cv']['text'],
-                'applicant_id': result['cv'].get('applicant_id'),
-                'db_first_name': result['cv'].get('db_first_name', ''),
-                'db_last_name': result['cv'].get('db_last_name', ''),
-                'db_phone': result['cv'].get('db_phone', ''),
-                'db_address': result['cv'].get('db_address', ''),
-                'db_dob': result['cv'].get('db_dob', '')
-            }
-            all_results.append(cv_result)
-        
-        # Add fuzzy match results (if not already in exact results)
-        exact_paths = {r['path'] for r in all_results}
-        
-        for result in fuzzy_results:
-            if result['cv']['path'] not in exact_paths:
-                # For each keyword, include the matched words and similarity
-                fuzzy_keywords_found = {}
-                for k, matches in result['fuzzy_matches'].items():
-                    fuzzy_keywords_found[k] = {
-                        'matches': matches,
-                        'count': len(matches)
-                    }
-                cv_result = {
-                    'path': result['cv']['path'],
-                    'name': result['cv']['name'],
-                    'match_count': result['fuzzy_count'],
-                    'keywords_found': fuzzy_keywords_found,
-                    'unique_keywords_matched': len(result['fuzzy_matches']),
-                    'extracted_info': result['cv']['extracted_info'],
-                    'text': result['cv']['text'],
-                    'applicant_id': result['cv'].get('applicant_id'),
-                    'db_first_name': result['cv'].get('db_first_name', ''),
-                    'db_last_name': result['cv'].get('db_last_name', ''),
-                    'db_phone': result['cv'].get('db_phone', ''),
-                    'db_address': result['cv'].get('db_address', ''),
-                    'db_dob': result['cv'].get('db_dob', '')
-                }
-                all_results.append(cv_result)
-        
-        # Sort by unique keywords matched, then by match count
-        all_results.sort(key=lambda x: (x['unique_keywords_matched'], x['match_count']), reverse=True)
-        
-        # Display top N results
-        top_n = self.matches_spinner.value()
-        display_results = all_results[:top_n]
+        outcome = self.searcher.search(keywords, self.matches_spinner.value())
+        display_results = outcome['results']
+        exact_time = outcome['exact_time']
+        fuzzy_time = outcome['fuzzy_time']
         
         # Update time label
         total_cvs = len(self.cv_data)
+        fuzzy_text = f"Fuzzy Match: {outcome['fuzzy_scanned']} CVs scanned in {fuzzy_time*1000:.0f}ms."
+        if outcome['fuzzy_partial']:
+            fuzzy_text += f" (partial: time budget reached after {outcome['fuzzy_scanned']} of {total_cvs} CVs)"
         self.time_label.setText(
             f"Exact Match: {total_cvs} CVs scanned in {exact_time*1000:.0f}ms.\n"
-            f"Fuzzy Match: {total_cvs} CVs scanned in {fuzzy_time*1000:.0f}ms."
+            + fuzzy_text
         )
         
         # Display results
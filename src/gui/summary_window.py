@@ -1,12 +1,19 @@
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
+import html
+
+SNIPPETS_PER_KEYWORD = 3
+SNIPPET_CONTEXT = 40
 
 class SummaryWindow(QDialog):
-    def __init__(self, cv_data, parent=None):
+    # cv: CVRecord (field db_* kosong kalau profil DB-nya belum ditempel)
+    # keyword_matches: hasil CVSearcher.match_positions (<keyword, <'positions', 'count'>>), opsional
+    def __init__(self, cv, parent=None, keyword_matches=None):
         super().__init__(parent)
-        self.cv_data = cv_data
-        self.extracted_info = cv_data['extracted_info']
+        self.cv = cv
+        self.extracted_info = cv.extracted_info
+        self.keyword_matches = keyword_matches or {}
         self.init_ui()
     
     def init_ui(self):
@@ -58,28 +65,28 @@ class SummaryWindow(QDialog):
         
         personal_info = self.extracted_info.get('personal_info', {})
         # Name
-        if 'db_first_name' in self.cv_data and 'db_last_name' in self.cv_data:
-            name = f"{self.cv_data['db_first_name']} {self.cv_data['db_last_name']}"
+        if 'db_first_name' in self.cv and 'db_last_name' in self.cv:
+            name = f"{self.cv.db_first_name} {self.cv.db_last_name}"
         else:
-            name = personal_info.get('name', self.cv_data.get('name', 'Not found'))
+            name = personal_info.get('name', self.cv.name or 'Not found')
         name_label = QLabel(f"<b>Name:</b> {name}")
         personal_layout.addWidget(name_label)
         
         # Phone
-        if 'db_phone' in self.cv_data:
-            phone = self.cv_data['db_phone']
+        if 'db_phone' in self.cv:
+            phone = self.cv.db_phone
         else:
             phone = personal_info.get('phone', 'Not found')
         phone_label = QLabel(f"<b>Phone:</b> {phone}")
         personal_layout.addWidget(phone_label)
         
         # Address - from database
-        address = self.cv_data.get('db_address', 'Not found')
+        address = self.cv.get('db_address', 'Not found')
         address_label = QLabel(f"<b>Address:</b> {address}")
         personal_layout.addWidget(address_label)
         
         # Date of Birth - from database
-        dob = self.cv_data.get('db_dob', 'Not found')
+        dob = self.cv.get('db_dob', 'Not found')
         dob_label = QLabel(f"<b>Date of Birth:</b> {dob}")
         personal_layout.addWidget(dob_label)
         
@@ -171,6 +178,26 @@ class SummaryWindow(QDialog):
         edu_group.setLayout(edu_layout)
         content_layout.addWidget(edu_group)
         
+        # Keyword matches: potongan teks di sekitar posisi keyword (posisi dihitung pas summary dibuka)
+        if self.keyword_matches:
+            match_group = QGroupBox("Keyword Matches")
+            match_layout = QVBoxLayout()
+            text = self.cv.text
+            for keyword, info in self.keyword_matches.items():
+                keyword_label = QLabel(f"<b>{html.escape(keyword)}</b>: {info['count']} occurrence(s)")
+                match_layout.addWidget(keyword_label)
+                for position in info['positions'][:SNIPPETS_PER_KEYWORD]:
+                    end = position + len(keyword)
+                    snippet = (html.escape(text[max(0, position - SNIPPET_CONTEXT):position])
+                               + f"<b>{html.escape(text[position:end])}</b>"
+                               + html.escape(text[end:end + SNIPPET_CONTEXT]))
+                    snippet_label = QLabel(f"... {snippet} ...".replace('\n', ' '))
+                    snippet_label.setWordWrap(True)
+                    snippet_label.setStyleSheet("color: #6c757d; padding: 5px;")
+                    match_layout.addWidget(snippet_label)
+            match_group.setLayout(match_layout)
+            content_layout.addWidget(match_group)
+        
         content_layout.addStretch()
         content_widget.setLayout(content_layout)
         scroll_area.setWidget(content_widget)
@@ -0,0 +1,427 @@
+##########################################################################
+##########################################################################
+## @file cv_searcher.py
+## Ini isinya inti pencarian CV (exact + fuzzy) yang gak bergantung
+## sama GUI, jadi bisa dipanggil dari MainWindow maupun skrip lain tanpa Qt.
+##########################################################################
+##########################################################################
+
+import heapq
+import os
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Tuple, Optional
+
+from algorithms.kmp import KMP
+from algorithms.boyer_moore import BoyerMoore
+from algorithms.aho_corasick import AhoCorasick
+from algorithms.wu_manber import WuManber
+from algorithms.native import NativeSearch
+from algorithms.vectorized import VectorizedSearch, NUMPY_AVAILABLE
+from algorithms.query import CompiledQuery, compile_query
+from algorithms.levenshtein import LevenshteinDistance
+from corpus.store import CorpusStore
+from corpus.signature import SignatureIndex
+from corpus.records import CVRecord, CVStore, SearchResult
+from search.parallel import ParallelExecutor
+from utils.seed import Seeder
+
+class CVSearcher:
+    def __init__(self):
+        self.kmp = KMP()
+        self.boyer_moore = BoyerMoore()
+        self.aho_corasick = AhoCorasick()
+        self.wu_manber = WuManber()
+        self.native = NativeSearch()
+        # engine NumPy opsional; buffer-nya baru dibangun pas pertama kali dipakai
+        self.vectorized = VectorizedSearch() if NUMPY_AVAILABLE else None
+        self._vectorized_ready = False
+        self.levenshtein = LevenshteinDistance()
+
+        self.cv_data = CVStore()
+        self.corpus = CorpusStore()
+        self.signatures = SignatureIndex()
+        self.current_algorithm = "KMP"
+        self.fuzzy_budget = None # batas waktu tahap fuzzy dalam detik (None = tanpa batas)
+        self.parallel = None     # ParallelExecutor, aktif kalau enable_parallel dipanggil
+        self._parallel_ready = False
+
+    # @brief Mengganti algoritma exact match yang dipakai
+    # @param algorithm: "KMP", "BM", "AC", "WM", "NATIVE", atau "NUMPY"
+    # @return: None
+    def set_algorithm(self, algorithm: str) -> None:
+        self.current_algorithm = algorithm
+
+    # @brief Menyalakan exact match multi-core (worker tetap hidup sampai close dipanggil)
+    # @param workers: Jumlah proses worker (default os.cpu_count())
+    # @param min_cvs: Korpus lebih kecil dari ini tetap dicari sekuensial
+    # @return: None
+    def enable_parallel(self, workers: int = None, min_cvs: int = 1000) -> None:
+        self.close()
+        self.parallel = ParallelExecutor(workers, min_cvs)
+        self._load_parallel()
+
+    # @brief Mengirim ulang korpus ke worker paralel (dipanggil tiap korpus berubah)
+    # @details Teks di disk gak dikirim: tiap worker bakal megang salinan korpus di memori, padahal
+    #          mode disk dipakai justru karena korpusnya lewat budget. Salinan lama di worker dilepas
+    #          dan exact match jalan sekuensial baca dari mmap.
+    # @return: None
+    def _load_parallel(self) -> None:
+        if self.parallel is not None and self.corpus.on_disk:
+            if len(self.parallel):
+                self.parallel.load([])
+        elif self.parallel is not None and len(self.cv_data) >= self.parallel.min_cvs:
+            use_signatures = len(self.signatures) == len(self.cv_data)
+            self.parallel.load(self.corpus.texts, self.signatures.export()['values'] if use_signatures else None)
+        self._parallel_ready = True
+
+    # @brief Apakah engine NumPy dipakai (buffer korpusnya satu array di memori, jadi gak dipakai di mode disk)
+    # @return: True kalau algoritma NUMPY, numpy terpasang, dan teks korpus di memori
+    def _use_vectorized(self) -> bool:
+        return self.current_algorithm == "NUMPY" and self.vectorized is not None and not self.corpus.on_disk
+
+    # @brief Mematikan worker paralel (kalau ada)
+    # @return: None
+    def close(self) -> None:
+        if self.parallel is not None:
+            self.parallel.close()
+            self.parallel = None
+        self._parallel_ready = False
+
+    # @brief Mengganti daftar CV yang dicari
+    # @param cv_data: CVStore (boleh yang pakai DiskTextStore), atau list dict CV hasil ekstraksi (path, filename, text, category, ...)
+    # @return: None
+    def set_cv_data(self, cv_data) -> None:
+        self.cv_data = cv_data if isinstance(cv_data, CVStore) else CVStore(cv_data)
+        # CVStore yang teksnya di disk (mode budget memori) -> teks ternormalisasi juga ke disk
+        self.corpus.build((cv.text for cv in self.cv_data), self.cv_data.text_store)
+        self.signatures.build(self.corpus.texts)
+        self._vectorized_ready = False
+        self._load_parallel()
+
+    # @brief Menandai buffer turunan korpus (NumPy, worker paralel) basi; dibangun ulang pas dipakai
+    # @return: None
+    def _corpus_changed(self) -> None:
+        self._vectorized_ready = False
+        self._parallel_ready = False
+
+    # @brief Menambah satu CV tanpa membangun ulang korpus
+    # @param cv: CVRecord atau dict CV (path, filename, text, category, extracted_info, name, ...)
+    # @return: CVRecord yang ditambahkan
+    def add_cv(self, cv) -> CVRecord:
+        record = self.cv_data[self.cv_data.add(cv)]
+        self.corpus.append(record.text)
+        self.signatures.append(self.corpus.normalized(record.id))
+        self._corpus_changed()
+        return record
+
+    # @brief Mengganti CV yang path-nya sama (id tetap), atau menambahkannya kalau belum ada
+    # @param cv: CVRecord atau dict CV versi baru
+    # @return: CVRecord yang baru
+    def update_cv(self, cv) -> CVRecord:
+        old = self.cv_data.find(cv['path'])
+        if old is None:
+            return self.add_cv(cv)
+        record = self.cv_data.replace(old.id, cv)
+        self.corpus.replace(record.id, record.text)
+        self.signatures.replace(record.id, self.corpus.normalized(record.id))
+        self._corpus_changed()
+        return record
+
+    # @brief Menghapus CV berdasarkan path (id CV sesudahnya turun satu)
+    # @param path: Path file PDF
+    # @return: CVRecord yang dihapus, atau None kalau gak ada
+    def remove_cv(self, path: str) -> Optional[CVRecord]:
+        record = self.cv_data.find(path)
+        if record is None:
+            return None
+        index = record.id
+        self.cv_data.remove(index)
+        self.corpus.remove(index)
+        self.signatures.remove(index)
+        self._corpus_changed()
+        return record
+
+    # @brief Mengambil seluruh state hasil load (buat ditulis ke snapshot)
+    # @return: Dict berisi cv_data, teks ternormalisasi, dan cache tabel tiap algoritma
+    def export_state(self) -> Dict[str, Any]:
+        return {
+            'cv_data': self.cv_data,
+            'normalized_texts': self.corpus.texts,
+            'signatures': self.signatures.export(),
+            'algorithm_caches': {
+                'kmp': dict(self.kmp._lps_cache.items()),
+                'boyer_moore': dict(self.boyer_moore._pattern_cache.items()),
+                'aho_corasick': self.aho_corasick.export_cache()
+            }
+        }
+
+    # @brief Memulihkan state dari snapshot tanpa load ulang PDF/regex/DB
+    # @param state: Dict hasil export_state
+    # @return: None
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        normalized_texts = state.get('normalized_texts')
+        if normalized_texts is not None and len(normalized_texts) == len(state['cv_data']):
+            cv_data = state['cv_data']
+            self.cv_data = cv_data if isinstance(cv_data, CVStore) else CVStore(cv_data)
+            self.corpus.load_normalized(normalized_texts)
+            if not self.signatures.load(state.get('signatures', {}), len(self.cv_data)):
+                self.signatures.build(self.corpus.texts)
+        else:
+            self.set_cv_data(state['cv_data'])
+        self._vectorized_ready = False
+        self._load_parallel()
+        caches = state.get('algorithm_caches', {})
+        if 'kmp' in caches:
+            self.kmp._lps_cache.update(caches['kmp'])
+        if 'boyer_moore' in caches:
+            self.boyer_moore._pattern_cache.update(caches['boyer_moore'])
+        if 'aho_corasick' in caches:
+            self.aho_corasick.import_cache(caches['aho_corasick'])
+
+    # @brief Statistik semua cache algoritma (hit rate, jumlah entri, perkiraan byte, eviction)
+    # @return: List dict hasil BoundedCache.stats()
+    def cache_stats(self) -> List[Dict[str, Any]]:
+        return [
+            self.kmp._lps_cache.stats(),
+            self.boyer_moore._pattern_cache.stats(),
+            self.boyer_moore._shift_cache.stats(),
+            self.aho_corasick._automaton_cache.stats(),
+            self.wu_manber._table_cache.stats(),
+            self.native._regex_cache.stats(),
+            self.levenshtein._distance_cache.stats()
+        ]
+
+    # @brief Menempelkan data profil dari database ke setiap CV
+    # @details CV yang gak ada di database dikasih profil palsu dari Seeder.
+    # @param all_applications: Hasil ApplicationModel.get_all_applications_with_applicants()
+    # @param cvs: CV yang mau diisi (default semua CV, misal cuma CV baru hasil add_cv)
+    # @return: None
+    def attach_database_info(self, all_applications: List[Dict[str, Any]], cvs: List[CVRecord] = None) -> None:
+        path_to_profile_map = {app['cv_path']: app for app in all_applications}
+        for cv in (self.cv_data if cvs is None else cvs):
+            relative_path = os.path.join('data', cv.category, cv.filename)
+            normalized_path = relative_path.replace('\\', '/')
+            applicant_profile = path_to_profile_map.get(normalized_path)
+            if applicant_profile:
+                cv.applicant_id = applicant_profile['applicant_id']
+                cv.db_first_name = applicant_profile['first_name']
+                cv.db_last_name = applicant_profile['last_name']
+                cv.db_phone = applicant_profile['phone_number']
+                cv.db_address = applicant_profile['address']
+                dob = applicant_profile['date_of_birth']
+                cv.db_dob = dob.strftime('%Y-%m-%d') if isinstance(dob, datetime) else dob
+            else:
+                cv.applicant_id = None
+                cv.db_first_name = Seeder.generate_first_name()
+                cv.db_last_name = Seeder.generate_last_name()
+                cv.db_phone = Seeder.generate_phone_number()
+                cv.db_address = Seeder.generate_address()
+                cv.db_dob = Seeder.generate_dob()
+
+    # @brief Menghitung posisi kemunculan keyword di satu CV, baru dipanggil kalau hasilnya dibuka
+    # @param cv_path: Path CV (sama dengan result.record.path)
+    # @param keywords: List keyword
+    # @return: Dictionary <keyword, <'positions', 'count'>> dari algoritma yang sedang aktif
+    def match_positions(self, cv_path: str, keywords: List[str]) -> Dict[str, Dict[str, Any]]:
+        cv = self.cv_data.find(cv_path)
+        if cv is None:
+            return {}
+        if self._use_vectorized():
+            self._ensure_vectorized()
+            return self.vectorized.search_cv(cv.id, keywords)
+        return self._engine().search_query(self.corpus.normalized(cv.id), self.compile_query(keywords))
+
+    # @brief Engine per-CV untuk algoritma yang sedang aktif
+    # @return: Instance KMP / BoyerMoore / AhoCorasick / WuManber / NativeSearch
+    def _engine(self):
+        if self.current_algorithm == "KMP":
+            return self.kmp
+        if self.current_algorithm == "BM":
+            return self.boyer_moore
+        if self.current_algorithm == "AC":
+            return self.aho_corasick
+        if self.current_algorithm == "WM":
+            return self.wu_manber
+        # NUMPY tanpa numpy terpasang / di mode disk jatuh ke engine native (semantiknya sama)
+        return self.native
+
+    # @brief Preprocess keyword sekali untuk algoritma aktif (tabel diambil dari cache engine)
+    # @param keywords: List keyword
+    # @return: CompiledQuery yang bisa dipakai untuk semua CV
+    def compile_query(self, keywords: List[str]) -> CompiledQuery:
+        return compile_query(keywords, self.current_algorithm, self._engine())
+
+    # @brief Membuat hasil untuk satu CV (nunjuk ke record, field CV gak disalin)
+    # @param cv: CVRecord sumber
+    # @param match_count: Total kemunculan keyword
+    # @param keywords_found: Dict keyword -> info kemunculan
+    # @param unique_keywords_matched: Banyak keyword berbeda yang ketemu
+    # @return: SearchResult yang siap ditampilkan CVCard
+    def _build_result(self, cv: CVRecord, match_count: int, keywords_found: Dict[str, Any], unique_keywords_matched: int) -> SearchResult:
+        return SearchResult(cv, match_count, keywords_found, unique_keywords_matched)
+
+    # @brief Membangun buffer korpus engine NumPy kalau belum ada / sudah basi
+    # @return: None
+    def _ensure_vectorized(self) -> None:
+        if not self._vectorized_ready:
+            self.vectorized.build(self.corpus.texts)
+            self._vectorized_ready = True
+
+    # @brief Tahap exact match: hitung kemunculan keyword di tiap CV pakai algoritma aktif
+    # @param keywords: List keyword yang sudah di-strip
+    # @return: Dictionary <index CV, <keyword, jumlah>>, CV tanpa match gak dimasukkan
+    def exact_match(self, keywords: List[str]) -> Dict[int, Dict[str, int]]:
+        if self._use_vectorized():
+            # satu pass vektor di seluruh korpus per keyword, bukan loop per CV
+            self._ensure_vectorized()
+            return self.vectorized.count_corpus(keywords)
+
+        query = self.compile_query(keywords)
+        algorithm = self._engine()
+
+        # Exact match search: cuma simpan <index CV, counts>, dict hasil dibuat belakangan
+        exact_counts: Dict[int, Dict[str, int]] = {}
+
+        # Prefilter q-gram: keyword cuma dicari di CV yang signature-nya superset dari mask keyword
+        use_signatures = len(self.signatures) == len(self.cv_data)
+        masks = [self.signatures.mask(pattern) for _, pattern, _ in query.entries]
+
+        if self.parallel is not None and not self._parallel_ready:
+            self._load_parallel()
+        if self.parallel is not None and len(self.parallel) == len(self.cv_data) >= self.parallel.min_cvs:
+            # korpus sudah ada di worker, yang dikirim cuma query + mask
+            return self.parallel.exact_match(query, masks if use_signatures else None)
+
+        for i in range(len(self.cv_data)):
+            entries = query.entries
+            if use_signatures:
+                signature = self.signatures.signature_of(i)
+                entries = [entry for entry, mask in zip(query.entries, masks) if signature & mask == mask]
+                if not entries:
+                    continue
+
+            # teks lowercase diambil dari CorpusStore dan semua tabel sudah ada di query,
+            # jadi per CV tinggal scan. Ranking cuma butuh jumlah, jadi posisi gak dibangun
+            # di sini (lihat match_positions). AC & WM selalu pakai automaton/tabel penuh.
+            counts = algorithm.count_query(self.corpus.normalized(i), query, entries)
+            if counts:
+                exact_counts[i] = counts
+
+        return exact_counts
+
+    # @brief Tahap fuzzy: Levenshtein untuk keyword yang gak ketemu di exact match
+    # @details CV diproses urut prior murah (overlap q-gram keyword di signature, lalu teks
+    #          terpendek), dan berhenti kalau:
+    #          - top_n sudah pasti: semua top_n kandidat sementara punya unique keyword lebih
+    #            banyak dari jumlah keyword yang hilang, jadi gak ada hasil fuzzy yang bisa masuk
+    #          - budget waktu habis (hasilnya ditandai partial)
+    # @param missing_keywords: List keyword yang gak ketemu di exact match
+    # @param exact_counts: Hasil exact_match (CV-nya dilewati dan ikut jadi kandidat top_n)
+    # @param top_n: Banyak hasil teratas yang dicari
+    # @param budget: Batas waktu dalam detik (None = tanpa batas)
+    # @return: Tuple (<index CV, hasil fuzzy_search>, banyak CV yang di-scan, partial atau gak)
+    def fuzzy_match(self, missing_keywords: List[str], exact_counts: Dict[int, Dict[str, int]],
+                    top_n: int, budget: float = None) -> Tuple[Dict[int, Dict[str, List[Dict[str, Any]]]], int, bool]:
+        start_time = time.time()
+        fuzzy_matches_by_index: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+
+        # min-heap key (unique_keywords, count) top_n kandidat sementara
+        top_keys = heapq.nlargest(top_n, ((len(counts), sum(counts.values())) for counts in exact_counts.values()))
+        heapq.heapify(top_keys)
+        settled = lambda: top_n > 0 and len(top_keys) >= top_n and top_keys[0][0] > len(missing_keywords)
+
+        # CV yang sudah ada di hasil exact gak bakal dipakai hasil fuzzy-nya
+        order = [i for i in range(len(self.cv_data)) if i not in exact_counts]
+        if len(self.signatures) == len(self.cv_data):
+            mask = 0
+            for keyword in missing_keywords:
+                mask |= self.signatures.mask(keyword.lower())
+            order.sort(key=lambda i: (-self.signatures.overlap(i, mask), self.corpus.length(i)))
+
+        scanned = 0
+        for i in order:
+            if settled():
+                break
+            if budget is not None and time.time() - start_time > budget:
+                return fuzzy_matches_by_index, scanned, True
+
+            fuzzy_matches = self.levenshtein.fuzzy_search(self.cv_data[i].text, missing_keywords)
+            scanned += 1
+            if fuzzy_matches:
+                fuzzy_matches_by_index[i] = fuzzy_matches
+                key = (len(fuzzy_matches), sum(len(m) for m in fuzzy_matches.values()))
+                if len(top_keys) < top_n:
+                    heapq.heappush(top_keys, key)
+                elif top_n > 0 and key > top_keys[0]:
+                    heapq.heapreplace(top_keys, key)
+
+        return fuzzy_matches_by_index, scanned, False
+
+    # @brief Mencari CV yang cocok dengan keyword (exact dulu, lalu fuzzy untuk keyword yang gak ketemu)
+    # @param keywords: List keyword yang sudah di-strip
+    # @param top_n: Banyak hasil teratas yang dikembalikan
+    # @param fuzzy_budget: Batas waktu tahap fuzzy dalam detik (default self.fuzzy_budget)
+    # @return: Dict berisi 'results' (list SearchResult), 'exact_time', 'fuzzy_time', 'total_cvs', 'fuzzy_scanned',
+    #          dan 'fuzzy_partial' (True kalau tahap fuzzy dihentikan karena budget habis)
+    def search(self, keywords: List[str], top_n: int, fuzzy_budget: float = None) -> Dict[str, Any]:
+        if fuzzy_budget is None:
+            fuzzy_budget = self.fuzzy_budget
+
+        start_time = time.time()
+        exact_counts = self.exact_match(keywords)
+        exact_time = time.time() - start_time
+
+        # Fuzzy match search for keywords not found
+        fuzzy_start = time.time()
+        fuzzy_matches_by_index: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+        fuzzy_scanned, fuzzy_partial = 0, False
+
+        # Find keywords that weren't found in exact match
+        all_found_keywords = set()
+        for counts in exact_counts.values():
+            all_found_keywords.update(counts.keys())
+
+        missing_keywords = set(keywords) - all_found_keywords
+
+        if missing_keywords:
+            fuzzy_matches_by_index, fuzzy_scanned, fuzzy_partial = self.fuzzy_match(
+                list(missing_keywords), exact_counts, top_n, fuzzy_budget
+            )
+
+        fuzzy_time = time.time() - fuzzy_start
+
+        # Ranking pakai tuple ringan (unique_keywords, count, cv_index, is_fuzzy).
+        # nlargest setara sorted(reverse=True)[:top_n] (stabil), jadi kalau seri,
+        # hasil exact tetap di depan hasil fuzzy dan urutan CV tetap dipertahankan.
+        candidates = [
+            (len(counts), sum(counts.values()), i, False)
+            for i, counts in exact_counts.items()
+        ]
+        candidates.extend(
+            (len(matches), sum(len(m) for m in matches.values()), i, True)
+            for i, matches in sorted(fuzzy_matches_by_index.items())
+        )
+        winners = heapq.nlargest(top_n, candidates, key=lambda c: (c[0], c[1]))
+
+        # Dict hasil cuma dibuat untuk top_n pemenang
+        results = []
+        for unique_keywords, match_count, i, is_fuzzy in winners:
+            if is_fuzzy:
+                # For each keyword, include the matched words and similarity
+                keywords_found = {
+                    k: {'matches': matches, 'count': len(matches)}
+                    for k, matches in fuzzy_matches_by_index[i].items()
+                }
+            else:
+                keywords_found = dict(exact_counts[i])
+            results.append(self._build_result(self.cv_data[i], match_count, keywords_found, unique_keywords))
+
+        return {
+            'results': results,
+            'exact_time': exact_time,
+            'fuzzy_time': fuzzy_time,
+            'total_cvs': len(self.cv_data),
+            'fuzzy_scanned': fuzzy_scanned,
+            'fuzzy_partial': fuzzy_partial
+        }
@@ -0,0 +1,215 @@
+##########################################################################
+##########################################################################
+## @file parallel.py
+## Ini isinya ParallelExecutor: exact match multi-core. Korpus yang sudah
+## lowercase ditaruh sekali di multiprocessing.shared_memory (tabel offset
+## int64 + blob UTF-8), worker yang tetap hidup (warm) ambil potongan CV
+## bagiannya dari situ, dan tiap query cuma CompiledQuery (plus mask
+## signature) yang dikirim lewat pipe. Shared memory cuma jadi jalur kirim:
+## tiap worker decode potongannya jadi str sendiri (BM/WM/native butuh str)
+## dan segmennya dilepas setelah load, jadi total memori = korpus + satu
+## salinan per potongan worker. Hasilnya <index CV, counts>,
+## sama persis dengan CVSearcher.exact_match versi sekuensial.
+##########################################################################
+##########################################################################
+
+import multiprocessing
+import os
+from array import array
+from multiprocessing import shared_memory
+from typing import List, Dict, Any, Optional, Tuple
+
+from algorithms.query import ENGINES, CompiledQuery
+from algorithms.native import NativeSearch
+
+# @brief Loop utama proses worker
+# @param conn: Ujung pipe milik worker
+# @return: None
+def _worker_main(conn) -> None:
+    texts: List[str] = []
+    signatures: Optional[List[int]] = None
+    start = 0
+    engines: Dict[str, Any] = {}   # engine per algoritma, cache tabelnya kepake lintas query
+    query_key = None
+    query: Optional[CompiledQuery] = None
+
+    while True:
+        message = conn.recv()
+        command = message[0]
+
+        if command == 'load':
+            _, shm_name, count, start, end, signatures = message
+            shm = shared_memory.SharedMemory(name=shm_name)
+            try:
+                offsets = shm.buf[:(count + 1) * 8].cast('q')
+                base = (count + 1) * 8
+                texts = [
+                    bytes(shm.buf[base + offsets[i]:base + offsets[i + 1]]).decode('utf-8')
+                    for i in range(start, end)
+                ]
+                offsets.release()
+            finally:
+                shm.close()
+            conn.send(('loaded', len(texts)))
+
+        elif command == 'count':
+            _, key, new_query, masks = message
+            if new_query is not None:
+                query_key, query = key, new_query
+            if key != query_key:
+                conn.send(('error', 'unknown query'))
+                continue
+
+            engine = engines.get(query.algorithm)
+            if engine is None:
+                engine = engines[query.algorithm] = ENGINES.get(query.algorithm, NativeSearch)()
+
+            counts_by_index: Dict[int, Dict[str, int]] = {}
+            try:
+                for offset, text in enumerate(texts):
+                    entries = query.entries
+                    if signatures is not None and masks is not None:
+                        signature = signatures[offset]
+                        entries = [entry for entry, mask in zip(query.entries, masks) if signature & mask == mask]
+                        if not entries:
+                            continue
+                    counts = engine.count_query(text, query, entries)
+                    if counts:
+                        counts_by_index[start + offset] = counts
+            except Exception as e:
+                conn.send(('error', repr(e)))
+                continue
+            conn.send(('counts', counts_by_index))
+
+        elif command == 'close':
+            conn.close()
+            return
+
+class ParallelExecutor:
+    # @param workers: Jumlah proses worker (default os.cpu_count())
+    # @param min_cvs: Korpus lebih kecil dari ini tetap dicari sekuensial (overhead IPC gak sepadan)
+    def __init__(self, workers: Optional[int] = None, min_cvs: int = 1000):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.min_cvs = min_cvs
+        self._context = multiprocessing.get_context('spawn') # aman dipanggil dari aplikasi Qt
+        self._processes = []
+        self._connections = []
+        self._ranges: List[Tuple[int, int]] = []
+        self._count = 0
+        self._query_key = None
+
+    # @brief Menyalakan proses worker (sekali, lalu dipakai terus)
+    # @return: None
+    def start(self) -> None:
+        if self._processes:
+            return
+        for _ in range(self.workers):
+            parent_conn, child_conn = self._context.Pipe()
+            process = self._context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+            process.start()
+            child_conn.close()
+            self._processes.append(process)
+            self._connections.append(parent_conn)
+
+    # @brief Membagi CV jadi potongan kontigu yang total panjang teksnya kira-kira sama
+    # @param lengths: Panjang teks per CV
+    # @return: List (start, end) per worker
+    def _split(self, lengths: List[int]) -> List[Tuple[int, int]]:
+        total = sum(lengths)
+        ranges = []
+        start = 0
+        acc = 0
+        for worker in range(1, self.workers):
+            target = total * worker / self.workers
+            end = start
+            while end < len(lengths) and acc + lengths[end] <= target:
+                acc += lengths[end]
+                end += 1
+            ranges.append((start, end))
+            start = end
+        ranges.append((start, len(lengths)))
+        return ranges
+
+    # @brief Menaruh korpus di shared memory dan membagikannya ke worker
+    # @param texts: Teks ternormalisasi sesuai urutan cv_data (misal CorpusStore.texts)
+    # @param signatures: Signature q-gram per CV (opsional, buat prefilter di worker)
+    # @return: None
+    def load(self, texts: List[str], signatures: Optional[List[int]] = None) -> None:
+        self.start()
+        encoded = [text.encode('utf-8') for text in texts]
+        offsets = array('q', [0])
+        for blob in encoded:
+            offsets.append(offsets[-1] + len(blob))
+
+        header = offsets.tobytes()
+        shm = shared_memory.SharedMemory(create=True, size=max(1, len(header) + offsets[-1]))
+        try:
+            shm.buf[:len(header)] = header
+            position = len(header)
+            for blob in encoded:
+                shm.buf[position:position + len(blob)] = blob
+                position += len(blob)
+            del encoded
+
+            self._count = len(texts)
+            self._ranges = self._split([len(text) for text in texts])
+            for conn, (start, end) in zip(self._connections, self._ranges):
+                conn.send(('load', shm.name, len(texts), start, end,
+                           None if signatures is None else list(signatures[start:end])))
+            # worker sudah punya salinan teks bagiannya, jadi segmen boleh dilepas
+            for conn in self._connections:
+                conn.recv()
+        finally:
+            shm.close()
+            shm.unlink()
+        self._query_key = None
+
+    # @brief Exact match paralel: tiap worker menghitung potongan CV-nya
+    # @param query: CompiledQuery (dikirim ulang cuma kalau berubah dari query sebelumnya)
+    # @param masks: Mask signature per entry query (None = tanpa prefilter)
+    # @return: Dictionary <index CV, <keyword, jumlah>>, urut index, CV tanpa match gak dimasukkan
+    def exact_match(self, query: CompiledQuery, masks: Optional[List[int]] = None) -> Dict[int, Dict[str, int]]:
+        key = (query.algorithm, query.keywords)
+        new_query = query if key != self._query_key else None
+        for conn in self._connections:
+            conn.send(('count', key, new_query, masks))
+        self._query_key = key
+
+        # balasan semua worker dibaca dulu biar pipe gak ketinggalan balasan query ini
+        exact_counts: Dict[int, Dict[str, int]] = {}
+        errors = []
+        for conn in self._connections:
+            status, payload = conn.recv()
+            if status == 'counts':
+                exact_counts.update(payload)
+            else:
+                errors.append(payload)
+        if errors:
+            # worker yang gagal belum tentu nyimpen query ini, jadi query berikutnya dikirim ulang
+            self._query_key = None
+            raise RuntimeError(f"Parallel worker failed: {errors[0]}")
+        return exact_counts
+
+    # @brief Banyak CV yang sedang dipegang worker
+    # @return: Jumlah CV hasil load terakhir
+    def __len__(self) -> int:
+        return self._count
+
+    # @brief Mematikan semua worker
+    # @return: None
+    def close(self) -> None:
+        for conn in self._connections:
+            try:
+                conn.send(('close',))
+                conn.close()
+            except (OSError, BrokenPipeError):
+                pass
+        for process in self._processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+        self._connections = []
+        self._ranges = []
+        self._count = 0
+        self._query_key = None
@@ -0,0 +1,289 @@
+##########################################################################
+##########################################################################
+## @file sharding.py
+## Ini isinya pencarian CV yang korpusnya dipecah jadi beberapa shard.
+## Tiap shard dilayani worker independen (CVSearcher sendiri) lewat
+## multiprocessing.connection (socket TCP / pipe lokal), jadi shard bisa
+## jalan di proses lain maupun di mesin lain. ShardCoordinator menyebar
+## query ke semua shard, lalu menggabungkan top-K tiap shard dengan urutan
+## yang sama persis dengan CVSearcher.search:
+##   1. 'exact' -> tiap shard hitung exact match, balikin top-K + keyword
+##                 yang ketemu
+##   2. 'fuzzy' -> keyword yang gak ketemu di SEMUA shard dicari fuzzy
+## Shard yang gak jawab sebelum timeout dilewati (hasilnya ditandai).
+##########################################################################
+##########################################################################
+
+import heapq
+import multiprocessing
+import os
+import time
+import zlib
+from multiprocessing.connection import Listener, Client
+from typing import List, Dict, Any, Optional, Tuple
+
+from search.cv_searcher import CVSearcher
+
+# @brief Menentukan shard sebuah CV
+# @param cv: Dict CV (butuh 'path', dan 'category' untuk strategi 'category')
+# @param shards: Jumlah shard
+# @param strategy: 'hash' (crc32 path) atau 'category' (application role)
+# @param categories: Urutan kategori yang dipakai strategi 'category'
+# @return: Index shard
+def shard_of(cv: Dict[str, Any], shards: int, strategy: str = 'hash', categories: Optional[List[str]] = None) -> int:
+    if strategy == 'category':
+        return categories.index(cv['category']) % shards
+    if strategy == 'hash':
+        return zlib.crc32(cv['path'].encode('utf-8')) % shards
+    raise ValueError("strategy must be 'hash' or 'category'")
+
+# @brief Memecah cv_data jadi beberapa shard
+# @param cv_data: List dict CV
+# @param shards: Jumlah shard
+# @param strategy: 'hash' atau 'category'
+# @return: List shard, isinya list (index global, dict CV)
+def partition(cv_data: List[Dict[str, Any]], shards: int, strategy: str = 'hash') -> List[List[Tuple[int, Dict[str, Any]]]]:
+    categories = sorted({cv['category'] for cv in cv_data}) if strategy == 'category' else None
+    parts: List[List[Tuple[int, Dict[str, Any]]]] = [[] for _ in range(shards)]
+    for i, cv in enumerate(cv_data):
+        parts[shard_of(cv, shards, strategy, categories)].append((i, cv))
+    return parts
+
+# @brief Kandidat ranking yang bisa digabung lintas shard
+# @return: Tuple (unique_keywords, match_count, is_fuzzy, index global, SearchResult)
+def _candidate(searcher: CVSearcher, global_ids: List[int], i: int, keywords_found: Dict[str, Any],
+               unique_keywords: int, match_count: int, is_fuzzy: bool) -> Tuple:
+    result = searcher._build_result(searcher.cv_data[i], match_count, keywords_found, unique_keywords)
+    result.cv_id = global_ids[i]  # id di korpus penuh, bukan id lokal shard
+    return (unique_keywords, match_count, is_fuzzy, global_ids[i], result)
+
+# @brief Melayani satu shard sampai dapat perintah 'close'
+# @param listener: Listener multiprocessing.connection yang sudah di-bind
+# @param shard: List (index global, dict CV) milik shard ini
+# @param algorithm: Algoritma exact match awal
+# @return: None
+def serve_shard(listener: Listener, shard: List[Tuple[int, Dict[str, Any]]], algorithm: str = "KMP") -> None:
+    searcher = CVSearcher()
+    searcher.set_cv_data([cv for _, cv in shard])
+    searcher.set_algorithm(algorithm)
+    global_ids = [i for i, _ in shard]
+    exact_counts: Dict[int, Dict[str, int]] = {}
+
+    while True:
+        with listener.accept() as conn:
+            while True:
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    break
+                command, query_id = message[0], message[1]
+
+                if command == 'algorithm':
+                    searcher.set_algorithm(message[2])
+                    conn.send((query_id, None))
+
+                elif command == 'exact':
+                    _, _, keywords, top_n = message
+                    start_time = time.time()
+                    exact_counts = searcher.exact_match(keywords)
+                    found = set()
+                    for counts in exact_counts.values():
+                        found.update(counts)
+                    top = heapq.nlargest(top_n, (
+                        (len(counts), sum(counts.values()), i) for i, counts in exact_counts.items()
+                    ), key=lambda c: (c[0], c[1]))
+                    candidates = [
+                        _candidate(searcher, global_ids, i, dict(exact_counts[i]), unique, count, False)
+                        for unique, count, i in top
+                    ]
+                    conn.send((query_id, {'found': found, 'candidates': candidates,
+                                          'time': time.time() - start_time, 'cvs': len(shard)}))
+
+                elif command == 'fuzzy':
+                    _, _, missing_keywords, top_n, budget = message
+                    start_time = time.time()
+                    matches_by_index, scanned, partial = searcher.fuzzy_match(missing_keywords, exact_counts, top_n, budget)
+                    top = heapq.nlargest(top_n, (
+                        (len(matches), sum(len(m) for m in matches.values()), i)
+                        for i, matches in sorted(matches_by_index.items())
+                    ), key=lambda c: (c[0], c[1]))
+                    candidates = [
+                        _candidate(searcher, global_ids, i, {
+                            k: {'matches': matches, 'count': len(matches)}
+                            for k, matches in matches_by_index[i].items()
+                        }, unique, count, True)
+                        for unique, count, i in top
+                    ]
+                    conn.send((query_id, {'candidates': candidates, 'time': time.time() - start_time,
+                                          'scanned': scanned, 'partial': partial}))
+
+                elif command == 'close':
+                    conn.send((query_id, None))
+                    searcher.close()
+                    listener.close()
+                    return
+
+# @brief Entry point proses shard lokal (dipakai ShardCoordinator.spawn_local)
+# @param ready: Pipe buat ngirim alamat listener ke parent
+# @param authkey: Kunci autentikasi koneksi
+# @param shard: List (index global, dict CV)
+# @param algorithm: Algoritma exact match awal
+# @return: None
+def _run_local_shard(ready, authkey: bytes, shard: List[Tuple[int, Dict[str, Any]]], algorithm: str) -> None:
+    listener = Listener(('127.0.0.1', 0), authkey=authkey)
+    ready.send(listener.address)
+    ready.close()
+    serve_shard(listener, shard, algorithm)
+
+class ShardCoordinator:
+    # @param addresses: Alamat tiap shard (tuple (host, port) atau path socket)
+    # @param authkey: Kunci autentikasi yang sama dengan milik shard
+    # @param timeout: Batas waktu jawaban tiap tahap per shard, dalam detik
+    def __init__(self, addresses: List[Any], authkey: bytes, timeout: float = 5.0):
+        self.addresses = list(addresses)
+        self.timeout = timeout
+        self._connections = [Client(address, authkey=authkey) for address in self.addresses]
+        self._total_cvs: Optional[int] = None
+        self._query_id = 0
+        self._processes = []
+
+    # @brief Menyalakan shard sebagai proses lokal lalu menyambungkan coordinator ke semuanya
+    # @param cv_data: List dict CV
+    # @param shards: Jumlah shard
+    # @param strategy: 'hash' atau 'category'
+    # @param timeout: Batas waktu jawaban per shard
+    # @param algorithm: Algoritma exact match awal
+    # @return: ShardCoordinator yang sekalian memiliki proses shard-nya
+    @classmethod
+    def spawn_local(cls, cv_data: List[Dict[str, Any]], shards: int = 2, strategy: str = 'hash',
+                    timeout: float = 5.0, algorithm: str = "KMP") -> "ShardCoordinator":
+        context = multiprocessing.get_context('spawn')
+        authkey = os.urandom(16)
+        processes, addresses = [], []
+        for shard in partition(cv_data, shards, strategy):
+            parent_conn, child_conn = context.Pipe(duplex=False)
+            process = context.Process(target=_run_local_shard, args=(child_conn, authkey, shard, algorithm), daemon=True)
+            process.start()
+            child_conn.close()
+            addresses.append(parent_conn.recv())
+            processes.append(process)
+
+        coordinator = cls(addresses, authkey, timeout)
+        coordinator._processes = processes
+        coordinator._total_cvs = len(cv_data)
+        return coordinator
+
+    # @brief Mengirim perintah ke semua shard yang diminta lalu menunggu jawabannya
+    # @param message: Tuple perintah (tanpa query id)
+    # @param shards: Index shard yang dikirimi (default semua)
+    # @return: Tuple (<index shard, jawaban>, list index shard yang timeout / putus)
+    def _broadcast(self, message: Tuple, shards: Optional[List[int]] = None) -> Tuple[Dict[int, Any], List[int]]:
+        self._query_id += 1
+        query_id = self._query_id
+        shards = list(range(len(self._connections))) if shards is None else shards
+
+        failed = []
+        pending = []
+        for shard in shards:
+            try:
+                self._connections[shard].send((message[0], query_id) + tuple(message[1:]))
+                pending.append(shard)
+            except (OSError, EOFError):
+                failed.append(shard)
+
+        replies: Dict[int, Any] = {}
+        deadline = time.time() + self.timeout
+        for shard in pending:
+            conn = self._connections[shard]
+            try:
+                while True:
+                    remaining = deadline - time.time()
+                    if remaining <= 0 or not conn.poll(remaining):
+                        failed.append(shard)
+                        break
+                    reply_id, payload = conn.recv()
+                    if reply_id == query_id:  # jawaban basi dari query yang dulu timeout dibuang
+                        replies[shard] = payload
+                        break
+            except (OSError, EOFError):
+                failed.append(shard)
+        return replies, sorted(failed)
+
+    # @brief Mengganti algoritma exact match di semua shard
+    # @param algorithm: "KMP", "BM", "AC", "WM", "NATIVE", atau "NUMPY"
+    # @return: None
+    def set_algorithm(self, algorithm: str) -> None:
+        self._broadcast(('algorithm', algorithm))
+
+    # @brief Menggabungkan kandidat dari semua shard dengan urutan CVSearcher.search
+    # @details Urutan awal (exact dulu, lalu index global) meniru urutan kandidat sekuensial,
+    #          jadi nlargest yang stabil memutus seri dengan cara yang sama.
+    # @param candidates: List kandidat hasil shard
+    # @param top_n: Banyak hasil teratas
+    # @return: List SearchResult (cv_id = index global)
+    @staticmethod
+    def merge(candidates: List[Tuple], top_n: int) -> List[Any]:
+        ordered = sorted(candidates, key=lambda c: (c[2], c[3]))
+        winners = heapq.nlargest(top_n, ordered, key=lambda c: (c[0], c[1]))
+        return [candidate[4] for candidate in winners]
+
+    # @brief Mencari CV di semua shard (antarmuka sama dengan CVSearcher.search)
+    # @param keywords: List keyword yang sudah di-strip
+    # @param top_n: Banyak hasil teratas yang dikembalikan
+    # @param fuzzy_budget: Batas waktu tahap fuzzy per shard dalam detik (None = tanpa batas)
+    # @return: Dict seperti CVSearcher.search, plus 'failed_shards' (shard yang timeout / putus)
+    def search(self, keywords: List[str], top_n: int, fuzzy_budget: float = None) -> Dict[str, Any]:
+        start_time = time.time()
+        exact_replies, failed = self._broadcast(('exact', keywords, top_n))
+        exact_time = time.time() - start_time
+
+        candidates = []
+        all_found_keywords = set()
+        for reply in exact_replies.values():
+            candidates.extend(reply['candidates'])
+            all_found_keywords.update(reply['found'])
+
+        fuzzy_start = time.time()
+        fuzzy_scanned, fuzzy_partial = 0, False
+        missing_keywords = set(keywords) - all_found_keywords
+        if missing_keywords:
+            fuzzy_replies, fuzzy_failed = self._broadcast(
+                ('fuzzy', list(missing_keywords), top_n, fuzzy_budget), sorted(exact_replies)
+            )
+            failed = sorted(set(failed) | set(fuzzy_failed))
+            for reply in fuzzy_replies.values():
+                candidates.extend(reply['candidates'])
+                fuzzy_scanned += reply['scanned']
+                fuzzy_partial = fuzzy_partial or reply['partial']
+        fuzzy_time = time.time() - fuzzy_start
+
+        total_cvs = self._total_cvs
+        if total_cvs is None:
+            total_cvs = sum(reply['cvs'] for reply in exact_replies.values())
+
+        return {
+            'results': self.merge(candidates, top_n),
+            'exact_time': exact_time,
+            'fuzzy_time': fuzzy_time,
+            'total_cvs': total_cvs,
+            'fuzzy_scanned': fuzzy_scanned,
+            'fuzzy_partial': fuzzy_partial or bool(failed),
+            'failed_shards': failed
+        }
+
+    # @brief Mematikan shard lokal (kalau coordinator yang menyalakan) dan menutup koneksi
+    # @return: None
+    def close(self) -> None:
+        if self._processes:
+            self._broadcast(('close',))
+        for conn in self._connections:
+            try:
+                conn.close()
+            except OSError:
+                pass
+        for process in self._processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+        self._connections = []
+        self._processes = []
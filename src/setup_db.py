@@ -1,13 +1,26 @@
 # setup_db.py
-import mysql.connector
-from mysql.connector import Error
 import getpass
 import os
 import sys
 import re
 from encryption.custom_encryption import CustomEncryption
 
+SEED_SQL_PATH = 'src/tubes3_seeding.sql'
+
+# @brief Ambil baris ApplicantProfile dan ApplicationDetail dari file seeding SQL
+# @param sql_script: Isi tubes3_seeding.sql
+# @return: Tuple (profile_rows, detail_rows) berisi tuple string mentah
+def parse_seed_rows(sql_script):
+    profile_inserts = re.findall(r"\((\d+),\s*'([^']*)',\s*'([^']*)',\s*'([^']*)',\s*'([^']*)',\s*'([^']*)'\)", sql_script)
+    # Regex untuk mengekstrak nilai dari INSERT INTO ApplicationDetail
+    detail_inserts = re.findall(r"\((\d+),\s*(\d+),\s*(?:'([^']*)'|NULL),\s*'([^']*)'\)", sql_script)
+    return profile_inserts, detail_inserts
+
 def setup_database():
+    # import di sini biar setup_db.py --sqlite gak wajib install mysql-connector
+    import mysql.connector
+    from mysql.connector import Error
+
     conn = None
     cursor = None
     app_conn = None
@@ -60,7 +73,7 @@ def setup_database():
         )
         app_cursor = app_conn.cursor()
 
-        with open('src/tubes3_seeding.sql', 'r', encoding='utf-8') as f:
+        with open(SEED_SQL_PATH, 'r', encoding='utf-8') as f:
             sql_script = f.read()
         print("Membuat tabel ApplicantProfile dan ApplicationDetail...")
         create_table_statements = re.findall(r'CREATE TABLE.*?;', sql_script, re.DOTALL)
@@ -70,7 +83,7 @@ def setup_database():
 
         print("Memproses dan mengenkripsi data ApplicantProfile...")
         encryption = CustomEncryption()
-        profile_inserts = re.findall(r"\((\d+),\s*'([^']*)',\s*'([^']*)',\s*'([^']*)',\s*'([^']*)',\s*'([^']*)'\)", sql_script)
+        profile_inserts, detail_inserts = parse_seed_rows(sql_script)
         
         insert_profile_query = """
         INSERT INTO ApplicantProfile (applicant_id, first_name, last_name, date_of_birth, address, phone_number) 
@@ -92,9 +105,6 @@ def setup_database():
         print(f"\x1b[32m{len(profile_inserts)} baris data ApplicantProfile berhasil dimasukkan dan dienkripsi.\x1b[0m")
 
         print("Memproses data ApplicationDetail...")
-        
-        # Regex untuk mengekstrak nilai dari INSERT INTO ApplicationDetail
-        detail_inserts = re.findall(r"\((\d+),\s*(\d+),\s*(?:'([^']*)'|NULL),\s*'([^']*)'\)", sql_script)
 
         insert_detail_query = """
         INSERT INTO ApplicationDetail (detail_id, applicant_id, application_role, cv_path) 
@@ -112,7 +122,8 @@ def setup_database():
         # bikin file .env
         print("Membikin file .env...")
         
-        env_content = f"""DB_HOST=localhost
+        env_content = f"""DB_BACKEND=mysql
+DB_HOST=localhost
 DB_NAME={db_name}
 DB_USER={app_user}
 DB_PASSWORD={app_password}
@@ -131,5 +142,60 @@ DB_PASSWORD={app_password}
             cursor.close()
             conn.close()
 
+def setup_sqlite_database(db_path='ats_db.sqlite3'):
+    # import di sini soalnya DatabaseConnection manggil load_dotenv() pas di-import
+    from database.backends import SQLiteBackend
+    from database.connection import DatabaseConnection
+
+    print(f"Membuat database SQLite '{db_path}'...")
+    db = DatabaseConnection(SQLiteBackend(db_path))
+    if not db.connect():
+        print("\x1b[31mGagal membuka file database SQLite\x1b[0m")
+        return
+    try:
+        db.execute_query("DROP TABLE IF EXISTS ApplicationDetail")
+        db.execute_query("DROP TABLE IF EXISTS ApplicantProfile")
+        db.create_tables()
+
+        with open(SEED_SQL_PATH, 'r', encoding='utf-8') as f:
+            sql_script = f.read()
+        profile_inserts, detail_inserts = parse_seed_rows(sql_script)
+
+        print("Memproses dan mengenkripsi data ApplicantProfile...")
+        encryption = CustomEncryption()
+        for applicant_id, first_name, last_name, dob, address, phone in profile_inserts:
+            db.cursor.execute(db.backend.prepare("""
+            INSERT INTO ApplicantProfile (applicant_id, first_name, last_name, date_of_birth, address, phone_number)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            """), (
+                int(applicant_id), encryption.encrypt(first_name), encryption.encrypt(last_name),
+                dob, encryption.encrypt(address), encryption.encrypt(phone)
+            ))
+        print(f"\x1b[32m{len(profile_inserts)} baris data ApplicantProfile berhasil dimasukkan dan dienkripsi.\x1b[0m")
+
+        print("Memproses data ApplicationDetail...")
+        for detail_id, applicant_id, role, path in detail_inserts:
+            db.cursor.execute(db.backend.prepare("""
+            INSERT INTO ApplicationDetail (detail_id, applicant_id, application_role, cv_path)
+            VALUES (%s, %s, %s, %s)
+            """), (int(detail_id), int(applicant_id), role or None, path))
+        db.connection.commit()
+        print(f"\x1b[32m{len(detail_inserts)} baris data ApplicationDetail berhasil dimasukkan.\x1b[0m")
+    finally:
+        db.close()
+
+    print("Membikin file .env...")
+    with open('.env', 'w') as f:
+        f.write(f"""DB_BACKEND=sqlite
+DB_PATH={db_path}
+""")
+    print("\x1b[32mfile .env berhasil dibikin.\x1b[0m")
+
+    print("\n\x1b[32mBang done bang\x1b[0m")
+
 if __name__ == "__main__":
-    setup_database()
\ No newline at end of file
+    # --sqlite: pakai database SQLite lokal, gak perlu MySQL server
+    if '--sqlite' in sys.argv:
+        setup_sqlite_database()
+    else:
+        setup_database()
\ No newline at end of file
@@ -0,0 +1,130 @@
+##########################################################################
+##########################################################################
+## @file cache.py
+## Ini isinya BoundedCache: cache LRU yang dipakai bareng semua algoritma
+## (tabel LPS KMP, tabel Boyer-Moore, automaton Aho-Corasick, jarak
+## Levenshtein, dst). get/put/evict semuanya O(1) pakai OrderedDict,
+## dibatasi jumlah entri dan (opsional) perkiraan ukuran byte, plus
+## counter hit/miss/eviction buat dipantau.
+##########################################################################
+##########################################################################
+
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+_MISSING = object()
+
+# @brief Perkiraan ukuran objek dalam byte (rekursif untuk container bawaan)
+# @param obj: Objek yang mau diukur
+# @param depth: Batas kedalaman rekursi biar gak mahal
+# @return: Perkiraan ukuran dalam byte
+def approx_sizeof(obj: Any, depth: int = 3) -> int:
+    size = sys.getsizeof(obj)
+    if depth <= 0:
+        return size
+    if isinstance(obj, dict):
+        size += sum(approx_sizeof(k, depth - 1) + approx_sizeof(v, depth - 1) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approx_sizeof(item, depth - 1) for item in obj)
+    return size
+
+class BoundedCache:
+    # @param max_entries: Jumlah entri maksimum (None = gak dibatasi)
+    # @param max_bytes: Perkiraan total byte maksimum (None = gak dihitung sama sekali)
+    # @param sizeof: Fungsi pengukur ukuran value, default approx_sizeof
+    # @param name: Nama cache untuk laporan statistik
+    def __init__(self, max_entries: Optional[int] = 1000, max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any], int]] = None, name: str = "cache"):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or approx_sizeof
+        self._data: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # @brief Ambil value dan tandai sebagai yang terakhir dipakai
+    # @param key: Key cache
+    # @param default: Value kalau key gak ada
+    # @return: Value yang tersimpan, atau default
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    # @brief Simpan value, lalu buang entri paling lama gak dipakai kalau lewat batas
+    # @param key: Key cache
+    # @param value: Value yang disimpan
+    # @param size: Ukuran value dalam byte kalau sudah diketahui (opsional)
+    # @return: None
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> None:
+        if self.max_bytes is not None and size is None:
+            size = self._sizeof(value)
+        size = size or 0
+
+        old = self._data.pop(key, _MISSING)
+        if old is not _MISSING:
+            self._bytes -= old[1]
+        self._data[key] = (value, size)
+        self._bytes += size
+
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes and len(self._data) > 1)
+        ):
+            _, (_, evicted_size) = self._data.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    # @brief Mengisi cache dari dict biasa (misal dari snapshot)
+    # @param mapping: Dict <key, value>
+    # @return: None
+    def update(self, mapping: Dict[Hashable, Any]) -> None:
+        for key, value in mapping.items():
+            self.put(key, value)
+
+    # @brief Semua pasangan key-value, dari yang paling lama ke yang terbaru (gak ngubah urutan LRU)
+    # @return: Iterator (key, value)
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        return ((key, entry[0]) for key, entry in self._data.items())
+
+    # @brief Mengosongkan cache (counter statistik tetap)
+    # @return: None
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    # @brief Statistik pemakaian cache
+    # @return: Dict berisi entries, bytes, hits, misses, evictions, dan hit_rate
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'name': self.name,
+            'entries': len(self._data),
+            'bytes': self._bytes if self.max_bytes is not None else None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    # Cek keberadaan key tanpa ngubah urutan LRU maupun statistik
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"BoundedCache({self.name!r}, entries={len(self._data)}, hits={self.hits}, misses={self.misses})"
@@ -0,0 +1,56 @@
+##########################################################################
+##########################################################################
+## @file conftest.py
+## Setup pytest: folder src dimasukin ke sys.path (modul di-import absolut
+## kayak waktu aplikasinya jalan), plus korpus CV sintetis dari
+## benchmark/corpus_generator.py dan hitungan brute force sebagai acuan.
+##########################################################################
+##########################################################################
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import pytest
+
+from benchmark.corpus_generator import generate_cv_text, CATEGORIES
+
+ALGORITHMS = ['KMP', 'BM', 'AC', 'WM', 'NATIVE', 'NUMPY']
+KEYWORDS = ['python', 'React', 'Java', 'JavaScript', 'project management', 'a', 'ss', 'résumé', 'zzz']
+
+# @brief Membuat satu dict CV sintetis (sebagian pakai karakter non-ASCII)
+# @param rng: random.Random
+# @param i: Nomor CV
+# @return: Dict CV seperti hasil PDFExtractor plus extracted_info dan name
+def make_cv(rng: random.Random, i: int) -> dict:
+    category = CATEGORIES[i % len(CATEGORIES)]
+    text = generate_cv_text(rng, category, paragraphs=rng.randint(1, 4))
+    if i % 5 == 0:
+        text += " Résumé • RÉSUMÉ naïve"
+    return {'path': f"/data/{category}/{i}.pdf", 'filename': f"{i}.pdf", 'category': category,
+            'text': text, 'extracted_info': {}, 'name': f"CV {i}"}
+
+# @brief Jumlah kemunculan (overlap ikut) tiap keyword di tiap CV, dihitung langsung
+# @param texts: Teks CV (case asli)
+# @param keywords: List keyword
+# @return: Dictionary <index CV, <keyword, jumlah>>, format sama dengan CVSearcher.exact_match
+def brute_force_counts(texts, keywords) -> dict:
+    expected = {}
+    for i, text in enumerate(texts):
+        text = text.lower()
+        counts = {}
+        for keyword in dict.fromkeys(keywords):
+            pattern = keyword.lower()
+            count = sum(1 for start in range(len(text)) if text.startswith(pattern, start))
+            if count:
+                counts[keyword] = count
+        if counts:
+            expected[i] = counts
+    return expected
+
+@pytest.fixture
+def cvs():
+    rng = random.Random(7)
+    return [make_cv(rng, i) for i in range(60)]
@@ -0,0 +1,139 @@
+##########################################################################
+##########################################################################
+## @file test_corpus_formats.py
+## Test format file korpus: snapshot, korpus mmap (write_corpus /
+## MmapCorpus), index posisional (write_index / PositionalIndex),
+## DiskTextStore, plus CLI corpus_cli.py di atasnya. Semua harus bisa
+## ditulis lalu dibaca lagi dengan isi dan hasil pencarian yang sama.
+##########################################################################
+##########################################################################
+
+import pickle
+
+import pytest
+
+from conftest import KEYWORDS, brute_force_counts
+from algorithms.query import compile_query
+from benchmark.corpus_generator import generate_pdf_corpus
+from corpus.disk_texts import DiskTextStore
+from corpus.mmap_corpus import write_corpus, MmapCorpus
+from corpus.positional_index import write_index, PositionalIndex
+from corpus.records import CVStore
+from corpus.snapshot import compute_fingerprint, read_snapshot, write_snapshot
+from corpus.store import CorpusStore
+from corpus_cli import main as corpus_cli, search_corpus
+from search.cv_searcher import CVSearcher
+
+@pytest.fixture
+def searcher(cvs):
+    searcher = CVSearcher()
+    searcher.set_cv_data([dict(cv) for cv in cvs])
+    return searcher
+
+def test_snapshot_round_trip(searcher, tmp_path):
+    data_dir = tmp_path / 'data'
+    (data_dir / 'HR').mkdir(parents=True)
+    (data_dir / 'HR' / '1.pdf').write_bytes(b'%PDF-1.4')
+    snapshot_path = str(tmp_path / 'cv_snapshot.bin')
+
+    searcher.set_algorithm('AC')
+    searcher.search(KEYWORDS, 10) # isi cache automaton biar ikut ke-snapshot
+    state = searcher.export_state()
+    state['file_states'] = {'HR/1.pdf': (1, 8)}
+    write_snapshot(snapshot_path, str(data_dir), state)
+
+    restored_state = read_snapshot(snapshot_path, str(data_dir))
+    assert restored_state is not None and restored_state['file_states'] == {'HR/1.pdf': (1, 8)}
+    restored = CVSearcher()
+    restored.restore_state(restored_state)
+    assert [cv.path for cv in restored.cv_data] == [cv.path for cv in searcher.cv_data]
+    assert [cv.text for cv in restored.cv_data] == [cv.text for cv in searcher.cv_data]
+    summary = lambda outcome: [(r.cv_id, r.record.path, r.match_count, r.keywords_found) for r in outcome['results']]
+    for algorithm in ('KMP', 'AC'):
+        restored.set_algorithm(algorithm)
+        searcher.set_algorithm(algorithm)
+        assert summary(restored.search(KEYWORDS, 20)) == summary(searcher.search(KEYWORDS, 20))
+
+    # folder berubah -> snapshot basi, cuma dipakai kalau allow_stale
+    (data_dir / 'HR' / '2.pdf').write_bytes(b'%PDF-1.4')
+    assert read_snapshot(snapshot_path, str(data_dir)) is None
+    assert read_snapshot(snapshot_path, str(data_dir), compute_fingerprint(str(data_dir)), allow_stale=True) is not None
+
+def test_disk_snapshot_round_trip(cvs, tmp_path):
+    searcher = CVSearcher()
+    searcher.set_cv_data(CVStore((dict(cv) for cv in cvs), text_store=DiskTextStore(str(tmp_path / 'texts.bin'))))
+
+    restored = CVSearcher()
+    restored.restore_state(pickle.loads(pickle.dumps(searcher.export_state())))
+    assert restored.corpus.on_disk
+    assert [cv.text for cv in restored.cv_data] == [cv['text'] for cv in cvs]
+    assert restored.exact_match(KEYWORDS) == brute_force_counts([cv['text'] for cv in cvs], KEYWORDS)
+
+def test_disk_text_store_round_trip(tmp_path):
+    texts = ['Résumé İstanbul', '', 'plain ascii', '日本語 • text']
+    store = DiskTextStore(str(tmp_path / 'texts.bin'))
+    ids = [store.add(text) for text in texts]
+    ids.append(store.add('replacement')) # teks baru setelah dibaca tetap kebaca (remap)
+    assert [store.get(id) for id in ids] == texts + ['replacement']
+
+    copy = pickle.loads(pickle.dumps(store))
+    assert [copy.get(id) for id in ids] == texts + ['replacement']
+    assert [copy.length_of(id) for id in ids] == [len(text) for text in texts + ['replacement']]
+    copy.close()
+    store.close()
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-32-le'])
+def test_mmap_corpus_round_trip(searcher, cvs, tmp_path, encoding):
+    path = str(tmp_path / 'cv_corpus.bin')
+    write_corpus(path, searcher.corpus.texts, searcher.cv_data, encoding)
+
+    with MmapCorpus(path) as corpus:
+        assert len(corpus) == len(cvs)
+        assert list(corpus.texts()) == [CorpusStore.normalize(cv['text']) for cv in cvs]
+        for i, cv in enumerate(cvs):
+            meta = corpus.meta(i)
+            assert (meta['path'], meta['filename'], meta['name'], meta['category']) == \
+                   (cv['path'], cv['filename'], cv['name'], cv['category'])
+            assert meta['length'] == len(cv['text'].lower())
+        expected = brute_force_counts([cv['text'] for cv in cvs], KEYWORDS)
+        assert corpus.exact_match(compile_query(KEYWORDS, 'KMP')) == expected
+        index_of = {cv['path']: i for i, cv in enumerate(cvs)}
+        for algorithm in ('KMP', 'AC', 'NATIVE'):
+            results = search_corpus(corpus, KEYWORDS, 10, algorithm)
+            assert all(result['keywords_found'] == expected[index_of[result['path']]] for result in results)
+            ranking = [(result['unique_keywords_matched'], result['match_count']) for result in results]
+            assert len(results) == 10 and ranking == sorted(ranking, reverse=True)
+
+def test_corpus_cli_matches_searcher(tmp_path, capsys):
+    data_dir = tmp_path / 'data'
+    generate_pdf_corpus(str(data_dir), 8, seed=3, paragraphs=2)
+    corpus_path = str(tmp_path / 'cv_corpus.bin')
+    assert corpus_cli(['build', '--data-dir', str(data_dir), '--corpus', corpus_path,
+                       '--index-path', str(tmp_path / 'cv_index.bin')]) == 0
+
+    keywords = ['python', 'excel', 'a']
+    with MmapCorpus(corpus_path) as corpus, PositionalIndex(str(tmp_path / 'cv_index.bin')) as index:
+        searcher = CVSearcher()
+        searcher.set_cv_data([{**corpus.meta(i), 'text': corpus.text(i), 'extracted_info': {}} for i in range(len(corpus))])
+        expected = [(r['path'], r['keywords_found']) for r in searcher.search(keywords, 5)['results']]
+        assert [(r['path'], r['keywords_found']) for r in search_corpus(corpus, keywords, 5)] == expected
+        assert [(r['path'], r['keywords_found']) for r in search_corpus(corpus, keywords, 5, index=index)] == expected
+
+    capsys.readouterr()
+    assert corpus_cli(['search', 'python', 'excel', 'a', '--corpus', corpus_path, '--top-n', '5', '--algorithm', 'AC']) == 0
+    assert capsys.readouterr().out.count('matches [') == len(expected)
+    assert corpus_cli(['search', 'python', 'excel', 'a', '--corpus', corpus_path, '--top-n', '5',
+                       '--index', '--index-path', str(tmp_path / 'cv_index.bin')]) == 0
+    assert capsys.readouterr().out.count('matches [') == len(expected)
+    assert corpus_cli(['search', 'python', '--corpus', str(tmp_path / 'missing.bin')]) == 1
+
+@pytest.mark.parametrize('memory_limit', [64 * 1024 * 1024, 4096])
+def test_positional_index_round_trip(searcher, cvs, tmp_path, memory_limit):
+    # memory_limit kecil maksa writer spill ke run sementara lalu merge
+    path = str(tmp_path / 'cv_index.bin')
+    assert write_index(path, searcher.corpus.texts, memory_limit) == len(cvs)
+
+    keywords = KEYWORDS + ['data analysis', 'e, ', '  ']
+    with PositionalIndex(path) as index:
+        assert len(index) == len(cvs)
+        assert index.exact_match(keywords) == brute_force_counts([cv['text'] for cv in cvs], keywords)
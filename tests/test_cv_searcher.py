@@ -0,0 +1,160 @@
+##########################################################################
+##########################################################################
+## @file test_cv_searcher.py
+## Test CVSearcher: hasil exact match dan jumlah kemunculan keyword di
+## hasil search dari semua algoritma harus sama dengan hitungan brute force,
+## add_cv / update_cv / remove_cv harus bikin korpus yang sama persis
+## dengan load ulang dari awal, dan mode disk (DiskTextStore) harus sama
+## dengan mode memori.
+##########################################################################
+##########################################################################
+
+import pickle
+import random
+
+import pytest
+
+from conftest import ALGORITHMS, KEYWORDS, brute_force_counts, make_cv
+from algorithms.boyer_moore import BoyerMoore, VARIANTS
+from algorithms.query import ENGINES, compile_query
+from corpus.disk_texts import DiskTextStore
+from corpus.records import CVStore
+from search.cv_searcher import CVSearcher
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_exact_match_matches_brute_force(cvs, algorithm):
+    searcher = CVSearcher()
+    searcher.set_cv_data([dict(cv) for cv in cvs])
+    searcher.set_algorithm(algorithm)
+
+    expected = brute_force_counts([cv['text'] for cv in cvs], KEYWORDS)
+    assert searcher.exact_match(KEYWORDS) == expected
+    for keyword in KEYWORDS:
+        assert searcher.exact_match([keyword]) == brute_force_counts([cv['text'] for cv in cvs], [keyword])
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_search_counts_match_brute_force(cvs, algorithm):
+    searcher = CVSearcher()
+    searcher.set_cv_data([dict(cv) for cv in cvs])
+    searcher.set_algorithm(algorithm)
+
+    expected = brute_force_counts([cv['text'] for cv in cvs], KEYWORDS)
+    outcome = searcher.search(KEYWORDS, len(cvs))
+    assert {result.cv_id: result.keywords_found for result in outcome['results']} == expected
+
+    ranking = [(result.unique_keywords_matched, result.match_count) for result in outcome['results']]
+    assert ranking == sorted(ranking, reverse=True)
+
+def test_results_reference_records_by_id(cvs):
+    searcher = CVSearcher()
+    searcher.set_cv_data([dict(cv) for cv in cvs])
+    assert [cv.id for cv in searcher.cv_data] == list(range(len(cvs)))
+    assert [cv.to_dict()['text'] for cv in searcher.cv_data] == [cv['text'] for cv in cvs]
+
+    outcome = searcher.search(['python', 'pyhton', 'zzz'], 10)
+    assert outcome['results']
+    for result in outcome['results']:
+        assert result.record is searcher.cv_data[result.cv_id]
+        # akses gaya dict tetap jalan buat pemanggil lama
+        assert result['path'] == cvs[result.cv_id]['path'] and result.get('db_phone', '') == ''
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_match_positions_matches_brute_force(cvs, algorithm):
+    searcher = CVSearcher()
+    searcher.set_cv_data([dict(cv) for cv in cvs])
+    searcher.set_algorithm(algorithm)
+
+    for cv in cvs[:10]:
+        text = cv['text'].lower()
+        expected = {}
+        for keyword in KEYWORDS:
+            positions = [start for start in range(len(text)) if text.startswith(keyword.lower(), start)]
+            if positions:
+                expected[keyword] = {'positions': positions, 'count': len(positions)}
+        assert searcher.match_positions(cv['path'], KEYWORDS) == expected
+    assert searcher.match_positions('/data/missing.pdf', KEYWORDS) == {}
+
+@pytest.mark.parametrize('variant', VARIANTS)
+def test_boyer_moore_variants_match_brute_force(cvs, variant):
+    boyer_moore = BoyerMoore(variant)
+    texts = [cv['text'] for cv in cvs]
+    expected = brute_force_counts(texts, KEYWORDS)
+    for i, text in enumerate(texts):
+        assert boyer_moore.count_multiple(text, KEYWORDS) == expected.get(i, {})
+        for keyword in ('résumé', '•', 'python'):
+            positions = boyer_moore.search(text, keyword)
+            assert boyer_moore.search_first(text, keyword) == (positions[0] if positions else -1)
+
+@pytest.mark.parametrize('algorithm', list(ENGINES))
+def test_compiled_query_survives_pickle(cvs, algorithm):
+    # keyword panjang: trie AC yang di-pickle apa adanya kena RecursionError
+    keywords = KEYWORDS + ['x' * 2000]
+    query = compile_query(keywords, algorithm)
+    copy = pickle.loads(pickle.dumps(query))
+    assert copy.keywords == query.keywords
+
+    engine = ENGINES[algorithm]()
+    expected = brute_force_counts([cv['text'] for cv in cvs], keywords)
+    for i, cv in enumerate(cvs):
+        assert engine.count_query(cv['text'].lower(), copy) == expected.get(i, {})
+
+@pytest.mark.parametrize('algorithm', ['KMP', 'AC', 'NUMPY'])
+def test_disk_mode_matches_memory_mode(cvs, tmp_path, algorithm):
+    memory = CVSearcher()
+    memory.set_cv_data([dict(cv) for cv in cvs])
+    disk = CVSearcher()
+    disk.set_cv_data(CVStore((dict(cv) for cv in cvs), text_store=DiskTextStore(str(tmp_path / 'texts.bin'))))
+    assert disk.corpus.on_disk
+
+    for searcher in (memory, disk):
+        searcher.set_algorithm(algorithm)
+    assert disk.exact_match(KEYWORDS) == memory.exact_match(KEYWORDS)
+    assert [disk.corpus.length(i) for i in range(len(cvs))] == [memory.corpus.length(i) for i in range(len(cvs))]
+
+    keywords = ['python', 'pyhton', 'managment']
+    summary = lambda outcome: [(r.cv_id, r.record.path, r.match_count, r.keywords_found) for r in outcome['results']]
+    assert summary(disk.search(keywords, 10)) == summary(memory.search(keywords, 10))
+
+def test_incremental_updates_shift_ids(cvs):
+    rng = random.Random(11)
+    searcher = CVSearcher()
+    searcher.set_cv_data([dict(cv) for cv in cvs])
+    current = [dict(cv) for cv in cvs]
+
+    removed = searcher.remove_cv(current[10]['path'])
+    assert removed is not None and removed.path == current[10]['path']
+    del current[10]
+    assert searcher.remove_cv('/data/missing.pdf') is None
+
+    changed = make_cv(rng, 25)
+    changed['path'] = current[25]['path']
+    record = searcher.update_cv(dict(changed))
+    assert record.id == 25
+    current[25] = changed
+
+    added = make_cv(rng, 100)
+    record = searcher.add_cv(dict(added))
+    assert record.id == len(current)
+    current.append(added)
+
+    # update_cv untuk path yang belum ada = add_cv
+    new = make_cv(rng, 101)
+    assert searcher.update_cv(dict(new)).id == len(current)
+    current.append(new)
+
+    assert [cv.id for cv in searcher.cv_data] == list(range(len(current)))
+    assert [cv.path for cv in searcher.cv_data] == [cv['path'] for cv in current]
+    for cv in current:
+        assert searcher.cv_data.find(cv['path']).text == cv['text']
+
+    fresh = CVSearcher()
+    fresh.set_cv_data([dict(cv) for cv in current])
+    expected = brute_force_counts([cv['text'] for cv in current], KEYWORDS)
+    for algorithm in ALGORITHMS:
+        searcher.set_algorithm(algorithm)
+        fresh.set_algorithm(algorithm)
+        assert searcher.exact_match(KEYWORDS) == expected
+        assert searcher.signatures.export() == fresh.signatures.export()
+
+    summary = lambda outcome: [(r.cv_id, r.record.path, r.match_count) for r in outcome['results']]
+    assert summary(searcher.search(['python', 'pyhton'], 10)) == summary(fresh.search(['python', 'pyhton'], 10))
@@ -0,0 +1,46 @@
+##########################################################################
+##########################################################################
+## @file test_database.py
+## Test storage backend: DatabaseConnection di atas SQLite, error driver
+## ditangani di connect(), dan setup_db.py bisa di-import tanpa
+## mysql-connector.
+##########################################################################
+##########################################################################
+
+import importlib
+import sys
+
+from database.backends import SQLiteBackend, get_backend
+from database.connection import DatabaseConnection
+
+def test_sqlite_connection_round_trip(tmp_path):
+    db = DatabaseConnection(SQLiteBackend(str(tmp_path / 'ats.sqlite3')))
+    assert db.connect()
+    db.create_tables()
+    assert db.execute_query("INSERT INTO ApplicantProfile (first_name, last_name) VALUES (%s, %s)", ('Ada', 'Lovelace'))
+    assert db.execute_query("INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (%s, %s, %s)",
+                            (1, 'ENGINEERING', 'data/ENGINEERING/1.pdf'))
+
+    rows = db.fetch_all("SELECT ap.first_name, ad.application_role FROM ApplicationDetail ad "
+                        "JOIN ApplicantProfile ap ON ap.applicant_id = ad.applicant_id WHERE ad.detail_id = %s", (1,))
+    assert rows == [{'first_name': 'Ada', 'application_role': 'ENGINEERING'}]
+    assert db.fetch_one("SELECT COUNT(*) AS n FROM ApplicantProfile") == {'n': 1}
+    db.close()
+
+def test_connect_reports_driver_errors(tmp_path):
+    db = DatabaseConnection(SQLiteBackend(str(tmp_path / 'missing' / 'ats.sqlite3')))
+    assert db.connect() is False
+    assert db.connection is None and db.cursor is None
+
+def test_get_backend_from_env(monkeypatch):
+    monkeypatch.setenv('DB_BACKEND', 'SQLite')
+    monkeypatch.setenv('DB_PATH', ':memory:')
+    backend = get_backend()
+    assert isinstance(backend, SQLiteBackend) and backend.path == ':memory:'
+
+def test_setup_db_imports_without_mysql_connector(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'mysql', None)
+    monkeypatch.setitem(sys.modules, 'mysql.connector', None)
+    monkeypatch.delitem(sys.modules, 'setup_db', raising=False)
+    setup_db = importlib.import_module('setup_db')
+    assert callable(setup_db.setup_sqlite_database)
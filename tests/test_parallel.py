@@ -0,0 +1,55 @@
+##########################################################################
+##########################################################################
+## @file test_parallel.py
+## Test exact match multi-core (search/parallel.py): hasil worker harus
+## sama dengan pencarian sekuensial, termasuk setelah korpus berubah
+## (worker di-load ulang pas query berikutnya).
+##########################################################################
+##########################################################################
+
+import random
+
+import pytest
+
+from conftest import ALGORITHMS, KEYWORDS, make_cv
+from search.cv_searcher import CVSearcher
+
+@pytest.fixture
+def searchers(cvs):
+    sequential = CVSearcher()
+    sequential.set_cv_data([dict(cv) for cv in cvs])
+    parallel = CVSearcher()
+    parallel.enable_parallel(2, min_cvs=1)
+    parallel.set_cv_data([dict(cv) for cv in cvs])
+    yield sequential, parallel
+    parallel.close()
+
+def test_parallel_matches_sequential(searchers):
+    sequential, parallel = searchers
+    assert len(parallel.parallel) == len(parallel.cv_data)
+    for algorithm in ALGORITHMS:
+        sequential.set_algorithm(algorithm)
+        parallel.set_algorithm(algorithm)
+        assert parallel.exact_match(KEYWORDS) == sequential.exact_match(KEYWORDS)
+        assert parallel.exact_match(['python']) == sequential.exact_match(['python'])
+
+    summary = lambda outcome: [(r.cv_id, r.record.path, r.match_count, r.keywords_found) for r in outcome['results']]
+    assert summary(parallel.search(['python', 'pyhton'], 10)) == summary(sequential.search(['python', 'pyhton'], 10))
+
+def test_parallel_reloads_after_updates(searchers):
+    sequential, parallel = searchers
+    rng = random.Random(3)
+    for searcher in (sequential, parallel):
+        searcher.set_algorithm('AC')
+        searcher.remove_cv('/data/HR/2.pdf')
+        searcher.add_cv(make_cv(random.Random(5), 200))
+    changed = make_cv(rng, 40)
+    changed['path'] = sequential.cv_data[0].path
+    for searcher in (sequential, parallel):
+        searcher.update_cv(dict(changed))
+
+    assert parallel.exact_match(KEYWORDS) == sequential.exact_match(KEYWORDS)
+    assert len(parallel.parallel) == len(sequential.cv_data)
+
+    summary = lambda outcome: [(r.cv_id, r.record.path, r.match_count, r.keywords_found) for r in outcome['results']]
+    assert summary(parallel.search(['python', 'pyhton'], 10)) == summary(sequential.search(['python', 'pyhton'], 10))
@@ -0,0 +1,28 @@
+##########################################################################
+##########################################################################
+## @file test_pipeline_benchmark.py
+## Test benchmark pipeline: run kecil dari PDF sintetis sampai search, dan
+## cek regresi terhadap baseline.
+##########################################################################
+##########################################################################
+
+from benchmark.corpus_generator import generate_pdf_corpus
+from benchmark.pipeline_benchmark import run_pipeline, compare_with_baseline
+
+def test_run_pipeline_reports_every_stage(tmp_path):
+    generate_pdf_corpus(str(tmp_path), 6, seed=1, paragraphs=2)
+    report = run_pipeline(str(tmp_path), [['python', 'excel']], ['KMP', 'AC'])
+
+    assert report['meta']['cvs'] == 6
+    for stage in ('pdf_extraction', 'clean_text', 'regex_extraction', 'db_load'):
+        assert report['stages'][stage]['items'] > 0
+    assert any(name.startswith('search') for name in report['stages'])
+    assert {'stream_search_KMP', 'stream_search_AC'} <= set(report['stages'])
+    assert compare_with_baseline(report, report, 0.25) == []
+
+def test_compare_with_baseline_flags_slow_stages():
+    baseline = {'stages': {'clean_text': {'wall_time': 1.0}, 'db_load': {'wall_time': 1.0}}}
+    report = {'stages': {'clean_text': {'wall_time': 1.2}, 'db_load': {'wall_time': 1.3}, 'new_stage': {'wall_time': 9.0}}}
+
+    regressions = compare_with_baseline(report, baseline, 0.25)
+    assert len(regressions) == 1 and regressions[0].startswith('db_load')
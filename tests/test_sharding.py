@@ -0,0 +1,83 @@
+##########################################################################
+##########################################################################
+## @file test_sharding.py
+## Test pencarian terdistribusi (search/sharding.py): shard lokal dinyalakan
+## pakai ShardCoordinator.spawn_local, hasil gabungannya harus sama persis
+## dengan CVSearcher.search di korpus utuh (urutan, jumlah, keyword).
+## Shard yang lambat / mati dilewati: hasilnya parsial dari shard sisanya.
+##########################################################################
+##########################################################################
+
+import os
+import signal
+
+import pytest
+
+from search.cv_searcher import CVSearcher
+from search.sharding import ShardCoordinator, partition
+
+QUERIES = [['python', 'React', 'html'], ['résumé', '•'], ['a'], ['zzz'], ['pyhton', 'kubernetes'],
+           ['Java', 'JavaScript', 'script'], ['management'], ['developmnet']]
+
+# @brief Bagian hasil yang harus sama antara shard dan searcher tunggal
+# @param outcome: Hasil search
+# @return: List (path, match_count, keywords_found, unique_keywords_matched)
+def summary(outcome):
+    return [(r['path'], r['match_count'], r['keywords_found'], r['unique_keywords_matched']) for r in outcome['results']]
+
+@pytest.mark.parametrize('strategy, shards', [('hash', 2), ('category', 3)])
+def test_shards_match_single_searcher(cvs, strategy, shards):
+    assert sorted(i for shard in partition(cvs, shards, strategy) for i, _ in shard) == list(range(len(cvs)))
+
+    searcher = CVSearcher()
+    searcher.set_cv_data([dict(cv) for cv in cvs])
+    coordinator = ShardCoordinator.spawn_local(cvs, shards, strategy)
+    try:
+        for algorithm in ('KMP', 'AC'):
+            searcher.set_algorithm(algorithm)
+            coordinator.set_algorithm(algorithm)
+            for keywords in QUERIES:
+                for top_n in (1, 5, 20):
+                    expected = searcher.search(keywords, top_n)
+                    outcome = coordinator.search(keywords, top_n)
+                    assert outcome['failed_shards'] == []
+                    assert outcome['total_cvs'] == len(cvs)
+                    assert summary(outcome) == summary(expected)
+    finally:
+        coordinator.close()
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGSTOP'), reason="butuh SIGSTOP/SIGCONT (POSIX)")
+def test_slow_or_dead_shard_returns_partial_results(cvs):
+    shards = partition(cvs, 2, 'hash')
+    survivor = CVSearcher()
+    survivor.set_cv_data([dict(cv) for _, cv in shards[0]])
+    searcher = CVSearcher()
+    searcher.set_cv_data([dict(cv) for cv in cvs])
+    keywords = ['python', 'React', 'html']
+
+    coordinator = ShardCoordinator.spawn_local(cvs, 2, 'hash')
+    try:
+        # shard 1 dibekukan -> gak jawab sebelum timeout
+        coordinator.timeout = 0.5
+        os.kill(coordinator._processes[1].pid, signal.SIGSTOP)
+        try:
+            outcome = coordinator.search(keywords, 10)
+        finally:
+            os.kill(coordinator._processes[1].pid, signal.SIGCONT)
+        assert outcome['failed_shards'] == [1] and outcome['fuzzy_partial']
+        assert summary(outcome) == summary(survivor.search(keywords, 10))
+
+        # jawaban basi shard 1 dari query yang timeout harus dibuang
+        coordinator.timeout = 5.0
+        outcome = coordinator.search(keywords, 10)
+        assert outcome['failed_shards'] == []
+        assert summary(outcome) == summary(searcher.search(keywords, 10))
+
+        # shard 1 mati -> koneksi putus
+        coordinator._processes[1].terminate()
+        coordinator._processes[1].join()
+        outcome = coordinator.search(keywords, 10)
+        assert outcome['failed_shards'] == [1]
+        assert summary(outcome) == summary(survivor.search(keywords, 10))
+    finally:
+        coordinator.close()
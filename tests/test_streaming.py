@@ -0,0 +1,49 @@
+##########################################################################
+##########################################################################
+## @file test_streaming.py
+## Test matcher streaming (algorithms/streaming.py): hasil feed per
+## potongan harus sama dengan search_multiple di teks utuh, termasuk match
+## yang kepotong di batas chunk, dan error ekstraksi PDF gak ditelan.
+##########################################################################
+##########################################################################
+
+import random
+
+import pytest
+
+from conftest import KEYWORDS
+from algorithms.kmp import KMP
+from algorithms.streaming import STREAMING_MATCHERS, stream_search
+from benchmark.corpus_generator import generate_pdf_corpus
+from extractors.pdf_extractor import PDFExtractor
+
+# @brief Memotong teks di titik-titik acak
+# @param rng: random.Random
+# @param text: Teks yang dipotong
+# @return: List potongan (sebagian kosong / satu karakter)
+def split_randomly(rng, text):
+    cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 30)))
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+@pytest.mark.parametrize('algorithm', list(STREAMING_MATCHERS))
+def test_streaming_matches_whole_text(cvs, algorithm):
+    rng = random.Random(13)
+    matcher = STREAMING_MATCHERS[algorithm](KEYWORDS)
+    for cv in cvs:
+        matcher.reset()
+        assert stream_search(split_randomly(rng, cv['text']), matcher) == KMP().search_multiple(cv['text'], KEYWORDS)
+
+def test_stream_search_pdf(tmp_path):
+    generate_pdf_corpus(str(tmp_path), 3, seed=1, paragraphs=2)
+    extractor = PDFExtractor()
+    matcher = STREAMING_MATCHERS['AC'](['python', 'excel', 'a'])
+    for pdf_path in sorted(str(path) for path in tmp_path.rglob('*.pdf')):
+        matcher.reset()
+        raw_text = extractor.extract_raw_text_from_pdf(pdf_path)
+        assert extractor.stream_search_pdf(pdf_path, matcher) == KMP().search_multiple(raw_text, ['python', 'excel', 'a'])
+
+    broken = tmp_path / 'broken.pdf'
+    broken.write_bytes(b'not a pdf')
+    matcher.reset()
+    with pytest.raises(Exception):
+        extractor.stream_search_pdf(str(broken), matcher)